@@ -0,0 +1,131 @@
+"""
+Measure the memory used by parsed field objects.
+
+Fields are built from synthetic predictions, once with the slotted field classes,
+and once with subclasses having a per-instance ``__dict__``, as the classes did
+before they used ``__slots__``.
+
+Usage::
+
+    python benchmarks/field_memory.py [--count 100000]
+"""
+
+import argparse
+import gc
+import struct
+import tracemalloc
+from functools import partial
+from typing import Any, Callable, Dict, List, Tuple
+
+from mindee.documents.invoice.line_item import InvoiceLineItem
+from mindee.fields.amount import AmountField
+from mindee.fields.api_builder import ListFieldValue
+from mindee.fields.date import DateField
+from mindee.fields.payment_details import PaymentDetails
+from mindee.fields.tax import TaxField
+from mindee.fields.text import TextField
+
+POLYGON = [[0.1, 0.1], [0.3, 0.1], [0.3, 0.12], [0.1, 0.12]]
+
+PREDICTIONS: Dict[type, Dict[str, Any]] = {
+    AmountField: {"value": 1234.5, "confidence": 0.99, "polygon": POLYGON},
+    DateField: {"value": "2023-01-06", "confidence": 0.98, "polygon": POLYGON},
+    TextField: {"value": "ACME Inc.", "confidence": 0.97, "polygon": POLYGON},
+    TaxField: {
+        "value": 205.75,
+        "rate": 20.0,
+        "code": "VAT",
+        "confidence": 0.95,
+        "polygon": POLYGON,
+    },
+    PaymentDetails: {
+        "iban": "FR7630006000011234567890189",
+        "swift": "AGRIFRPP",
+        "confidence": 0.9,
+        "polygon": POLYGON,
+    },
+    ListFieldValue: {"content": "ACME", "confidence": 0.9, "polygon": POLYGON},
+    InvoiceLineItem: {
+        "page_id": 0,
+        "product_code": "A-42",
+        "description": "Widget",
+        "quantity": 3,
+        "unit_price": 411.5,
+        "total_amount": 1234.5,
+        "tax_rate": 20.0,
+        "tax_amount": 205.75,
+        "confidence": 0.9,
+        "polygon": POLYGON,
+    },
+}
+
+
+def with_dict(field_class: type) -> type:
+    """
+    Subclass storing the attributes in a per-instance ``__dict__``.
+
+    Class attributes hide the slots, with the defaults the classes had before.
+    The slots are still allocated: their size is removed from the results.
+    """
+    defaults = getattr(field_class, "_slot_defaults", {})
+    hidden = {
+        name: defaults.get(name)
+        for cls in field_class.__mro__
+        for name in getattr(cls, "__slots__", ())
+    }
+    return type(field_class.__name__, (field_class,), hidden)
+
+
+def slots_size(field_class: type) -> int:
+    """:return: the size of the slots of the instances, in bytes."""
+    return struct.calcsize("P") * sum(
+        len(getattr(cls, "__slots__", ())) for cls in field_class.__mro__
+    )
+
+
+def build_fields(
+    field_class: type, prediction: Dict[str, Any], count: int
+) -> List[Any]:
+    """:return: ``count`` fields built from the prediction."""
+    return [field_class(prediction) for _ in range(count)]
+
+
+def measure(build: Callable[[], List[Any]]) -> Tuple[int, List[Any]]:
+    """:return: the memory allocated while building the objects, in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, objects
+
+
+def main() -> None:
+    """Print the memory used per field, with and without slots."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--count", type=int, default=100_000, help="fields per class")
+    args = parser.parse_args()
+
+    print(f"{'Field':<16} {'dict (B/obj)':>13} {'slots (B/obj)':>14} {'saved':>7}")
+    totals = [0, 0]
+    for field_class, prediction in PREDICTIONS.items():
+        sizes = []
+        for cls in (with_dict(field_class), field_class):
+            size, objects = measure(partial(build_fields, cls, prediction, args.count))
+            del objects
+            sizes.append(size)
+        sizes[0] -= slots_size(field_class) * args.count
+        totals[0] += sizes[0]
+        totals[1] += sizes[1]
+        print(
+            f"{field_class.__name__:<16} {sizes[0] / args.count:>13.0f} "
+            f"{sizes[1] / args.count:>14.0f} {1 - sizes[1] / sizes[0]:>7.0%}"
+        )
+    print(
+        f"{'Total (MB)':<16} {totals[0] / 1e6:>13.1f} {totals[1] / 1e6:>14.1f} "
+        f"{1 - totals[1] / totals[0]:>7.0%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Compare the JSON backends on a large response.
+
+The response is synthetic, shaped like an invoice parsed with ``include_words``:
+most of its size is the OCR words, with their polygons.
+
+Usage::
+
+    python benchmarks/json_backends.py [--words 20000] [--repeat 10]
+"""
+
+import argparse
+import random
+import timeit
+from functools import partial
+from typing import Any, Dict, List
+
+from mindee import json_backend
+from mindee.documents.base import serialize_for_json
+from mindee.documents.invoice.invoice_v4 import InvoiceV4
+
+
+def make_polygon(left: float, top: float) -> List[List[float]]:
+    """:return: the polygon of a word, from its top left corner."""
+    right = left + 0.05
+    bottom = top + 0.01
+    return [[left, top], [right, top], [right, bottom], [left, bottom]]
+
+
+def make_field(value: Any) -> Dict[str, Any]:
+    """:return: the prediction of a field, at a random position."""
+    return {
+        "value": value,
+        "confidence": round(random.random(), 2),
+        "polygon": make_polygon(random.random(), random.random()),
+        "page_id": 0,
+    }
+
+
+def make_response(word_count: int) -> Dict[str, Any]:
+    """:return: an invoice response, with ``word_count`` OCR words."""
+    prediction = {
+        "customer_address": make_field("1 Main Street"),
+        "customer_company_registrations": [],
+        "customer_name": make_field("ACME Inc."),
+        "date": make_field("2023-01-06"),
+        "document_type": {"value": "INVOICE"},
+        "due_date": make_field("2023-02-06"),
+        "invoice_number": make_field("INV-42"),
+        "line_items": [
+            {
+                "confidence": 0.9,
+                "description": f"Item {item_n}",
+                "page_id": 0,
+                "polygon": make_polygon(0.1, 0.4 + item_n / 100),
+                "product_code": None,
+                "quantity": 1.0,
+                "tax_amount": None,
+                "tax_rate": 20.0,
+                "total_amount": 10.0,
+                "unit_price": 10.0,
+            }
+            for item_n in range(20)
+        ],
+        "locale": {"confidence": 0.9, "currency": "EUR", "language": "fr"},
+        "reference_numbers": [],
+        "supplier_address": make_field("2 Side Street"),
+        "supplier_company_registrations": [],
+        "supplier_name": make_field("Supplier"),
+        "supplier_payment_details": [],
+        "taxes": [dict(make_field(40.0), rate=20.0, code=None, basis=None)],
+        "total_amount": make_field(240.0),
+        "total_net": make_field(200.0),
+    }
+    words = [
+        {
+            "text": f"word{word_n}",
+            "confidence": round(random.random(), 2),
+            "polygon": make_polygon(random.random(), random.random()),
+        }
+        for word_n in range(word_count)
+    ]
+    page = {
+        "id": 0,
+        "orientation": {"value": 0},
+        "prediction": prediction,
+        "extras": {},
+        "ocr": {"mvision-v1": {"pages": [{"all_words": words}]}},
+    }
+    return {
+        "api_request": {"status": "success", "status_code": 201},
+        "document": {
+            "id": "00000000-0000-0000-0000-000000000000",
+            "name": "invoice.pdf",
+            "n_pages": 1,
+            "inference": {
+                "pages": [page],
+                "prediction": prediction,
+                "processing_time": 1.2,
+            },
+        },
+    }
+
+
+def main() -> None:
+    """Print the time taken by each operation, for each backend."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--words", type=int, default=20_000, help="OCR words")
+    parser.add_argument("--repeat", type=int, default=10, help="runs per operation")
+    args = parser.parse_args()
+
+    random.seed(0)
+    response = make_response(args.words)
+    document = InvoiceV4(response["document"]["inference"], input_source=None)
+    encoded = json_backend.get_backend().dumps(response).encode()
+    print(f"Response size: {len(encoded) / 1e6:.1f} MB")
+
+    operations = {
+        "decode response": lambda backend: backend.loads(encoded),
+        "encode raw": lambda backend: backend.dumps(response, pretty=True),
+        "encode parsed": lambda backend: backend.dumps(
+            document, pretty=True, default=serialize_for_json
+        ),
+    }
+    names = ["json"] if json_backend.orjson is None else ["json", "orjson"]
+    backends = [json_backend.BACKENDS[name]() for name in names]
+
+    print(f"{'Operation':<16}" + "".join(f"{name + ' (ms)':>14}" for name in names))
+    for operation, run in operations.items():
+        timings = [
+            min(timeit.repeat(partial(run, backend), number=1, repeat=args.repeat))
+            for backend in backends
+        ]
+        print(
+            f"{operation:<16}"
+            + "".join(f"{timing * 1000:>14.1f}" for timing in timings)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,2 @@
-from mindee.client import Client, PageOptions
+from mindee.client import Client, ImageOptions, PageOptions, PdfOptions
 from mindee.response import PredictResponse
@@ -0,0 +1,389 @@
+"""Asynchronous Mindee API client, using ``aiohttp`` as the HTTP transport."""
+
+import asyncio
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+
+try:
+    import aiohttp
+except ImportError as import_error:  # pragma: no cover
+    raise ImportError(
+        "The asynchronous client requires the 'aiohttp' package, "
+        "install it using: pip install mindee[async]"
+    ) from import_error
+
+from mindee import json_backend
+from mindee.cache.base import ResponseCache
+from mindee.client import BaseClient, BaseDocumentClient
+from mindee.documents.base import TypeDocument
+from mindee.documents.config import DocumentConfig, DocumentConfigDict
+from mindee.endpoints import Endpoint
+from mindee.input.image_options import ImageOptions
+from mindee.input.page_cache import PageCache
+from mindee.input.page_options import PageOptions
+from mindee.input.pdf_options import PdfOptions
+from mindee.input.readers import TypeBuffer
+from mindee.input.sources import (
+    Base64Input,
+    BytesInput,
+    FileInput,
+    InputSource,
+    PathInput,
+)
+from mindee.logger import logger
+from mindee.multipart import MultipartStream
+from mindee.response import PredictResponse
+from mindee.retry import RetryPolicy
+
+MAX_CONNECTIONS_DEFAULT = 100
+
+
+def _is_connect_timeout(error: aiohttp.ServerTimeoutError) -> bool:
+    """Whether the timeout happened while connecting, before anything was sent."""
+    connect_timeout_error = getattr(aiohttp, "ConnectionTimeoutError", None)
+    if connect_timeout_error is not None:
+        return isinstance(error, connect_timeout_error)
+    # Before aiohttp 3.10, both timeouts have the same type.
+    return str(error).startswith("Connection timeout")
+
+
+def _make_body(
+    endpoint: Endpoint, input_source: InputSource, include_words: bool
+) -> Tuple[Any, Dict[str, str]]:
+    """
+    Build the body of a prediction request, it is read again on each attempt.
+
+    :return: the body and the headers to send it with
+    """
+    headers = endpoint.base_headers
+    if endpoint.stream_upload or input_source.is_memory_mapped():
+        stream = MultipartStream.from_input_source(
+            input_source, {"include_mvision": "true"} if include_words else None
+        )
+        headers["Content-Type"] = stream.content_type
+        headers["Content-Length"] = str(len(stream))
+        return stream, headers
+    filename, data = input_source.read_contents(close_file=False)
+    form = aiohttp.FormData()
+    form.add_field("document", data, filename=filename)
+    if include_words:
+        form.add_field("include_mvision", "true")
+    return form, headers
+
+
+async def predict_req_post_async(
+    session: aiohttp.ClientSession,
+    endpoint: Endpoint,
+    input_source: InputSource,
+    include_words: bool = False,
+    close_file: bool = True,
+    cropper: bool = False,
+) -> Tuple[int, Dict[str, Any]]:
+    """
+    Make an asynchronous request to POST a document for prediction.
+
+    :param session: HTTP session to use
+    :param endpoint: Endpoint to send the document to
+    :param input_source: Input object
+    :param include_words: Include raw OCR words in the response
+    :param close_file: Whether to `close()` the file after parsing it.
+    :param cropper: Including Mindee cropping results.
+    :return: a Tuple with the HTTP status code and the response JSON
+    """
+    params = {}
+    if cropper:
+        params["cropper"] = "true"
+
+    retry_policy = endpoint.retry_policy
+    attempt = 0
+    try:
+        while True:
+            attempt += 1
+            body, headers = _make_body(endpoint, input_source, include_words)
+            if endpoint.rate_limiter is not None:
+                await endpoint.rate_limiter.acquire_async()
+            try:
+                async with session.post(
+                    f"{endpoint.url_root}/predict",
+                    data=body,
+                    headers=headers,
+                    params=params,
+                    timeout=aiohttp.ClientTimeout(
+                        total=endpoint._request_timeout  # pylint: disable=protected-access
+                    ),
+                ) as response:
+                    retry_after = response.headers.get("Retry-After")
+                    if not retry_policy or not retry_policy.should_retry(
+                        attempt, response.status, retry_after
+                    ):
+                        return response.status, await response.json(
+                            loads=json_backend.loads, content_type=None
+                        )
+                    delay = retry_policy.get_delay(attempt, retry_after)
+                    logger.warning("API HTTP error: %s", response.status)
+            except aiohttp.ClientConnectionError as exc:
+                if isinstance(
+                    exc, aiohttp.ServerTimeoutError
+                ) and not _is_connect_timeout(exc):
+                    raise
+                if not retry_policy or not retry_policy.should_retry(attempt):
+                    raise
+                delay = retry_policy.get_delay(attempt)
+                logger.warning("Connection error: %s", exc)
+            logger.warning(
+                "Retrying POST request in %.2f seconds (attempt %s of %s)",
+                delay,
+                attempt + 1,
+                retry_policy.max_attempts,
+            )
+            await asyncio.sleep(delay)
+    finally:
+        if close_file:
+            input_source.file_object.close()
+
+
+class AsyncDocumentClient(BaseDocumentClient):
+    client: "AsyncClient"
+
+    def __init__(
+        self,
+        input_doc: InputSource,
+        doc_configs: DocumentConfigDict,
+        raise_on_error: bool,
+        client: "AsyncClient",
+        cache: Optional[ResponseCache] = None,
+        page_cache: Optional[PageCache] = None,
+    ):
+        super().__init__(
+            input_doc=input_doc,
+            doc_configs=doc_configs,
+            raise_on_error=raise_on_error,
+            cache=cache,
+            page_cache=page_cache,
+        )
+        self.client = client
+
+    async def parse(
+        self,
+        document_class: TypeDocument,
+        endpoint_name: Optional[str] = None,
+        account_name: Optional[str] = None,
+        include_words: bool = False,
+        close_file: bool = True,
+        page_options: Optional[PageOptions] = None,
+        cropper: bool = False,
+        image_options: Optional[ImageOptions] = None,
+        pdf_options: Optional[PdfOptions] = None,
+    ) -> PredictResponse[TypeDocument]:
+        """
+        Call prediction API on the document and parse the results, asynchronously.
+
+        Parameters are the same as for ``DocumentClient.parse``.
+        Reading and processing the file, and using the cache, are done in the default
+        executor of the event loop, so that other requests are not blocked.
+        """
+        loop = asyncio.get_running_loop()
+        doc_config = self._get_doc_config(document_class, endpoint_name, account_name)
+        cache_key = await loop.run_in_executor(
+            None,
+            self._get_cache_key,
+            doc_config,
+            include_words,
+            cropper,
+            page_options,
+            image_options,
+            pdf_options,
+        )
+        cached_response = await loop.run_in_executor(
+            None,
+            self._get_cached_response,
+            doc_config,
+            cache_key,
+            close_file,
+            page_options,
+        )
+        if cached_response is not None:
+            return cached_response
+        await loop.run_in_executor(
+            None, self._process_input, page_options, image_options, pdf_options
+        )
+        return await self._make_request(
+            doc_config, include_words, close_file, cropper, cache_key
+        )
+
+    async def _make_request(
+        self,
+        doc_config: DocumentConfig,
+        include_words: bool,
+        close_file: bool,
+        cropper: bool,
+        cache_key: Optional[str] = None,
+    ) -> PredictResponse[TypeDocument]:
+        endpoint = doc_config.document_class.get_endpoint(
+            doc_config.endpoints, self.input_doc
+        )
+        status_code, dict_response = await predict_req_post_async(
+            self.client.session,
+            endpoint,
+            self.input_doc,
+            include_words=include_words,
+            close_file=close_file,
+            cropper=cropper,
+        )
+        # Storing the response in the cache may write to a file.
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            self._build_response,
+            doc_config,
+            dict_response,
+            status_code,
+            status_code < 400,
+            cache_key,
+        )
+
+
+class AsyncClient(BaseClient):
+    """
+    Mindee API Client, for use with ``asyncio``.
+
+    See: https://developers.mindee.com/docs/
+    """
+
+    _session: Optional[aiohttp.ClientSession] = None
+    _connector_options: Dict[str, Any]
+
+    def __init__(
+        self,
+        api_key: str = "",
+        raise_on_error: bool = True,
+        max_connections: int = MAX_CONNECTIONS_DEFAULT,
+        max_connections_per_host: int = 0,
+        keep_alive: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limit: Optional[float] = None,
+        rate_burst: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        stream_upload: bool = False,
+        page_cache: Optional[PageCache] = None,
+    ):
+        """
+        Mindee API Client, for use with ``asyncio``.
+
+        The client holds a pool of HTTP connections which are reused across requests.
+        Call ``close()`` when done, or use the client as an async context manager.
+
+        :param api_key: Your API key for all endpoints
+        :param raise_on_error: Raise an Exception on HTTP errors
+        :param max_connections: Maximum number of simultaneous connections
+        :param max_connections_per_host: Maximum number of simultaneous connections
+            to a single host, ``0`` means no limit
+        :param keep_alive: Whether to keep connections open between requests
+        :param retry_policy: How to retry failed requests on all endpoints,
+            if not set requests are only attempted once
+        :param rate_limit: Maximum number of requests per second, shared by all
+            clients using the same API key. If not set, there is no limit.
+        :param rate_burst: Maximum number of requests which can be made at once,
+            defaults to the rate limit
+        :param cache: If set, responses are stored in this cache, and identical
+            documents are not sent to the API again
+        :param stream_upload: Whether to read documents from their file while uploading
+            them, instead of loading them in memory first
+        :param page_cache: If set, PDFs cut using ``PageOptions`` are stored in this
+            cache, so that the same pages of a file parsed with several products
+            are only cut once
+        """
+        self._connector_options = {
+            "limit": max_connections,
+            "limit_per_host": max_connections_per_host,
+            "force_close": not keep_alive,
+        }
+        super().__init__(
+            api_key=api_key,
+            raise_on_error=raise_on_error,
+            retry_policy=retry_policy,
+            rate_limit=rate_limit,
+            rate_burst=rate_burst,
+            cache=cache,
+            stream_upload=stream_upload,
+            page_cache=page_cache,
+        )
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """HTTP session shared by all requests, created on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**self._connector_options)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close all pooled HTTP connections."""
+        if self._session is not None:
+            await self._session.close()
+
+    def _get_document_client(self, input_doc: InputSource) -> AsyncDocumentClient:
+        return AsyncDocumentClient(
+            input_doc=input_doc,
+            doc_configs=self._doc_configs,
+            raise_on_error=self.raise_on_error,
+            client=self,
+            cache=self.cache,
+            page_cache=self.page_cache,
+        )
+
+    def doc_from_path(
+        self,
+        input_path: str,
+        mmap: bool = False,
+    ) -> AsyncDocumentClient:
+        """
+        Load a document from an absolute path, as a string.
+
+        :param input_path: Path of file to open
+        :param mmap: Map the file in memory instead of reading it, recommended
+            for large files. The file is then always uploaded in a streaming way.
+        """
+        return self._get_document_client(PathInput(input_path, mmap=mmap))
+
+    def doc_from_file(
+        self,
+        input_file: BinaryIO,
+    ) -> AsyncDocumentClient:
+        """
+        Load a document from a normal Python file object/handle.
+
+        :param input_file: Input file handle
+        """
+        return self._get_document_client(FileInput(input_file))
+
+    def doc_from_b64string(
+        self,
+        input_string: str,
+        filename: str,
+    ) -> AsyncDocumentClient:
+        """
+        Load a document from a base64 encoded string.
+
+        :param input_string: Input to parse as base64 string
+        :param filename: The name of the file (without the path)
+        """
+        return self._get_document_client(Base64Input(input_string, filename))
+
+    def doc_from_bytes(
+        self,
+        input_bytes: TypeBuffer,
+        filename: str,
+    ) -> AsyncDocumentClient:
+        """
+        Load a document from raw bytes.
+
+        :param input_bytes: Raw byte input, it is not copied
+        :param filename: The name of the file (without the path)
+        """
+        return self._get_document_client(BytesInput(input_bytes, filename))
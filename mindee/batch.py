@@ -0,0 +1,151 @@
+"""Helpers for parsing many documents concurrently."""
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from mindee.input.sources import BytesInput, FileInput, InputSource, PathInput
+
+BatchInput = Union[str, BinaryIO, Tuple[str, bytes], InputSource]
+"""
+An item to parse in a batch, one of:
+
+* a path, as a string
+* a binary file object
+* a ``(filename, bytes)`` Tuple
+* an ``InputSource`` instance
+
+Paths are only opened when the item is parsed, iterate over a
+``mindee.input.directory.DirectoryInput`` to parse all documents in a directory.
+"""
+
+
+class BatchParseError:
+    """Error which occurred while parsing an item of a batch."""
+
+    input_item: BatchInput
+    """The item as it was given to the batch."""
+    filename: Optional[str]
+    """Name of the input file, if it could be determined."""
+    exception: Exception
+    """The exception which was raised."""
+
+    def __init__(
+        self,
+        input_item: BatchInput,
+        exception: Exception,
+        filename: Optional[str] = None,
+    ):
+        self.input_item = input_item
+        self.exception = exception
+        self.filename = filename
+
+    def __str__(self) -> str:
+        return f"{self.filename or self.input_item}: {self.exception!r}"
+
+
+def iter_completed(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int,
+) -> Iterator[Any]:
+    """
+    Apply a function to all items on a pool of threads.
+
+    Items are consumed lazily: at most ``2 * max_workers`` of them are pending at a time.
+
+    :param func: Function to call on each item, it must not raise
+    :param items: Items to process
+    :param max_workers: Number of threads to use
+    :return: the results, in completion order
+    """
+    max_pending = 2 * max_workers
+    items_iter = iter(items)
+    pending: Set[Future] = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for item in items_iter:
+                pending.add(executor.submit(func, item))
+                if len(pending) < max_pending:
+                    continue
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            # The caller stopped iterating early, don't start any new work.
+            for future in pending:
+                future.cancel()
+
+
+def to_input_source(input_item: BatchInput) -> InputSource:
+    """
+    Load a batch item as an input source.
+
+    :param input_item: Item to load
+    """
+    if isinstance(input_item, InputSource):
+        return input_item
+    if isinstance(input_item, str):
+        return PathInput(input_item)
+    if isinstance(input_item, tuple):
+        filename, raw_bytes = input_item
+        return BytesInput(raw_bytes, filename)
+    return FileInput(input_item)
+
+
+class InFlightRequests:
+    """
+    Requests in progress, by request key.
+
+    Lets identical documents parsed at the same time share a single request.
+    Safe to share between threads.
+    """
+
+    duplicates: int = 0
+    """Number of requests which were shared instead of being made."""
+
+    def __init__(self) -> None:
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def claim(self, key: str) -> Tuple[bool, Future]:
+        """
+        Register a request, unless an identical one is already in progress.
+
+        :param key: Request key, see ``mindee.cache.make_cache_key``
+        :return: a Tuple with whether the caller must make the request,
+            and the future holding the request's result.
+            The caller making the request must set the result, then call ``release``.
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                self.duplicates += 1
+                return False, future
+            future = Future()
+            self._futures[key] = future
+            return True, future
+
+    def release(self, key: str) -> None:
+        """
+        Unregister a finished request.
+
+        :param key: Request key
+        """
+        with self._lock:
+            del self._futures[key]
@@ -0,0 +1,3 @@
+from mindee.cache.base import ResponseCache, make_cache_key
+from mindee.cache.disk import DiskCache
+from mindee.cache.memory import MemoryCache
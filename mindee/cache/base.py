@@ -0,0 +1,73 @@
+import hashlib
+from typing import Any, Dict, Optional
+
+from mindee.input.image_options import ImageOptions
+from mindee.input.page_options import PageOptions
+from mindee.input.pdf_options import PdfOptions
+
+TypeCachedResponse = Dict[str, Any]
+
+
+def make_cache_key(
+    content_hash: str,
+    url_root: str,
+    include_words: bool = False,
+    cropper: bool = False,
+    page_options: Optional[PageOptions] = None,
+    image_options: Optional[ImageOptions] = None,
+    pdf_options: Optional[PdfOptions] = None,
+) -> str:
+    """
+    Compute the cache key of a prediction.
+
+    :param content_hash: Hash of the input file contents, before any processing
+    :param url_root: Root URL of the endpoint
+    :param include_words: Whether the full text was requested
+    :param cropper: Whether cropper results were requested
+    :param page_options: Page cutting options applied to the input
+    :param image_options: Image processing options applied to the input
+    :param pdf_options: PDF optimization options applied to the input
+    :return: the key, as a hexadecimal string
+    """
+    if page_options:
+        pages = "%s:%s:%s" % (
+            page_options.operation,
+            page_options.on_min_pages,
+            ",".join(str(page_n) for page_n in page_options.page_indexes),
+        )
+    else:
+        pages = ""
+    fields = [content_hash, url_root, str(include_words), str(cropper), pages]
+    if image_options:
+        # Only added when set, so that existing keys stay valid.
+        fields.append("%s:%s" % (image_options.max_size, image_options.quality))
+    if pdf_options:
+        fields.append("pdf:%s:%s" % (pdf_options.max_dpi, pdf_options.quality))
+    key = "|".join(fields)
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class ResponseCache:
+    """Base class for caches of raw API responses."""
+
+    def get(self, key: str) -> Optional[TypeCachedResponse]:
+        """
+        Get a response from the cache.
+
+        :param key: Cache key, see ``make_cache_key``
+        :return: the response JSON, or ``None`` if not found
+        """
+        raise NotImplementedError()
+
+    def set(self, key: str, response: TypeCachedResponse) -> None:
+        """
+        Store a response in the cache.
+
+        :param key: Cache key, see ``make_cache_key``
+        :param response: The response JSON
+        """
+        raise NotImplementedError()
+
+    def clear(self) -> None:
+        """Remove all responses from the cache."""
+        raise NotImplementedError()
@@ -0,0 +1,130 @@
+import json
+import sqlite3
+import time
+from typing import Optional
+
+from mindee.cache.base import ResponseCache, TypeCachedResponse
+from mindee.logger import logger
+
+SQLITE_TIMEOUT = 30.0
+
+
+class DiskCache(ResponseCache):
+    """
+    Persistent cache of API responses, stored in an SQLite database.
+
+    Safe to share between several threads and processes.
+    """
+
+    path: str
+    """Path of the database file."""
+    max_size: Optional[int]
+    """Maximum total size of the stored responses, in bytes."""
+    ttl: Optional[float]
+    """Time after which a response expires, in seconds."""
+
+    def __init__(
+        self, path: str, max_size: Optional[int] = None, ttl: Optional[float] = None
+    ):
+        """
+        Persistent cache of API responses, stored in an SQLite database.
+
+        When the maximum size is exceeded, the least recently used responses are removed.
+
+        :param path: Path of the database file, it is created if needed
+        :param max_size: Maximum total size of the stored responses, in bytes.
+            If not set, the size is not limited.
+        :param ttl: Time after which a response expires, in seconds.
+            If not set, responses never expire.
+        """
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # A new connection for each operation keeps the cache usable from any thread.
+        return sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT)
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl is not None and created_at + self.ttl < now
+
+    def get(self, key: str) -> Optional[TypeCachedResponse]:
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute(
+                    "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if self._is_expired(row[1], now):
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    return None
+                conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+        finally:
+            conn.close()
+        logger.debug("Response found in disk cache: %s", key)
+        return json.loads(row[0])
+
+    def set(self, key: str, response: TypeCachedResponse) -> None:
+        value = json.dumps(response).encode()
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, value, size, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, value, len(value), now, now),
+                )
+                if self.ttl is not None:
+                    conn.execute(
+                        "DELETE FROM responses WHERE created_at < ?", (now - self.ttl,)
+                    )
+                if self.max_size is not None:
+                    self._evict(conn, self.max_size)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _evict(conn: sqlite3.Connection, max_size: int) -> None:
+        total_size = conn.execute("SELECT TOTAL(size) FROM responses").fetchone()[0]
+        if total_size <= max_size:
+            return
+        to_delete = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ):
+            if total_size <= max_size:
+                break
+            to_delete.append((key,))
+            total_size -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", to_delete)
+        logger.debug("Evicted %s responses from disk cache", len(to_delete))
+
+    def clear(self) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM responses")
+        finally:
+            conn.close()
@@ -0,0 +1,84 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from mindee.cache.base import ResponseCache, TypeCachedResponse
+from mindee.logger import logger
+
+
+class MemoryCache(ResponseCache):
+    """
+    In-process LRU cache of API responses.
+
+    Responses are stored serialized, so that each hit returns a new object.
+    Safe to share between threads.
+    """
+
+    max_size: int
+    """Maximum total size of the stored responses, in bytes."""
+    ttl: Optional[float]
+    """Time after which a response expires, in seconds."""
+    hits: int = 0
+    """Number of responses found in the cache."""
+    misses: int = 0
+    """Number of responses not found in the cache, or expired."""
+    size: int = 0
+    """Current total size of the stored responses, in bytes."""
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None):
+        """
+        In-process LRU cache of API responses.
+
+        When the maximum size is exceeded, the least recently used responses are removed.
+
+        :param max_size: Maximum total size of the stored responses, in bytes
+        :param ttl: Time after which a response expires, in seconds.
+            If not set, responses never expire.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[TypeCachedResponse]:
+        with self._lock:
+            try:
+                value, created_at = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            if self.ttl is not None and created_at + self.ttl < time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        logger.debug("Response found in memory cache: %s", key)
+        return json.loads(value)
+
+    def set(self, key: str, response: TypeCachedResponse) -> None:
+        value = json.dumps(response).encode()
+        if len(value) > self.max_size:
+            logger.debug("Response too large for memory cache: %s", key)
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.monotonic())
+            self.size += len(value)
+            while self.size > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self.size -= len(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
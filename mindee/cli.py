@@ -1,12 +1,14 @@
 import argparse
-import json
+import sys
 from argparse import Namespace
 from dataclasses import dataclass
-from typing import Dict, Generic, TypeVar
+from typing import Any, Dict, Generic, TypeVar
 
-from mindee import Client, PageOptions, documents
+from mindee import Client, PageOptions, documents, json_backend
+from mindee.batch import BatchParseError
 from mindee.client import DocumentClient
 from mindee.documents.base import Document, serialize_for_json
+from mindee.ndjson import OUTPUT_PARSED, OUTPUT_RAW, NdjsonWriter
 
 TypeDoc = TypeVar("TypeDoc", bound=Document)
 
@@ -45,17 +47,36 @@ class CommandConfig(Generic[TypeDoc]):
 }
 
 
-def _get_input_doc(client, args) -> DocumentClient:
+def _get_input_doc(client, args, path: str) -> DocumentClient:
     if args.input_type == "file":
-        with open(args.path, "rb", buffering=30) as file_handle:
+        with open(path, "rb", buffering=30) as file_handle:
             return client.doc_from_file(file_handle)
     elif args.input_type == "base64":
-        with open(args.path, "rt", encoding="ascii") as base64_handle:
+        with open(path, "rt", encoding="ascii") as base64_handle:
             return client.doc_from_b64string(base64_handle.read(), "test.jpg")
     elif args.input_type == "bytes":
-        with open(args.path, "rb") as bytes_handle:
+        with open(path, "rb") as bytes_handle:
             return client.doc_from_bytes(bytes_handle.read(), bytes_handle.name)
-    return client.doc_from_path(args.path)
+    return client.doc_from_path(path)
+
+
+def _write_ndjson(client, args, doc_class, parse_args: Dict[str, Any]) -> None:
+    """Parse all the paths concurrently, and write each result as it comes."""
+    output_type = OUTPUT_RAW if args.output_type == "raw" else OUTPUT_PARSED
+    max_bytes = args.rotate_size * 1024 * 1024 if args.rotate_size else None
+    with NdjsonWriter(
+        args.output_file,
+        output_type=output_type,
+        compress=args.output_file.endswith(".gz"),
+        max_bytes=max_bytes,
+    ) as writer:
+        for result in client.parse_many(args.path, doc_class, **parse_args):
+            if isinstance(result, BatchParseError):
+                if args.raise_on_error:
+                    raise result.exception
+                print(f"Error: {result}", file=sys.stderr)
+                continue
+            writer.write(result)
 
 
 def call_endpoint(args: Namespace):
@@ -70,31 +91,31 @@ def call_endpoint(args: Namespace):
     info = DOCUMENTS[args.product_name]
     doc_class = info.doc_class
 
-    input_doc = _get_input_doc(client, args)
-
     if args.cut_doc and args.doc_pages:
         page_options = PageOptions(range(args.doc_pages), on_min_pages=0)
     else:
         page_options = None
+    parse_args: Dict[str, Any] = {"page_options": page_options}
     if args.product_name == "custom":
-        parsed_data = input_doc.parse(
-            doc_class,
-            endpoint_name=args.api_name,
-            account_name=args.username,
-            page_options=page_options,
-        )
+        parse_args.update(endpoint_name=args.api_name, account_name=args.username)
     else:
-        parsed_data = input_doc.parse(
-            doc_class, include_words=args.include_words, page_options=page_options
-        )
+        parse_args.update(include_words=args.include_words)
 
-    if args.output_type == "raw":
-        print(json.dumps(parsed_data.http_response, indent=2))
-    elif args.output_type == "parsed":
-        doc = parsed_data.document
-        print(json.dumps(doc, indent=2, default=serialize_for_json))
-    else:
-        print(parsed_data.document)
+    if args.output_file:
+        _write_ndjson(client, args, doc_class, parse_args)
+        return
+
+    for path in args.path:
+        input_doc = _get_input_doc(client, args, path)
+        parsed_data = input_doc.parse(doc_class, **parse_args)
+
+        if args.output_type == "raw":
+            print(json_backend.dumps(parsed_data.http_response, pretty=True))
+        elif args.output_type == "parsed":
+            doc = parsed_data.document
+            print(json_backend.dumps(doc, pretty=True, default=serialize_for_json))
+        else:
+            print(parsed_data.document)
 
 
 def _parse_args() -> Namespace:
@@ -187,9 +208,28 @@ def _parse_args() -> Namespace:
             default=5,
             help="Number of document pages to keep, default: 5",
         )
-        subp.add_argument(dest="path", help="Full path to the file")
+        subp.add_argument(
+            "-O",
+            "--output-file",
+            dest="output_file",
+            help="Write the parsed data, or raw data with -o raw,\n"
+            "to a newline-delimited JSON file,\n"
+            "one line per document, as soon as it is parsed.\n"
+            "Documents are parsed concurrently, and only paths are supported.\n"
+            "Compressed with gzip if the file name ends with .gz",
+        )
+        subp.add_argument(
+            "--rotate-size",
+            dest="rotate_size",
+            type=int,
+            help="Start a new output file every N megabytes,\n"
+            "files are numbered, e.g. results-00000.ndjson",
+        )
+        subp.add_argument(dest="path", nargs="+", help="Full path to the file(s)")
 
     parsed_args = parser.parse_args()
+    if parsed_args.output_file and parsed_args.input_type != "path":
+        parser.error("--output-file only supports the 'path' input type")
     return parsed_args
 
 
@@ -1,6 +1,31 @@
-import json
-from typing import BinaryIO, Dict, Optional, Type
+import copy
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import requests
 
+from mindee import json_backend
+from mindee.batch import (
+    BatchInput,
+    BatchParseError,
+    InFlightRequests,
+    iter_completed,
+    to_input_source,
+)
+from mindee.cache.base import ResponseCache, make_cache_key
 from mindee.documents import (
     CropperV1,
     CustomV1,
@@ -14,8 +39,21 @@
 from mindee.documents.base import Document, TypeDocument
 from mindee.documents.config import DocumentConfig, DocumentConfigDict
 from mindee.documents.us import BankCheckV1
-from mindee.endpoints import OTS_OWNER, CustomEndpoint, HTTPException, StandardEndpoint
+from mindee.endpoints import (
+    API_KEY_ENV_NAME,
+    OTS_OWNER,
+    POOL_CONNECTIONS_DEFAULT,
+    POOL_MAXSIZE_DEFAULT,
+    CustomEndpoint,
+    HTTPException,
+    StandardEndpoint,
+    create_session,
+)
+from mindee.input.image_options import ImageOptions
+from mindee.input.page_cache import PageCache
 from mindee.input.page_options import PageOptions
+from mindee.input.pdf_options import PdfOptions
+from mindee.input.readers import TypeBuffer
 from mindee.input.sources import (
     Base64Input,
     BytesInput,
@@ -24,7 +62,12 @@
     PathInput,
 )
 from mindee.logger import logger
+from mindee.merge import merge_predictions
+from mindee.rate_limit import RateLimiter, get_rate_limiter
 from mindee.response import PredictResponse
+from mindee.retry import RetryPolicy
+
+BATCH_MAX_WORKERS_DEFAULT = 4
 
 
 def get_bound_classname(type_var) -> str:
@@ -32,57 +75,33 @@ def get_bound_classname(type_var) -> str:
     return type_var.__bound__.__name__
 
 
-class DocumentClient:
+class BaseDocumentClient:
     input_doc: InputSource
     doc_configs: DocumentConfigDict
     raise_on_error: bool = True
+    cache: Optional[ResponseCache] = None
+    page_cache: Optional[PageCache] = None
 
     def __init__(
         self,
         input_doc: InputSource,
         doc_configs: DocumentConfigDict,
         raise_on_error: bool,
+        cache: Optional[ResponseCache] = None,
+        page_cache: Optional[PageCache] = None,
     ):
         self.raise_on_error = raise_on_error
         self.doc_configs = doc_configs
         self.input_doc = input_doc
+        self.cache = cache
+        self.page_cache = page_cache
 
-    def parse(
+    def _get_doc_config(
         self,
         document_class: TypeDocument,
-        endpoint_name: Optional[str] = None,
-        account_name: Optional[str] = None,
-        include_words: bool = False,
-        close_file: bool = True,
-        page_options: Optional[PageOptions] = None,
-        cropper: bool = False,
-    ) -> PredictResponse[TypeDocument]:
-        """
-        Call prediction API on the document and parse the results.
-
-        :param document_class: The document class to use.
-            The response object will be instantiated based on this parameter.
-
-        :param endpoint_name: For custom endpoints, the "API name" field in the "Settings" page of the API Builder.
-            Do not set for standard (off the shelf) endpoints.
-
-        :param account_name: For custom endpoints, your account or organization username on the API Builder.
-            This is normally not required unless you have a custom endpoint which has the
-            same name as standard (off the shelf) endpoint.
-            Do not set for standard (off the shelf) endpoints.
-
-        :param include_words: Whether to include the full text for each page.
-            This performs a full OCR operation on the server and will increase response time.
-
-        :param close_file: Whether to ``close()`` the file after parsing it.
-          Set to ``False`` if you need to access the file after this operation.
-
-        :param page_options: If set, remove pages from the document as specified.
-            This is done before sending the file to the server and is useful to avoid page limitations.
-
-        :param cropper: Whether to include cropper results for each page.
-            This performs a cropping operation on the server and will increase response time.
-        """
+        endpoint_name: Optional[str],
+        account_name: Optional[str],
+    ) -> DocumentConfig:
         bound_classname = get_bound_classname(document_class)
         if bound_classname != CustomV1.__name__:
             endpoint_name = get_bound_classname(document_class)
@@ -118,47 +137,119 @@ def parse(
 
         doc_config = self.doc_configs[config_key]
         doc_config.check_api_keys()
+        if get_bound_classname(document_class) != doc_config.document_class.__name__:
+            raise RuntimeError("Document class mismatch!")
+        return doc_config
+
+    def _process_input(
+        self,
+        page_options: Optional[PageOptions],
+        image_options: Optional[ImageOptions] = None,
+        pdf_options: Optional[PdfOptions] = None,
+    ) -> None:
         if page_options and self.input_doc.is_pdf():
             self.input_doc.process_pdf(
                 page_options.operation,
                 page_options.on_min_pages,
                 page_options.page_indexes,
+                page_cache=self.page_cache,
             )
-        return self._make_request(
-            document_class, doc_config, include_words, close_file, cropper
-        )
+        elif page_options and self.input_doc.metadata.mimetype == "image/tiff":
+            self.input_doc.process_tiff(
+                page_options.operation,
+                page_options.on_min_pages,
+                page_options.page_indexes,
+            )
+        if image_options:
+            self.input_doc.process_image(image_options.max_size, image_options.quality)
+        if pdf_options and self.input_doc.is_pdf():
+            self.input_doc.optimize_pdf(pdf_options.max_dpi, pdf_options.quality)
 
-    def _make_request(
+    def _get_cache_key(
         self,
-        document_class: TypeDocument,
         doc_config: DocumentConfig,
         include_words: bool,
-        close_file: bool,
         cropper: bool,
-    ) -> PredictResponse[TypeDocument]:
-        if get_bound_classname(document_class) != doc_config.document_class.__name__:
-            raise RuntimeError("Document class mismatch!")
+        page_options: Optional[PageOptions],
+        image_options: Optional[ImageOptions] = None,
+        pdf_options: Optional[PdfOptions] = None,
+    ) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return self._get_request_key(
+            doc_config, include_words, cropper, page_options, image_options, pdf_options
+        )
 
-        response = doc_config.document_class.request(
-            doc_config.endpoints,
-            self.input_doc,
+    def _get_request_key(
+        self,
+        doc_config: DocumentConfig,
+        include_words: bool,
+        cropper: bool,
+        page_options: Optional[PageOptions],
+        image_options: Optional[ImageOptions] = None,
+        pdf_options: Optional[PdfOptions] = None,
+    ) -> str:
+        endpoint = doc_config.document_class.get_endpoint(
+            doc_config.endpoints, self.input_doc
+        )
+        return make_cache_key(
+            self.input_doc.content_hash(),
+            endpoint.url_root,
             include_words=include_words,
-            close_file=close_file,
             cropper=cropper,
+            page_options=page_options,
+            image_options=image_options,
+            pdf_options=pdf_options,
         )
 
-        dict_response = response.json()
+    def _get_cached_response(
+        self,
+        doc_config: DocumentConfig,
+        cache_key: Optional[str],
+        close_file: bool,
+        page_options: Optional[PageOptions] = None,
+    ) -> Optional[PredictResponse]:
+        if self.cache is None or cache_key is None:
+            return None
+        dict_response = self.cache.get(cache_key)
+        if dict_response is None:
+            return None
+        if page_options:
+            # The file is not processed, only find which pages would have been sent.
+            self.input_doc.page_map = self.input_doc.find_pages(
+                page_options.operation,
+                page_options.on_min_pages,
+                page_options.page_indexes,
+            )
+        if close_file:
+            self.input_doc.file_object.close()
+        return PredictResponse(
+            http_response=dict_response,
+            doc_config=doc_config,
+            input_source=self.input_doc,
+            response_ok=True,
+        )
 
-        if not response.ok and self.raise_on_error:
+    def _build_response(
+        self,
+        doc_config: DocumentConfig,
+        dict_response: dict,
+        status_code: int,
+        response_ok: bool,
+        cache_key: Optional[str] = None,
+    ) -> PredictResponse:
+        if not response_ok and self.raise_on_error:
             raise HTTPException(
                 "API %s HTTP error: %s"
-                % (response.status_code, json.dumps(dict_response))
+                % (status_code, json_backend.dumps(dict_response))
             )
-        return PredictResponse[TypeDocument](
+        if response_ok and self.cache is not None and cache_key is not None:
+            self.cache.set(cache_key, dict_response)
+        return PredictResponse(
             http_response=dict_response,
             doc_config=doc_config,
             input_source=self.input_doc,
-            response_ok=response.ok,
+            response_ok=response_ok,
         )
 
     def close(self) -> None:
@@ -166,29 +257,326 @@ def close(self) -> None:
         self.input_doc.file_object.close()
 
 
-class Client:
-    """
-    Mindee API Client.
+class DocumentClient(BaseDocumentClient):
+    in_flight: Optional[InFlightRequests] = None
 
-    See: https://developers.mindee.com/docs/
-    """
+    def __init__(
+        self,
+        input_doc: InputSource,
+        doc_configs: DocumentConfigDict,
+        raise_on_error: bool,
+        cache: Optional[ResponseCache] = None,
+        in_flight: Optional[InFlightRequests] = None,
+        page_cache: Optional[PageCache] = None,
+    ):
+        super().__init__(
+            input_doc=input_doc,
+            doc_configs=doc_configs,
+            raise_on_error=raise_on_error,
+            cache=cache,
+            page_cache=page_cache,
+        )
+        self.in_flight = in_flight
+
+    def parse(
+        self,
+        document_class: TypeDocument,
+        endpoint_name: Optional[str] = None,
+        account_name: Optional[str] = None,
+        include_words: bool = False,
+        close_file: bool = True,
+        page_options: Optional[PageOptions] = None,
+        cropper: bool = False,
+        split_pages: Optional[int] = None,
+        max_workers: int = BATCH_MAX_WORKERS_DEFAULT,
+        image_options: Optional[ImageOptions] = None,
+        pdf_options: Optional[PdfOptions] = None,
+    ) -> PredictResponse[TypeDocument]:
+        """
+        Call prediction API on the document and parse the results.
+
+        :param document_class: The document class to use.
+            The response object will be instantiated based on this parameter.
+
+        :param endpoint_name: For custom endpoints, the "API name" field in the "Settings" page of the API Builder.
+            Do not set for standard (off the shelf) endpoints.
+
+        :param account_name: For custom endpoints, your account or organization username on the API Builder.
+            This is normally not required unless you have a custom endpoint which has the
+            same name as standard (off the shelf) endpoint.
+            Do not set for standard (off the shelf) endpoints.
+
+        :param include_words: Whether to include the full text for each page.
+            This performs a full OCR operation on the server and will increase response time.
+
+        :param close_file: Whether to ``close()`` the file after parsing it.
+          Set to ``False`` if you need to access the file after this operation.
+
+        :param page_options: If set, remove pages from the document as specified.
+            Applies to PDFs and multi-page TIFF images.
+            This is done before sending the file to the server and is useful to avoid page limitations.
+
+        :param cropper: Whether to include cropper results for each page.
+            This performs a cropping operation on the server and will increase response time.
+
+        :param split_pages: If set, PDFs with more pages are split into documents of
+            this many pages, which are sent concurrently.
+            The results are merged: pages keep their original IDs, and document-level
+            fields are rebuilt from the predictions for each part.
+
+        :param max_workers: Maximum number of parts of a split PDF sent at once.
+
+        :param image_options: If set, scale down and compress images as specified.
+            This is done before sending the file to the server and reduces upload time.
+            The number of bytes saved is given by the response's ``input_bytes_saved``.
+
+        :param pdf_options: If set, reduce the size of PDFs as specified:
+            scale down embedded images, remove duplicate objects, compress streams.
+            This is done before sending the file to the server and reduces upload time.
+            The number of bytes saved is given by the response's ``input_bytes_saved``.
+        """
+        doc_config = self._get_doc_config(document_class, endpoint_name, account_name)
+        cache_key = self._get_cache_key(
+            doc_config, include_words, cropper, page_options, image_options, pdf_options
+        )
+
+        def parse_input() -> PredictResponse[TypeDocument]:
+            cached_response = self._get_cached_response(
+                doc_config, cache_key, close_file, page_options
+            )
+            if cached_response is not None:
+                return cached_response
+            self._process_input(page_options, image_options, pdf_options)
+            if (
+                split_pages
+                and self.input_doc.is_pdf()
+                and self.input_doc.count_doc_pages() > split_pages
+            ):
+                return self._make_split_request(
+                    doc_config,
+                    include_words,
+                    close_file,
+                    cropper,
+                    split_pages,
+                    max_workers,
+                    cache_key,
+                )
+            return self._make_request(
+                doc_config, include_words, close_file, cropper, cache_key
+            )
+
+        if self.in_flight is None or cache_key is None:
+            return parse_input()
+        return self._share_request(
+            self.in_flight, cache_key, doc_config, close_file, parse_input
+        )
+
+    def _get_cache_key(
+        self,
+        doc_config: DocumentConfig,
+        include_words: bool,
+        cropper: bool,
+        page_options: Optional[PageOptions],
+        image_options: Optional[ImageOptions] = None,
+        pdf_options: Optional[PdfOptions] = None,
+    ) -> Optional[str]:
+        # Identical requests in flight are found using the same key as the cache.
+        if self.in_flight is None:
+            return super()._get_cache_key(
+                doc_config,
+                include_words,
+                cropper,
+                page_options,
+                image_options,
+                pdf_options,
+            )
+        return self._get_request_key(
+            doc_config, include_words, cropper, page_options, image_options, pdf_options
+        )
+
+    def _share_request(
+        self,
+        in_flight: InFlightRequests,
+        request_key: str,
+        doc_config: DocumentConfig,
+        close_file: bool,
+        parse_input: Callable[[], PredictResponse[TypeDocument]],
+    ) -> PredictResponse[TypeDocument]:
+        """Parse the input, unless an identical document is being parsed."""
+        is_first, future = in_flight.claim(request_key)
+        if not is_first:
+            response_ok, dict_response, page_map = future.result()
+            logger.debug(
+                "Using the response for an identical document: %s",
+                self.input_doc.filename,
+            )
+            self.input_doc.page_map = page_map
+            if close_file:
+                self.input_doc.file_object.close()
+            return PredictResponse(
+                http_response=copy.deepcopy(dict_response),
+                doc_config=doc_config,
+                input_source=self.input_doc,
+                response_ok=response_ok,
+            )
+        try:
+            response = parse_input()
+            # The document is not built, it is only built when it is accessed.
+            future.set_result(
+                (response.response_ok, response.http_response, response.input_page_map)
+            )
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+            raise
+        finally:
+            in_flight.release(request_key)
+        return response
 
+    def _make_request(
+        self,
+        doc_config: DocumentConfig,
+        include_words: bool,
+        close_file: bool,
+        cropper: bool,
+        cache_key: Optional[str] = None,
+    ) -> PredictResponse[TypeDocument]:
+        response = doc_config.document_class.request(
+            doc_config.endpoints,
+            self.input_doc,
+            include_words=include_words,
+            close_file=close_file,
+            cropper=cropper,
+        )
+        return self._build_response(
+            doc_config,
+            json_backend.loads(response.content),
+            response.status_code,
+            response.ok,
+            cache_key,
+        )
+
+    def _make_split_request(
+        self,
+        doc_config: DocumentConfig,
+        include_words: bool,
+        close_file: bool,
+        cropper: bool,
+        split_pages: int,
+        max_workers: int,
+        cache_key: Optional[str] = None,
+    ) -> PredictResponse[TypeDocument]:
+        chunks = self.input_doc.split_pdf(split_pages)
+        if close_file:
+            self.input_doc.file_object.close()
+        logger.debug(
+            "Sending %s in %s parts of %s pages",
+            self.input_doc.filename,
+            len(chunks),
+            split_pages,
+        )
+
+        def request_chunk(chunk: InputSource) -> Tuple[int, Dict[str, Any]]:
+            endpoint = doc_config.document_class.get_endpoint(
+                doc_config.endpoints, chunk
+            )
+            chunk_key = None
+            if self.cache is not None:
+                chunk_key = make_cache_key(
+                    chunk.content_hash(),
+                    endpoint.url_root,
+                    include_words=include_words,
+                    cropper=cropper,
+                )
+                cached_response = self.cache.get(chunk_key)
+                if cached_response is not None:
+                    chunk.file_object.close()
+                    return 200, cached_response
+            response = endpoint.predict_req_post(
+                chunk, include_words=include_words, close_file=True, cropper=cropper
+            )
+            dict_response = json_backend.loads(response.content)
+            if response.ok and self.cache is not None and chunk_key is not None:
+                self.cache.set(chunk_key, dict_response)
+            return response.status_code, dict_response
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            chunk_responses = list(executor.map(request_chunk, chunks))
+        for status_code, dict_response in chunk_responses:
+            if status_code >= 400:
+                return self._build_response(
+                    doc_config, dict_response, status_code, False
+                )
+        merged_response = merge_predictions(
+            [
+                (chunk_n * split_pages, dict_response)
+                for chunk_n, (_, dict_response) in enumerate(chunk_responses)
+            ]
+        )
+        return self._build_response(
+            doc_config, merged_response, chunk_responses[0][0], True, cache_key
+        )
+
+
+TypeClient = TypeVar("TypeClient", bound="BaseClient")
+
+
+class BaseClient:
     _doc_configs: DocumentConfigDict
     raise_on_error: bool
     api_key: str
+    retry_policy: Optional[RetryPolicy]
+    rate_limiter: Optional[RateLimiter] = None
+    cache: Optional[ResponseCache]
+    stream_upload: bool
+    page_cache: Optional[PageCache]
 
-    def __init__(self, api_key: str = "", raise_on_error: bool = True):
+    def __init__(
+        self,
+        api_key: str = "",
+        raise_on_error: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limit: Optional[float] = None,
+        rate_burst: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        stream_upload: bool = False,
+        page_cache: Optional[PageCache] = None,
+    ):
         """
-        Mindee API Client.
+        Base for all Mindee API clients, holds the endpoint configurations.
 
         :param api_key: Your API key for all endpoints
         :param raise_on_error: Raise an Exception on HTTP errors
+        :param retry_policy: How to retry failed requests on all endpoints
+        :param rate_limit: Maximum number of requests per second, shared by all
+            clients using the same API key
+        :param rate_burst: Maximum number of requests which can be made at once
+        :param cache: Cache of API responses to use for all documents
+        :param stream_upload: Whether to stream documents from their file when uploading
+        :param page_cache: Cache of PDFs cut using ``PageOptions``, for all documents
         """
         self._doc_configs: Dict[tuple, DocumentConfig] = {}
         self.raise_on_error = raise_on_error
         self.api_key = api_key
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self.stream_upload = stream_upload
+        self.page_cache = page_cache
+        if rate_limit:
+            self.rate_limiter = get_rate_limiter(
+                api_key or os.getenv(API_KEY_ENV_NAME, ""), rate_limit, rate_burst
+            )
         self._init_default_endpoints()
 
+    def _endpoint_kwargs(self) -> Dict[str, Any]:
+        """Extra arguments used when instantiating all endpoints."""
+        return {
+            "api_key": self.api_key,
+            "retry_policy": self.retry_policy,
+            "rate_limiter": self.rate_limiter,
+            "stream_upload": self.stream_upload,
+        }
+
     def _init_default_endpoints(self) -> None:
         self._doc_configs = {
             (OTS_OWNER, InvoiceV3.__name__): DocumentConfig(
@@ -196,7 +584,7 @@ def _init_default_endpoints(self) -> None:
                 document_class=InvoiceV3,
                 endpoints=[
                     StandardEndpoint(
-                        url_name="invoices", version="3", api_key=self.api_key
+                        url_name="invoices", version="3", **self._endpoint_kwargs()
                     )
                 ],
             ),
@@ -205,7 +593,7 @@ def _init_default_endpoints(self) -> None:
                 document_class=InvoiceV4,
                 endpoints=[
                     StandardEndpoint(
-                        url_name="invoices", version="4", api_key=self.api_key
+                        url_name="invoices", version="4", **self._endpoint_kwargs()
                     )
                 ],
             ),
@@ -214,7 +602,9 @@ def _init_default_endpoints(self) -> None:
                 document_class=ReceiptV3,
                 endpoints=[
                     StandardEndpoint(
-                        url_name="expense_receipts", version="3", api_key=self.api_key
+                        url_name="expense_receipts",
+                        version="3",
+                        **self._endpoint_kwargs(),
                     )
                 ],
             ),
@@ -223,7 +613,9 @@ def _init_default_endpoints(self) -> None:
                 document_class=ReceiptV4,
                 endpoints=[
                     StandardEndpoint(
-                        url_name="expense_receipts", version="4", api_key=self.api_key
+                        url_name="expense_receipts",
+                        version="4",
+                        **self._endpoint_kwargs(),
                     )
                 ],
             ),
@@ -232,10 +624,12 @@ def _init_default_endpoints(self) -> None:
                 document_class=FinancialV1,
                 endpoints=[
                     StandardEndpoint(
-                        url_name="invoices", version="3", api_key=self.api_key
+                        url_name="invoices", version="3", **self._endpoint_kwargs()
                     ),
                     StandardEndpoint(
-                        url_name="expense_receipts", version="3", api_key=self.api_key
+                        url_name="expense_receipts",
+                        version="3",
+                        **self._endpoint_kwargs(),
                     ),
                 ],
             ),
@@ -244,7 +638,7 @@ def _init_default_endpoints(self) -> None:
                 document_class=PassportV1,
                 endpoints=[
                     StandardEndpoint(
-                        url_name="passport", version="1", api_key=self.api_key
+                        url_name="passport", version="1", **self._endpoint_kwargs()
                     )
                 ],
             ),
@@ -253,7 +647,7 @@ def _init_default_endpoints(self) -> None:
                 document_class=BankCheckV1,
                 endpoints=[
                     StandardEndpoint(
-                        url_name="bank_check", version="1", api_key=self.api_key
+                        url_name="bank_check", version="1", **self._endpoint_kwargs()
                     )
                 ],
             ),
@@ -262,19 +656,19 @@ def _init_default_endpoints(self) -> None:
                 document_class=CropperV1,
                 endpoints=[
                     StandardEndpoint(
-                        url_name="cropper", version="1", api_key=self.api_key
+                        url_name="cropper", version="1", **self._endpoint_kwargs()
                     )
                 ],
             ),
         }
 
     def add_endpoint(
-        self,
+        self: TypeClient,
         account_name: str,
         endpoint_name: str,
         version: str = "1",
         document_class: Type[Document] = CustomV1,
-    ) -> "Client":
+    ) -> TypeClient:
         """
         Add a custom endpoint, created using the Mindee API Builder.
 
@@ -293,28 +687,194 @@ def add_endpoint(
                     owner=account_name,
                     url_name=endpoint_name,
                     version=version,
-                    api_key=self.api_key,
+                    **self._endpoint_kwargs(),
                 ),
             ],
         )
         return self
 
-    def doc_from_path(
+
+class Client(BaseClient):
+    """
+    Mindee API Client.
+
+    See: https://developers.mindee.com/docs/
+    """
+
+    session: requests.Session
+    """HTTP session shared by all endpoints, holds the connection pool."""
+    in_flight: Optional[InFlightRequests] = None
+    """Requests in progress, when deduplication is enabled."""
+
+    def __init__(
         self,
-        input_path: str,
-    ) -> DocumentClient:
+        api_key: str = "",
+        raise_on_error: bool = True,
+        pool_connections: int = POOL_CONNECTIONS_DEFAULT,
+        pool_maxsize: int = POOL_MAXSIZE_DEFAULT,
+        keep_alive: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limit: Optional[float] = None,
+        rate_burst: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        stream_upload: bool = False,
+        deduplicate: bool = False,
+        page_cache: Optional[PageCache] = None,
+    ):
         """
-        Load a document from an absolute path, as a string.
+        Mindee API Client.
 
-        :param input_path: Path of file to open
+        The client holds a pool of HTTP connections which are reused across requests.
+        Call ``close()`` when done, or use the client as a context manager.
+
+        :param api_key: Your API key for all endpoints
+        :param raise_on_error: Raise an Exception on HTTP errors
+        :param pool_connections: Number of host connection pools to cache
+        :param pool_maxsize: Maximum number of connections to keep per host
+        :param keep_alive: Whether to keep connections open between requests
+        :param retry_policy: How to retry failed requests on all endpoints,
+            if not set requests are only attempted once
+        :param rate_limit: Maximum number of requests per second, shared by all
+            clients using the same API key. If not set, there is no limit.
+        :param rate_burst: Maximum number of requests which can be made at once,
+            defaults to the rate limit
+        :param cache: If set, responses are stored in this cache, and identical
+            documents are not sent to the API again
+        :param stream_upload: Whether to read documents from their file while uploading
+            them, instead of loading them in memory first.
+            Memory use per upload is then bounded, regardless of the file size.
+        :param deduplicate: Whether identical documents parsed at the same time,
+            for instance in ``parse_many``, should share a single request.
+            To also reuse responses after the request is done, or across runs,
+            set a ``cache``.
+        :param page_cache: If set, PDFs cut using ``PageOptions`` are stored in this
+            cache, so that the same pages of a file parsed with several products
+            are only cut once
         """
-        input_doc = PathInput(input_path)
+        self.session = create_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+        )
+        if deduplicate:
+            self.in_flight = InFlightRequests()
+        super().__init__(
+            api_key=api_key,
+            raise_on_error=raise_on_error,
+            retry_policy=retry_policy,
+            rate_limit=rate_limit,
+            rate_burst=rate_burst,
+            cache=cache,
+            stream_upload=stream_upload,
+            page_cache=page_cache,
+        )
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all pooled HTTP connections."""
+        self.session.close()
+
+    def _endpoint_kwargs(self) -> Dict[str, Any]:
+        return {**super()._endpoint_kwargs(), "session": self.session}
+
+    def _get_document_client(self, input_doc: InputSource) -> DocumentClient:
         return DocumentClient(
             input_doc=input_doc,
             doc_configs=self._doc_configs,
             raise_on_error=self.raise_on_error,
+            cache=self.cache,
+            in_flight=self.in_flight,
+            page_cache=self.page_cache,
         )
 
+    def parse_many(
+        self,
+        inputs: Iterable[BatchInput],
+        document_class: TypeDocument,
+        max_workers: int = BATCH_MAX_WORKERS_DEFAULT,
+        endpoint_name: Optional[str] = None,
+        account_name: Optional[str] = None,
+        include_words: bool = False,
+        page_options: Optional[PageOptions] = None,
+        cropper: bool = False,
+        image_options: Optional[ImageOptions] = None,
+        pdf_options: Optional[PdfOptions] = None,
+    ) -> Iterator[Union[PredictResponse[TypeDocument], BatchParseError]]:
+        """
+        Call prediction API on many documents concurrently, and parse the results.
+
+        Results are yielded in completion order, not in input order.
+        An error on one document does not stop the batch: a ``BatchParseError``
+        is yielded in place of its response.
+
+        Files opened by the batch are always closed,
+        file objects passed in ``inputs`` are left open.
+
+        Duplicate documents are only sent once if the client was created
+        with ``deduplicate=True``.
+
+        :param inputs: Documents to parse, see ``mindee.batch.BatchInput``.
+            Consumed lazily, so it may be a generator.
+
+        :param document_class: The document class to use.
+            The response object will be instantiated based on this parameter.
+
+        :param max_workers: Maximum number of requests to make simultaneously.
+            Should not be greater than the client's ``pool_maxsize``.
+
+        Other parameters are the same as for ``DocumentClient.parse``.
+        """
+
+        def parse_item(
+            input_item: BatchInput,
+        ) -> Union[PredictResponse[TypeDocument], BatchParseError]:
+            close_file = isinstance(input_item, (str, tuple, InputSource))
+            input_doc = None
+            try:
+                input_doc = to_input_source(input_item)
+                return self._get_document_client(input_doc).parse(
+                    document_class,
+                    endpoint_name=endpoint_name,
+                    account_name=account_name,
+                    include_words=include_words,
+                    close_file=close_file,
+                    page_options=page_options,
+                    cropper=cropper,
+                    image_options=image_options,
+                    pdf_options=pdf_options,
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.warning("Could not parse %s: %r", input_item, exc)
+                return BatchParseError(
+                    input_item,
+                    exc,
+                    filename=input_doc.filename if input_doc else None,
+                )
+            finally:
+                if close_file and input_doc:
+                    input_doc.file_object.close()
+
+        return iter_completed(parse_item, inputs, max_workers)
+
+    def doc_from_path(
+        self,
+        input_path: str,
+        mmap: bool = False,
+    ) -> DocumentClient:
+        """
+        Load a document from an absolute path, as a string.
+
+        :param input_path: Path of file to open
+        :param mmap: Map the file in memory instead of reading it, recommended
+            for large files. The file is then always uploaded in a streaming way.
+        """
+        return self._get_document_client(PathInput(input_path, mmap=mmap))
+
     def doc_from_file(
         self,
         input_file: BinaryIO,
@@ -324,14 +884,7 @@ def doc_from_file(
 
         :param input_file: Input file handle
         """
-        input_doc = FileInput(
-            input_file,
-        )
-        return DocumentClient(
-            input_doc=input_doc,
-            doc_configs=self._doc_configs,
-            raise_on_error=self.raise_on_error,
-        )
+        return self._get_document_client(FileInput(input_file))
 
     def doc_from_b64string(
         self,
@@ -344,33 +897,17 @@ def doc_from_b64string(
         :param input_string: Input to parse as base64 string
         :param filename: The name of the file (without the path)
         """
-        input_doc = Base64Input(
-            input_string,
-            filename,
-        )
-        return DocumentClient(
-            input_doc=input_doc,
-            doc_configs=self._doc_configs,
-            raise_on_error=self.raise_on_error,
-        )
+        return self._get_document_client(Base64Input(input_string, filename))
 
     def doc_from_bytes(
         self,
-        input_bytes: bytes,
+        input_bytes: TypeBuffer,
         filename: str,
     ) -> DocumentClient:
         """
         Load a document from raw bytes.
 
-        :param input_bytes: Raw byte input
+        :param input_bytes: Raw byte input, it is not copied
         :param filename: The name of the file (without the path)
         """
-        input_doc = BytesInput(
-            input_bytes,
-            filename,
-        )
-        return DocumentClient(
-            input_doc=input_doc,
-            doc_configs=self._doc_configs,
-            raise_on_error=self.raise_on_error,
-        )
+        return self._get_document_client(BytesInput(input_bytes, filename))
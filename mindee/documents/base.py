@@ -1,10 +1,11 @@
 import datetime
 import re
-from typing import Any, Dict, List, Optional, TypeVar
+from typing import Any, Dict, List, Optional, TypeVar, Union
 
 from mindee.endpoints import Endpoint
 from mindee.fields.orientation import OrientationField
 from mindee.fields.position import PositionField
+from mindee.input.metadata import InputFileInfo
 from mindee.input.sources import InputSource
 
 TypeApiPrediction = Dict[str, Any]
@@ -18,7 +19,24 @@ def serialize_for_json(obj: Any) -> Any:
     """
     if isinstance(obj, datetime.date):
         return str(obj)
-    return vars(obj)
+    if not hasattr(type(obj), "__slots__"):
+        return vars(obj)
+    # Same keys, in the same order, as the ``__dict__`` the class had before slots:
+    # unset slots are left out and private ones are not serialized.
+    attributes = {}
+    for cls in reversed(type(obj).__mro__):
+        for name in getattr(cls, "__slots__", ()):
+            if name.startswith("_"):
+                continue
+            try:
+                # Not ``getattr``, which gives the default value of unset slots.
+                attributes[name] = object.__getattribute__(obj, name)
+            except AttributeError:
+                pass
+    for name in getattr(obj, "_serialized_last", ()):
+        attributes[name] = attributes.pop(name)
+    attributes.update(getattr(obj, "__dict__", {}))
+    return attributes
 
 
 def clean_out_string(out_string: str) -> str:
@@ -46,7 +64,7 @@ class Document:
 
     def __init__(
         self,
-        input_source: InputSource,
+        input_source: Optional[Union[InputSource, InputFileInfo]],
         document_type: str,
         api_prediction: TypeApiPrediction,
         page_n: Optional[int] = None,
@@ -65,7 +83,22 @@ def __init__(
             )
 
     @staticmethod
+    def get_endpoint(  # pylint: disable=unused-argument
+        endpoints: List[Endpoint], input_source: InputSource
+    ) -> Endpoint:
+        """
+        Select the prediction endpoint to use for an input.
+
+        The input is only used by documents having several endpoints, which override it.
+
+        :param endpoints: Endpoints config
+        :param input_source: Input object
+        """
+        return endpoints[0]
+
+    @classmethod
     def request(
+        cls,
         endpoints: List[Endpoint],
         input_source: InputSource,
         include_words: bool = False,
@@ -81,7 +114,7 @@ def request(
         :param close_file: Whether to `close()` the file after parsing it.
         :param cropper: Including Mindee cropper results.
         """
-        return endpoints[0].predict_req_post(
+        return cls.get_endpoint(endpoints, input_source).predict_req_post(
             input_source, include_words, close_file, cropper=cropper
         )
 
@@ -62,7 +62,7 @@ def __init__(
         :param input_source: Input object
         :param page_n: Page number for multi-page PDF input
         """
-        # need this for building from prediction
+        # Passed to the invoice or receipt built from the prediction
         self.input_file = input_source
 
         super().__init__(
@@ -149,30 +149,17 @@ def __str__(self) -> str:
         )
 
     @staticmethod
-    def request(
-        endpoints: List[Endpoint],
-        input_source: InputSource,
-        include_words: bool = False,
-        close_file: bool = True,
-        cropper: bool = False,
-    ):
+    def get_endpoint(endpoints: List[Endpoint], input_source: InputSource) -> Endpoint:
         """
-        Make request to prediction endpoint.
+        Select the prediction endpoint to use for an input.
 
-        :param input_source: Input object
         :param endpoints: Endpoints config
-        :param include_words: Include Mindee vision words in http_response
-        :param close_file: Whether to `close()` the file after parsing it.
-        :param cropper: Including Mindee cropper results.
+        :param input_source: Input object
         """
-        if "pdf" in input_source.file_mimetype:
+        if input_source.is_pdf():
             # invoices is index 0, receipts 1 (this should be cleaned up)
-            index = 0
-        else:
-            index = 1
-        return endpoints[index].predict_req_post(
-            input_source, include_words, close_file, cropper=cropper
-        )
+            return endpoints[0]
+        return endpoints[1]
 
     def _checklist(self) -> None:
         """Set the validation rules."""
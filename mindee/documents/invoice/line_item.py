@@ -1,9 +1,30 @@
 from typing import Optional
 
-from mindee.fields.base import FieldPositionMixin, TypePrediction, float_to_string
+from mindee.fields.base import (
+    FieldPositionMixin,
+    SlotDefaultsMixin,
+    TypePrediction,
+    float_to_string,
+)
 
 
-class InvoiceLineItem(FieldPositionMixin):
+class InvoiceLineItem(FieldPositionMixin, SlotDefaultsMixin):
+    __slots__ = (
+        "bounding_box",
+        "polygon",
+        "page_n",
+        "confidence",
+        "product_code",
+        "description",
+        "quantity",
+        "unit_price",
+        "total_amount",
+        "tax_rate",
+        "tax_amount",
+    )
+
+    _slot_defaults = {"confidence": 0.0}
+
     product_code: Optional[str]
     """The product code referring to the item."""
     description: Optional[str]
@@ -18,7 +39,7 @@ class InvoiceLineItem(FieldPositionMixin):
     """The item tax rate in percentage."""
     tax_amount: Optional[float]
     """The item tax amount."""
-    confidence: float = 0.0
+    confidence: float
     """Confidence score"""
     page_n: int
     """The document page on which the information was found."""
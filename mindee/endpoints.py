@@ -1,10 +1,14 @@
 import os
-from typing import Dict, Optional, Union
+import time
+from typing import Any, Dict, Optional, Union
 
 import requests
 
 from mindee.input.sources import InputSource
 from mindee.logger import logger
+from mindee.multipart import MultipartStream
+from mindee.rate_limit import RateLimiter
+from mindee.retry import RetryPolicy
 from mindee.versions import __version__, get_platform, python_version
 
 API_KEY_ENV_NAME = "MINDEE_API_KEY"
@@ -16,12 +20,39 @@
 REQUEST_TIMEOUT_ENV_NAME = "MINDEE_REQUEST_TIMEOUT"
 TIMEOUT_DEFAULT = 120
 
+POOL_CONNECTIONS_DEFAULT = 10
+POOL_MAXSIZE_DEFAULT = 10
+
 PLATFORM = get_platform()
 USER_AGENT = f"mindee-api-python@v{__version__} python-v{python_version} {PLATFORM}"
 
 OTS_OWNER = "mindee"
 
 
+def create_session(
+    pool_connections: int = POOL_CONNECTIONS_DEFAULT,
+    pool_maxsize: int = POOL_MAXSIZE_DEFAULT,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """
+    Create an HTTP session backed by a connection pool.
+
+    :param pool_connections: Number of host connection pools to cache
+    :param pool_maxsize: Maximum number of connections to keep per host
+    :param keep_alive: Whether to keep connections open between requests
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
 class Endpoint:
     """Generic API endpoint for a product."""
 
@@ -32,6 +63,10 @@ class Endpoint:
     _request_timeout: int = TIMEOUT_DEFAULT
     _base_url: str = BASE_URL_DEFAULT
     _url_root: str
+    session: Optional[requests.Session] = None
+    retry_policy: Optional[RetryPolicy] = None
+    rate_limiter: Optional[RateLimiter] = None
+    stream_upload: bool = False
 
     def __init__(
         self,
@@ -39,6 +74,10 @@ def __init__(
         url_name: str,
         version: str,
         api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        stream_upload: bool = False,
     ):
         """
         Generic API endpoint for a product.
@@ -46,10 +85,21 @@ def __init__(
         :param owner: owner of the product
         :param url_name: name of the product as it appears in the URL
         :param version: interface version
+        :param session: HTTP session to use, if not set a new connection is opened
+            for each request
+        :param retry_policy: How to retry failed requests, if not set requests are
+            only attempted once
+        :param rate_limiter: If set, wait for it before each request
+        :param stream_upload: Whether to read documents from their file while
+            uploading them, instead of loading them in memory first
         """
         self.owner = owner
         self.url_name = url_name
         self.version = version
+        self.session = session
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.stream_upload = stream_upload
         if api_key:
             self.api_key = api_key
         else:
@@ -60,6 +110,11 @@ def __init__(
             f"{self._base_url}/products/{self.owner}/{self.url_name}/v{self.version}"
         )
 
+    @property
+    def url_root(self) -> str:
+        """Root URL of the product, all requests are made relative to it."""
+        return self._url_root
+
     @property
     def base_headers(self) -> Dict[str, str]:
         """Base headers to send with all API requests."""
@@ -95,6 +150,95 @@ def set_api_key_from_env(self) -> None:
             self.api_key = env_val
             logger.debug("API key set from environment")
 
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send an HTTP request, through the session if there is one."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        headers = {**self.base_headers, **(headers or {})}
+        if self.session is not None:
+            return self.session.request(
+                method,
+                url,
+                headers=headers,
+                timeout=self._request_timeout,
+                **kwargs,
+            )
+        return requests.request(
+            method,
+            url,
+            headers=headers,
+            timeout=self._request_timeout,
+            **kwargs,
+        )
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        input_source: Optional[InputSource] = None,
+        close_file: bool = True,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Send an HTTP request, retrying according to the retry policy.
+
+        :param input_source: Input object to send as the ``document`` file, it is read
+            again on each attempt.
+        :param close_file: Whether to `close()` the file once the request is done.
+        """
+        stream_upload = input_source is not None and (
+            self.stream_upload or input_source.is_memory_mapped()
+        )
+        fields = None
+        if stream_upload:
+            fields = kwargs.pop("data", None)
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                if input_source is not None and stream_upload:
+                    body = MultipartStream.from_input_source(input_source, fields)
+                    kwargs["data"] = body
+                    kwargs["headers"] = {"Content-Type": body.content_type}
+                elif input_source is not None:
+                    kwargs["files"] = {
+                        "document": input_source.read_contents(close_file=False)
+                    }
+                try:
+                    response = self._send(method, url, **kwargs)
+                except requests.ConnectionError as exc:
+                    if not self.retry_policy or not self.retry_policy.should_retry(
+                        attempt
+                    ):
+                        raise
+                    delay = self.retry_policy.get_delay(attempt)
+                    logger.warning("Connection error: %s", exc)
+                else:
+                    retry_after = response.headers.get("Retry-After")
+                    if not self.retry_policy or not self.retry_policy.should_retry(
+                        attempt, response.status_code, retry_after
+                    ):
+                        return response
+                    delay = self.retry_policy.get_delay(attempt, retry_after)
+                    logger.warning("API HTTP error: %s", response.status_code)
+                logger.warning(
+                    "Retrying %s request in %.2f seconds (attempt %s of %s)",
+                    method,
+                    delay,
+                    attempt + 1,
+                    self.retry_policy.max_attempts,
+                )
+                time.sleep(delay)
+        finally:
+            if input_source is not None and close_file:
+                input_source.file_object.close()
+
     def predict_req_post(
         self,
         input_source: InputSource,
@@ -111,7 +255,6 @@ def predict_req_post(
         :param cropper: Including Mindee cropping results.
         :return: requests response
         """
-        files = {"document": input_source.read_contents(close_file)}
         data = {}
         if include_words:
             data["include_mvision"] = "true"
@@ -120,13 +263,13 @@ def predict_req_post(
         if cropper:
             params["cropper"] = "true"
 
-        response = requests.post(
+        response = self._request(
+            "POST",
             f"{self._url_root}/predict",
-            files=files,
-            headers=self.base_headers,
+            input_source=input_source,
+            close_file=close_file,
             data=data,
             params=params,
-            timeout=self._request_timeout,
         )
         return response
 
@@ -142,15 +285,14 @@ def training_req_post(
         :return: requests response
         :param close_file: Whether to `close()` the file after parsing it.
         """
-        files = {"document": input_source.read_contents(close_file)}
         params = {"training": True, "with_candidates": True}
 
-        response = requests.post(
+        response = self._request(
+            "POST",
             f"{self._url_root}/predict",
-            files=files,
-            headers=self.base_headers,
+            input_source=input_source,
+            close_file=close_file,
             params=params,
-            timeout=self._request_timeout,
         )
         return response
 
@@ -164,15 +306,14 @@ def training_async_req_post(
         :return: requests response
         :param close_file: Whether to `close()` the file after parsing it.
         """
-        files = {"document": input_source.read_contents(close_file)}
         params = {"training": True, "async": True}
 
-        response = requests.post(
+        response = self._request(
+            "POST",
             f"{self._url_root}/predict",
-            files=files,
-            headers=self.base_headers,
+            input_source=input_source,
+            close_file=close_file,
             params=params,
-            timeout=self._request_timeout,
         )
         return response
 
@@ -187,11 +328,10 @@ def document_req_get(self, document_id: str) -> requests.Response:
             "include_candidates": True,
             "global_orientation": True,
         }
-        response = requests.get(
+        response = self._request(
+            "GET",
             f"{self._url_root}/documents/{document_id}",
-            headers=self.base_headers,
             params=params,
-            timeout=self._request_timeout,
         )
         return response
 
@@ -201,10 +341,9 @@ def document_req_del(self, document_id: str) -> requests.Response:
 
         :param document_id: ID of the document
         """
-        response = requests.delete(
+        response = self._request(
+            "DELETE",
             f"{self._url_root}/documents/{document_id}",
-            headers=self.base_headers,
-            timeout=self._request_timeout,
         )
         return response
 
@@ -217,11 +356,10 @@ def documents_req_get(self, page_n: int = 1) -> requests.Response:
         params = {
             "page": page_n,
         }
-        response = requests.get(
+        response = self._request(
+            "GET",
             f"{self._url_root}/documents",
-            headers=self.base_headers,
             params=params,
-            timeout=self._request_timeout,
         )
         return response
 
@@ -235,11 +373,10 @@ def annotations_req_post(
         :param annotations: Annotations object
         :return: requests response
         """
-        response = requests.post(
+        response = self._request(
+            "POST",
             f"{self._url_root}/documents/{document_id}/annotations",
-            headers=self.base_headers,
             json=annotations,
-            timeout=self._request_timeout,
         )
         return response
 
@@ -253,11 +390,10 @@ def annotations_req_put(
         :param annotations: Annotations object
         :return: requests response
         """
-        response = requests.put(
+        response = self._request(
+            "PUT",
             f"{self._url_root}/documents/{document_id}/annotations",
-            headers=self.base_headers,
             json=annotations,
-            timeout=self._request_timeout,
         )
         return response
 
@@ -268,21 +404,33 @@ def annotations_req_del(self, document_id: str) -> requests.Response:
         :param document_id: ID of the document to annotate
         :return: requests response
         """
-        response = requests.delete(
+        response = self._request(
+            "DELETE",
             f"{self._url_root}/documents/{document_id}/annotations",
-            headers=self.base_headers,
-            timeout=self._request_timeout,
         )
         return response
 
 
 class StandardEndpoint(Endpoint):
-    def __init__(self, url_name: str, version: str, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        url_name: str,
+        version: str,
+        api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        stream_upload: bool = False,
+    ):
         super().__init__(
             owner=OTS_OWNER,
             url_name=url_name,
             version=version,
             api_key=api_key,
+            session=session,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            stream_upload=stream_upload,
         )
 
 
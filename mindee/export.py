@@ -0,0 +1,414 @@
+"""Export of parsed documents to columns, for analytics."""
+
+import datetime
+import functools
+import importlib
+import os
+from array import array
+from types import ModuleType
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    get_type_hints,
+)
+
+from mindee.documents.base import Document
+from mindee.response import PredictResponse
+
+FLOAT = "float64"
+INT = "int64"
+BOOL = "bool"
+STRING = "string"
+DATE = "date"
+
+_SCALAR_TYPES: Dict[Any, str] = {
+    float: FLOAT,
+    int: INT,
+    bool: BOOL,
+    str: STRING,
+    datetime.date: DATE,
+    # Values of generic fields are exported as text.
+    Any: STRING,
+}
+_ARRAY_TYPECODES = {FLOAT: "d", INT: "q", BOOL: "b"}
+_NULL_VALUES = {FLOAT: float("nan"), INT: 0, BOOL: 0}
+
+DEFAULT_CHILD_TABLES = ("line_items", "taxes", "supplier_payment_details")
+"""List attributes of documents exported as child tables by default."""
+
+DOCUMENT_INDEX = "document_index"
+"""Column of child tables holding the row of their document."""
+
+
+def _import_optional(module: str, package: str) -> ModuleType:
+    try:
+        return importlib.import_module(module)
+    except ImportError as exc:
+        raise ImportError(
+            f"This export requires the '{package}' package, "
+            "install it using: pip install mindee[export]"
+        ) from exc
+
+
+def _unwrap_optional(hint: Any) -> Any:
+    """:return: ``X`` for an ``Optional[X]`` type hint, the hint itself otherwise."""
+    if getattr(hint, "__origin__", None) is Union:
+        args = [arg for arg in hint.__args__ if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return hint
+
+
+def _scalar_type(hint: Any) -> Optional[str]:
+    """:return: the column type for a type hint, ``None`` if it is not a scalar."""
+    return _SCALAR_TYPES.get(_unwrap_optional(hint))
+
+
+def _list_item_type(hint: Any) -> Optional[type]:
+    """:return: ``X`` for a ``List[X]`` type hint, ``None`` otherwise."""
+    hint = _unwrap_optional(hint)
+    if getattr(hint, "__origin__", None) is list and isinstance(hint.__args__[0], type):
+        return hint.__args__[0]
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _scalar_attributes(cls: type) -> Tuple[Tuple[str, str], ...]:
+    """
+    Find the attributes of a class which can be stored in columns.
+
+    :return: the name and column type of each attribute, from the type hints
+    """
+    attributes = []
+    for name, hint in get_type_hints(cls).items():
+        dtype = _scalar_type(hint)
+        if dtype is not None:
+            attributes.append((name, dtype))
+    return tuple(attributes)
+
+
+class Column:
+    """
+    A column of typed values, allocated once for all rows.
+
+    Numbers are stored in a contiguous ``array``, other values in a ``list``.
+    All values are null until they are set.
+    """
+
+    name: str
+    dtype: str
+    """Type of the values, one of ``float64``, ``int64``, ``bool``, ``string``, ``date``."""
+    values: Union[array, list]
+    valid: bytearray
+    """For each row, 1 if the value is set, 0 if it is null."""
+
+    def __init__(self, name: str, dtype: str, length: int):
+        self.name = name
+        self.dtype = dtype
+        if dtype in _ARRAY_TYPECODES:
+            self.values = array(_ARRAY_TYPECODES[dtype], [_NULL_VALUES[dtype]]) * length
+        else:
+            self.values = [None] * length
+        self.valid = bytearray(length)
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def set(self, row: int, value: Any) -> None:
+        """
+        Set the value of a row, converting it to the column's type.
+
+        Values which can't be converted are left null.
+
+        :param row: Index of the row
+        :param value: The value, ``None`` for null
+        """
+        if value is None:
+            return
+        try:
+            if self.dtype == FLOAT:
+                value = float(value)
+            elif self.dtype in (INT, BOOL):
+                value = int(value)
+            elif self.dtype == STRING:
+                value = str(value)
+            elif not isinstance(value, datetime.date):
+                return
+        except (TypeError, ValueError):
+            return
+        self.values[row] = value
+        self.valid[row] = 1
+
+    def to_pylist(self) -> List[Any]:
+        """:return: the values as a list, with ``None`` for nulls."""
+        if self.dtype == BOOL:
+            return [bool(value) if valid else None for value, valid in self._rows()]
+        return [value if valid else None for value, valid in self._rows()]
+
+    def _rows(self) -> Iterable[Tuple[Any, int]]:
+        return zip(self.values, self.valid)
+
+    def to_numpy(self) -> Any:
+        """
+        Convert to a NumPy array, requires ``numpy``.
+
+        :return: an array of the column's type, ``object`` for strings.
+            A masked array if there are nulls.
+        """
+        numpy = _import_optional("numpy", "numpy")
+        if self.dtype == BOOL:
+            data = numpy.frombuffer(self.values, dtype=numpy.int8).astype(bool)
+        elif self.dtype in _ARRAY_TYPECODES:
+            data = numpy.frombuffer(self.values, dtype=self.dtype).copy()
+        elif self.dtype == DATE:
+            data = numpy.array(self.values, dtype="datetime64[D]")
+        else:
+            data = numpy.array(self.values, dtype=object)
+        if all(self.valid):
+            return data
+        mask = numpy.frombuffer(self.valid, dtype=numpy.uint8) == 0
+        return numpy.ma.masked_array(data, mask=mask)
+
+    def to_arrow(self) -> Any:
+        """Convert to an Arrow array, requires ``pyarrow``."""
+        pyarrow = _import_optional("pyarrow", "pyarrow")
+        arrow_types = {
+            FLOAT: pyarrow.float64(),
+            INT: pyarrow.int64(),
+            BOOL: pyarrow.bool_(),
+            STRING: pyarrow.string(),
+            DATE: pyarrow.date32(),
+        }
+        return pyarrow.array(self.to_pylist(), type=arrow_types[self.dtype])
+
+
+class Table:
+    """Columns of the same length, which are the rows of a table."""
+
+    name: str
+    num_rows: int
+    columns: Dict[str, Column]
+
+    def __init__(self, name: str, num_rows: int):
+        self.name = name
+        self.num_rows = num_rows
+        self.columns = {}
+
+    def add_column(self, name: str, dtype: str) -> Column:
+        """
+        Allocate a column for all rows, unless it already exists.
+
+        :param name: Name of the column
+        :param dtype: Type of the values
+        """
+        if name not in self.columns:
+            self.columns[name] = Column(name, dtype, self.num_rows)
+        return self.columns[name]
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """:return: a NumPy array for each column, see ``Column.to_numpy``."""
+        return {name: column.to_numpy() for name, column in self.columns.items()}
+
+    def to_arrow(self) -> Any:
+        """:return: an Arrow table, requires ``pyarrow``."""
+        pyarrow = _import_optional("pyarrow", "pyarrow")
+        return pyarrow.table(
+            {name: column.to_arrow() for name, column in self.columns.items()}
+        )
+
+    def write_parquet(self, path: str) -> None:
+        """
+        Write to a Parquet file, requires ``pyarrow``.
+
+        :param path: Path of the file
+        """
+        parquet = _import_optional("pyarrow.parquet", "pyarrow")
+        parquet.write_table(self.to_arrow(), path)
+
+
+class ColumnarExport:
+    """
+    Documents as a table, with a column per scalar attribute.
+
+    Lists of items, such as line items, are in child tables.
+    Their ``document_index`` column is the row of their document.
+    """
+
+    documents: Table
+    children: Dict[str, Table]
+
+    def __init__(self, documents: Table, children: Dict[str, Table]):
+        self.documents = documents
+        self.children = children
+
+    @property
+    def tables(self) -> Dict[str, Table]:
+        """All tables, by name, starting with ``documents``."""
+        return {self.documents.name: self.documents, **self.children}
+
+    def to_numpy(self) -> Dict[str, Dict[str, Any]]:
+        """:return: the NumPy arrays of each table, see ``Table.to_numpy``."""
+        return {name: table.to_numpy() for name, table in self.tables.items()}
+
+    def to_arrow(self) -> Dict[str, Any]:
+        """:return: each table converted to Arrow, requires ``pyarrow``."""
+        return {name: table.to_arrow() for name, table in self.tables.items()}
+
+    def write_parquet(self, directory: str) -> List[str]:
+        """
+        Write each table to a Parquet file, requires ``pyarrow``.
+
+        :param directory: Directory of the files, named after the tables
+        :return: the paths of the files
+        """
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for name, table in self.tables.items():
+            path = os.path.join(directory, f"{name}.parquet")
+            table.write_parquet(path)
+            paths.append(path)
+        return paths
+
+
+class _DocumentLayout:
+    """Where the attributes of a document class are stored."""
+
+    def __init__(
+        self,
+        document_class: type,
+        documents: Table,
+        children: Dict[str, Table],
+        child_tables: Sequence[str],
+    ):
+        self.scalars: List[Tuple[str, Column]] = []
+        self.fields: List[Tuple[str, List[Tuple[str, Column]]]] = []
+        self.lists: List[Tuple[str, Table, List[Tuple[str, Column]]]] = []
+        for name, hint in get_type_hints(document_class).items():
+            dtype = _scalar_type(hint)
+            item_type = _list_item_type(hint)
+            if dtype is not None:
+                self.scalars.append((name, documents.add_column(name, dtype)))
+            elif item_type is not None:
+                if name in child_tables:
+                    table = children[name]
+                    self.lists.append(
+                        (name, table, self._add_columns(table, "", item_type))
+                    )
+            else:
+                field_type = _unwrap_optional(hint)
+                if isinstance(field_type, type) and _scalar_attributes(field_type):
+                    self.fields.append(
+                        (name, self._add_columns(documents, name, field_type))
+                    )
+
+    @staticmethod
+    def _add_columns(table: Table, prefix: str, cls: type) -> List[Tuple[str, Column]]:
+        """
+        Add a column for each scalar attribute of a class.
+
+        The ``value`` attribute is named after the prefix alone.
+        """
+        columns = []
+        for attribute, dtype in _scalar_attributes(cls):
+            if not prefix:
+                name = attribute
+            elif attribute == "value":
+                name = prefix
+            else:
+                name = f"{prefix}_{attribute}"
+            columns.append((attribute, table.add_column(name, dtype)))
+        return columns
+
+    def fill(self, doc: Document, doc_n: int, child_rows: Dict[str, int]) -> None:
+        """
+        Fill the row of a document, and the rows of its child tables.
+
+        :param doc: Document of the class of the layout
+        :param doc_n: Row of the document in the documents table
+        :param child_rows: Next row to fill in each child table, updated
+        """
+        for attribute, column in self.scalars:
+            column.set(doc_n, getattr(doc, attribute, None))
+        for name, columns in self.fields:
+            field = getattr(doc, name, None)
+            if field is not None:
+                _fill(field, doc_n, columns)
+        for name, table, columns in self.lists:
+            for item in getattr(doc, name, None) or ():
+                row = child_rows[name]
+                table[DOCUMENT_INDEX].set(row, doc_n)
+                _fill(item, row, columns)
+                child_rows[name] = row + 1
+
+
+def _fill(obj: Any, row: int, columns: List[Tuple[str, Column]]) -> None:
+    for attribute, column in columns:
+        column.set(row, getattr(obj, attribute, None))
+
+
+def _make_tables(
+    docs: Sequence[Document], child_tables: Sequence[str]
+) -> Tuple[Table, Dict[str, Table]]:
+    """:return: the documents table and the child tables, sized for the documents."""
+    child_sizes = {name: 0 for name in child_tables}
+    for doc in docs:
+        for name in child_tables:
+            child_sizes[name] += len(getattr(doc, name, None) or ())
+
+    document_table = Table("documents", len(docs))
+    children = {name: Table(name, size) for name, size in child_sizes.items()}
+    for table in children.values():
+        table.add_column(DOCUMENT_INDEX, INT)
+    return document_table, children
+
+
+def export_columns(
+    documents: Iterable[Union[PredictResponse, Document]],
+    child_tables: Sequence[str] = DEFAULT_CHILD_TABLES,
+) -> ColumnarExport:
+    """
+    Convert parsed documents to columns.
+
+    Columns are found from the type hints of the document and field classes.
+    Each field gives a column for its value, named after the field,
+    and columns for its other attributes, e.g. ``total_amount_confidence``.
+    Documents of different classes can be mixed, their columns are merged.
+
+    All columns are allocated once, then filled document by document.
+
+    :param documents: Responses or documents, responses are exported as their
+        document-level prediction, failed responses are skipped
+    :param child_tables: List attributes exported as child tables,
+        other list attributes are skipped
+    :return: the tables, which can be converted with ``to_numpy`` or ``to_arrow``
+    """
+    docs: List[Document] = []
+    for doc in documents:
+        if isinstance(doc, PredictResponse):
+            # Failed responses have no document.
+            if doc.document is None:
+                continue
+            doc = doc.document
+        docs.append(doc)
+
+    document_table, children = _make_tables(docs, child_tables)
+    layouts: Dict[type, _DocumentLayout] = {}
+    for doc in docs:
+        if type(doc) not in layouts:
+            layouts[type(doc)] = _DocumentLayout(
+                type(doc), document_table, children, child_tables
+            )
+
+    child_rows = {name: 0 for name in child_tables}
+    for doc_n, doc in enumerate(docs):
+        layouts[type(doc)].fill(doc, doc_n, child_rows)
+    return ColumnarExport(document_table, children)
@@ -9,7 +9,9 @@
 
 
 class AmountField(FieldPositionMixin, BaseField):
-    value: Optional[float] = None
+    __slots__ = ("bounding_box", "polygon")
+
+    value: Optional[float]
 
     def __init__(
         self,
@@ -4,6 +4,8 @@
 
 
 class ClassificationField:
+    __slots__ = ("value", "confidence")
+
     value: str
     """The classification value."""
     confidence: float
@@ -18,9 +20,11 @@ def __str__(self) -> str:
 
 
 class ListFieldValue(FieldPositionMixin):
+    __slots__ = ("content", "confidence", "bounding_box", "polygon")
+
     content: str
     """The content text"""
-    confidence: float = 0.0
+    confidence: float
     """Confidence score"""
 
     def __init__(self, prediction: TypePrediction) -> None:
@@ -33,7 +37,9 @@ def __str__(self) -> str:
 
 
 class ListField:
-    confidence: float = 0.0
+    __slots__ = ("values", "reconstructed", "page_n", "confidence")
+
+    confidence: float
     """Confidence score"""
     reconstructed: bool
     """Whether the field was reconstructed from other fields."""
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, TypeVar
+from typing import Any, Dict, List, Optional, Tuple, TypeVar
 
 from mindee.geometry import Point, Polygon, Quadrilateral, get_bounding_box
 
@@ -6,32 +6,95 @@
 
 
 class FieldPositionMixin:
+    """
+    Position of a field in the document.
+
+    Classes using the mixin must declare the ``bounding_box`` and ``polygon`` slots.
+    """
+
+    __slots__ = ()
+
     bounding_box: Optional[Quadrilateral]
     """A right rectangle containing the word in the document."""
     polygon: Polygon
     """A polygon containing the word in the document."""
 
     def _set_position(self, prediction: TypePrediction):
-        self.bounding_box = None
-        self.polygon = Polygon()
         try:
-            self.polygon = Polygon(
+            polygon = Polygon(
                 Point(point[0], point[1]) for point in prediction["polygon"]
             )
         except KeyError:
-            pass
-        if self.polygon:
-            self.bounding_box = get_bounding_box(self.polygon)
+            polygon = Polygon()
+        # The slots are declared by the classes using the mixin.
+        self.polygon = polygon  # type: ignore[misc]
+        self.bounding_box = (  # type: ignore[misc]
+            get_bounding_box(polygon) if polygon else None
+        )
+
+
+class SlotDefaultsMixin:
+    """
+    Default values of the slots which are not set by ``__init__``.
+
+    Slots are only set when the prediction has a value for them, as attributes were
+    when fields had a ``__dict__``. ``serialize_for_json`` leaves unset slots out,
+    so that the JSON output does not change.
+    """
+
+    __slots__ = ()
+
+    _slot_defaults: Dict[str, Any] = {}
+    _serialized_last: Tuple[str, ...]
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when the attribute is not found, i.e. the slot is not set.
+        try:
+            return self._slot_defaults[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+
+    def _unset_slots(self, *names: str) -> Tuple[str, ...]:
+        """:return: the names of the slots which are not set."""
+        unset = []
+        for name in names:
+            try:
+                object.__getattribute__(self, name)
+            except AttributeError:
+                unset.append(name)
+        return tuple(unset)
+
+    def _serialize_last(self, names: Tuple[str, ...]) -> None:
+        """
+        Serialize slots after the others, if they are now set.
+
+        In a ``__dict__``, attributes are kept in the order they are first set,
+        a slot set after the ones declared after it is moved to the end.
+        The class must declare the ``_serialized_last`` slot.
+
+        :param names: Names of slots which were not set, see ``_unset_slots``
+        """
+        late = tuple(name for name in names if not self._unset_slots(name))
+        if late:
+            # The slot is declared by the classes using it.
+            self._serialized_last = late  # type: ignore[misc]
+
+
+class BaseField(SlotDefaultsMixin):
+    # Declared in the order they are first set, which is the order they are serialized.
+    __slots__ = ("page_n", "reconstructed", "value", "confidence")
 
+    _slot_defaults: Dict[str, Any] = {"value": None, "confidence": 0.0, "page_n": None}
 
-class BaseField:
-    value: Optional[Any] = None
+    value: Optional[Any]
     """Raw field value"""
-    confidence: float = 0.0
+    confidence: float
     """Confidence score"""
     reconstructed: bool
     """Whether the field was reconstructed from other fields."""
-    page_n: Optional[int] = None
+    page_n: Optional[int]
     """The document page on which the information was found."""
 
     def __init__(
@@ -4,6 +4,8 @@
 
 
 class CompanyRegistrationField(FieldPositionMixin, BaseField):
+    __slots__ = ("type", "bounding_box", "polygon")
+
     type: str
     """The type of registration."""
 
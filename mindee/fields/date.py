@@ -10,9 +10,13 @@
 
 
 class DateField(FieldPositionMixin, BaseField):
-    date_object: Optional[date] = None
+    __slots__ = ("bounding_box", "polygon", "date_object", "_serialized_last")
+
+    _slot_defaults = {**BaseField._slot_defaults, "date_object": None}
+
+    date_object: Optional[date]
     """Date as a standard Python ``datetime.date`` object."""
-    value: Optional[str] = None
+    value: Optional[str]
     """The raw field value."""
 
     def __init__(
@@ -37,6 +41,7 @@ def __init__(
         self._set_position(prediction)
 
         if self.value:
+            unset = self._unset_slots("confidence")
             try:
                 self.date_object = (
                     datetime.strptime(self.value, ISO8601_DATE_FORMAT)
@@ -46,3 +51,4 @@ def __init__(
             except (TypeError, ValueError):
                 self.date_object = None
                 self.confidence = 0.0
+            self._serialize_last(unset)
@@ -4,11 +4,13 @@
 
 
 class LocaleField(BaseField):
-    language: Optional[str] = None
+    __slots__ = ("language", "country", "currency")
+
+    language: Optional[str]
     """ISO 639-1 language code"""
-    country: Optional[str] = None
+    country: Optional[str]
     """ISO 3166-1 alpha-2 country code"""
-    currency: Optional[str] = None
+    currency: Optional[str]
     """ISO 4217 currency code"""
 
     def __init__(
@@ -4,6 +4,8 @@
 
 
 class OrientationField(BaseField):
+    __slots__ = ()
+
     value: int
     """Orientation degrees. One of 0, 90, 180, 270"""
 
@@ -4,13 +4,22 @@
 
 
 class PaymentDetails(FieldPositionMixin, BaseField):
-    account_number: Optional[str] = None
+    __slots__ = (
+        "bounding_box",
+        "polygon",
+        "account_number",
+        "iban",
+        "routing_number",
+        "swift",
+    )
+
+    account_number: Optional[str]
     """Account number"""
-    iban: Optional[str] = None
+    iban: Optional[str]
     """Account IBAN"""
-    routing_number: Optional[str] = None
+    routing_number: Optional[str]
     """Account routing number"""
-    swift: Optional[str] = None
+    swift: Optional[str]
     """Bank's SWIFT code"""
 
     def __init__(
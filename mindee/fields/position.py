@@ -11,15 +11,23 @@
 
 
 class PositionField(BaseField):
-    value: Optional[Polygon] = None
+    __slots__ = (
+        "bounding_box",
+        "quadrangle",
+        "rectangle",
+        "polygon",
+        "_serialized_last",
+    )
+
+    value: Optional[Polygon]
     """Polygon of cropped area, identical to the ``polygon`` property."""
-    polygon: Optional[Polygon] = None
+    polygon: Optional[Polygon]
     """Polygon of cropped area"""
-    quadrangle: Optional[Quadrilateral] = None
+    quadrangle: Optional[Quadrilateral]
     """Quadrangle of cropped area (does not exceed the canvas)"""
-    rectangle: Optional[Quadrilateral] = None
+    rectangle: Optional[Quadrilateral]
     """Oriented rectangle of cropped area (may exceed the canvas)"""
-    bounding_box: Optional[Quadrilateral] = None
+    bounding_box: Optional[Quadrilateral]
     """Straight rectangle of cropped area (does not exceed the canvas)"""
 
     def __init__(
@@ -61,7 +69,9 @@ def get_polygon(key: str) -> Optional[Polygon]:
         self.rectangle = get_quadrilateral("rectangle")
         self.polygon = get_polygon("polygon")
 
+        unset = self._unset_slots("value")
         self.value = self.polygon
+        self._serialize_last(unset)
 
     def __str__(self) -> str:
         if self.polygon is None:
@@ -9,6 +9,8 @@
 
 
 class TaxField(FieldPositionMixin, BaseField):
+    __slots__ = ("bounding_box", "polygon", "rate", "code", "basis", "_serialized_last")
+
     value: Optional[float]
     """The amount of the tax line."""
     rate: Optional[float]
@@ -63,11 +65,13 @@ def __init__(
         except (ValueError, TypeError, KeyError):
             self.basis = None
 
+        unset = self._unset_slots("value", "confidence")
         try:
             self.value = float(prediction[value_key])
         except (ValueError, TypeError, KeyError):
             self.value = None
             self.confidence = 0.0
+        self._serialize_last(unset)
 
     def __str__(self) -> str:
         out_str = float_to_string(self.value)
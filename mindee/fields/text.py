@@ -4,7 +4,9 @@
 
 
 class TextField(FieldPositionMixin, BaseField):
-    value: Optional[str] = None
+    __slots__ = ("bounding_box", "polygon")
+
+    value: Optional[str]
 
     def __init__(
         self,
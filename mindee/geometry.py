@@ -73,6 +73,8 @@ class Polygon(list):
     Inherits from base class ``list`` so is compatible with type ``Points``.
     """
 
+    __slots__ = ()
+
 
 Points = Sequence[Point]
 
@@ -110,11 +112,19 @@ def get_bounding_box(points: Points) -> Quadrilateral:
     :return: A bounding box that encompasses all points.
     """
     x_min, y_min, x_max, y_max = get_bbox(points)
+    # Corners which are points of the polygon are shared with it, rather than copied.
+    # Most polygons are rectangles, so their bounding box takes almost no memory.
+    vertices = {point: point for point in points if isinstance(point, Point)}
     return Quadrilateral(
-        Point(x_min, y_min),
-        Point(x_max, y_min),
-        Point(x_max, y_max),
-        Point(x_min, y_max),
+        *(
+            vertices.get(corner, corner)
+            for corner in (
+                Point(x_min, y_min),
+                Point(x_max, y_min),
+                Point(x_max, y_max),
+                Point(x_min, y_max),
+            )
+        )
     )
 
 
@@ -0,0 +1,107 @@
+import fnmatch
+import mimetypes
+import os
+from typing import Iterator, List, Optional
+
+from mindee.input.sources import ALLOWED_MIME_TYPES, PathInput
+
+SORT_BY_NAME = "name"
+SORT_BY_SIZE = "size"
+SORT_BY_MTIME = "mtime"
+
+SORT_KEYS = [SORT_BY_NAME, SORT_BY_SIZE, SORT_BY_MTIME]
+
+
+class DirectoryInput:
+    """
+    Documents in a directory, found lazily.
+
+    Iterating yields the paths of the files, which are only opened when they are
+    parsed: pass the object directly to ``Client.parse_many``.
+    Only files having one of the ``ALLOWED_MIME_TYPES``, guessed from their name,
+    are yielded.
+    """
+
+    directory: str
+    pattern: str
+    recursive: bool
+    sort_by: Optional[str]
+    reverse: bool
+
+    def __init__(
+        self,
+        directory: str,
+        pattern: str = "*",
+        recursive: bool = False,
+        sort_by: Optional[str] = None,
+        reverse: bool = False,
+    ):
+        """
+        Documents in a directory, found lazily.
+
+        :param directory: Path of the directory
+        :param pattern: Shell-style pattern that file names must match, e.g. ``*.pdf``
+        :param recursive: Also look in sub-directories
+        :param sort_by: Order of the files, one of ``name``, ``size``, ``mtime``.
+            Names are compared one directory level at a time, from the top directory.
+            By default, files are yielded in the order of the file system,
+            as they are found. Sorting requires listing all the files first.
+        :param reverse: Sort in descending order
+        """
+        if not os.path.isdir(directory):
+            raise NotADirectoryError(f"Not a directory: {directory}")
+        if sort_by is not None and sort_by not in SORT_KEYS:
+            raise ValueError(
+                f"Invalid sort key '{sort_by}', must be one of {', '.join(SORT_KEYS)}"
+            )
+        self.directory = directory
+        self.pattern = pattern
+        self.recursive = recursive
+        self.sort_by = sort_by
+        self.reverse = reverse
+
+    def _is_allowed(self, filename: str) -> bool:
+        if not fnmatch.fnmatch(filename, self.pattern):
+            return False
+        return mimetypes.guess_type(filename)[0] in ALLOWED_MIME_TYPES
+
+    def _scan(self) -> Iterator[os.DirEntry]:
+        """Walk the directory, one level at a time, without following links."""
+        directories = [self.directory]
+        while directories:
+            with os.scandir(directories.pop()) as entries:
+                sub_directories = []
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        sub_directories.append(entry.path)
+                    elif entry.is_file() and self._is_allowed(entry.name):
+                        yield entry
+            if self.recursive:
+                directories.extend(reversed(sorted(sub_directories)))
+
+    def _relative_parts(self, entry: os.DirEntry) -> List[str]:
+        """Names of the sub-directories and of the file, from the top directory."""
+        return os.path.relpath(entry.path, self.directory).split(os.sep)
+
+    def __iter__(self) -> Iterator[str]:
+        if self.sort_by is None:
+            return (entry.path for entry in self._scan())
+        entries: List[os.DirEntry] = list(self._scan())
+        if self.sort_by == SORT_BY_SIZE:
+            entries.sort(key=lambda entry: entry.stat().st_size, reverse=self.reverse)
+        elif self.sort_by == SORT_BY_MTIME:
+            entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=self.reverse)
+        else:
+            entries.sort(key=self._relative_parts, reverse=self.reverse)
+        return (entry.path for entry in entries)
+
+    def inputs(self, mmap: bool = False) -> Iterator[PathInput]:
+        """
+        Open the documents one at a time, as the iterator is consumed.
+
+        The caller is responsible for closing each file.
+
+        :param mmap: Map the files in memory, see ``PathInput``
+        """
+        for path in self:
+            yield PathInput(path, mmap=mmap)
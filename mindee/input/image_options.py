@@ -0,0 +1,18 @@
+from typing import NamedTuple, Optional
+
+IMAGE_QUALITY_DEFAULT = 85
+
+
+class ImageOptions(NamedTuple):
+    max_size: Optional[int] = None
+    """
+    Maximum length of the longest side of the image, in pixels.
+    Larger images are scaled down, keeping their aspect ratio.
+
+    Default: `None` (keep the original size)
+    """
+    quality: int = IMAGE_QUALITY_DEFAULT
+    """
+    Quality used to encode JPEG, WEBP and TIFF images again, from 1 to 100.
+    PNG images are compressed losslessly.
+    """
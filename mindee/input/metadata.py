@@ -0,0 +1,107 @@
+from typing import Callable, NamedTuple, Optional, Tuple
+
+PROBE_SIZE = 8 * 1024
+"""Number of bytes read from the start of a file to identify it."""
+
+_HEIC_BRANDS = (b"heic", b"heix", b"hevc", b"hevx", b"heim", b"heis", b"mif1", b"msf1")
+
+# Bytes found at given offsets in each type of file: all of the offsets must match,
+# each one with any of its values.
+_SIGNATURES: Tuple[Tuple[str, Tuple[Tuple[int, Tuple[bytes, ...]], ...]], ...] = (
+    ("image/jpeg", ((0, (b"\xff\xd8\xff",)),)),
+    ("image/png", ((0, (b"\x89PNG\r\n\x1a\n",)),)),
+    ("image/tiff", ((0, (b"II*\x00", b"MM\x00*")),)),
+    ("image/webp", ((0, (b"RIFF",)), (8, (b"WEBP",)))),
+    ("image/heic", ((4, (b"ftyp",)), (8, _HEIC_BRANDS))),
+)
+
+
+def sniff_mimetype(header: bytes) -> Optional[str]:
+    """
+    Identify a file from its first bytes.
+
+    :param header: Start of the file, at least the first 1024 bytes if available
+    :return: the MIME type, or ``None`` if the file is not of a supported type
+    """
+    for mimetype, signature in _SIGNATURES:
+        if all(header.startswith(values, offset) for offset, values in signature):
+            return mimetype
+    # The PDF header is allowed anywhere in the first 1024 bytes.
+    if b"%PDF-" in header[:1024]:
+        return "application/pdf"
+    return None
+
+
+class InputMetadata:
+    """
+    Information on an input file, read from its first bytes.
+
+    The page count of PDFs needs the whole file to be parsed,
+    it is only counted when first accessed.
+    """
+
+    __slots__ = ("mimetype", "size", "width", "height", "_page_count", "_count_pages")
+
+    mimetype: str
+    """
+    MIME type of the file, identified from its contents.
+    Falls back to the type guessed from the file name.
+    """
+    size: int
+    """Size of the file, in bytes."""
+    width: Optional[int]
+    """Width of an image, in pixels."""
+    height: Optional[int]
+    """Height of an image, in pixels."""
+
+    def __init__(
+        self,
+        mimetype: str,
+        size: int,
+        page_count: Optional[int] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        count_pages: Optional[Callable[[], int]] = None,
+    ) -> None:
+        """
+        Information on an input file.
+
+        :param mimetype: MIME type of the file
+        :param size: Size of the file, in bytes
+        :param page_count: Number of pages, if known
+        :param width: Width of an image, in pixels
+        :param height: Height of an image, in pixels
+        :param count_pages: Called to count the pages when ``page_count`` is not known
+        """
+        self.mimetype = mimetype
+        self.size = size
+        self.width = width
+        self.height = height
+        self._page_count = page_count
+        self._count_pages = count_pages
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages in a PDF, or frames in an image."""
+        if self._page_count is None:
+            self._page_count = self._count_pages() if self._count_pages else 1
+        return self._page_count
+
+    def is_pdf(self) -> bool:
+        """:return: True if the file is a PDF."""
+        return self.mimetype == "application/pdf"
+
+
+class InputFileInfo(NamedTuple):
+    """
+    Details of an input file, without its contents.
+
+    Used to build documents once the input file is no longer needed.
+    """
+
+    filepath: Optional[str]
+    """Path of the input file"""
+    filename: Optional[str]
+    """Name of the input file"""
+    file_mimetype: Optional[str]
+    """MIME type of the input file"""
@@ -0,0 +1,150 @@
+import threading
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+
+from mindee.input.page_options import REMOVE_BLANK
+from mindee.logger import logger
+
+TypePageKey = Tuple[str, Tuple[int, ...]]
+TypeOptionsKey = Tuple[str, str, int, Tuple[int, ...]]
+
+MAX_SELECTIONS = 4096
+"""Maximum number of page selections kept, they are only a few bytes each."""
+
+
+class PageCache:
+    """
+    In-process LRU cache of PDFs made from a subset of the pages of a file.
+
+    Entries are keyed by the hash of the original file and the pages kept,
+    so cutting the same pages of a file for several products is only done once.
+    The pages selected by each set of page options are also kept,
+    so that the original file is not scanned again for the same options.
+    Safe to share between threads.
+    """
+
+    max_size: int
+    """Maximum total size of the stored PDFs, in bytes."""
+    hits: int = 0
+    """Number of PDFs found in the cache."""
+    misses: int = 0
+    """Number of PDFs not found in the cache."""
+    size: int = 0
+    """Current total size of the stored PDFs, in bytes."""
+
+    def __init__(self, max_size: int):
+        """
+        In-process LRU cache of PDFs made from a subset of the pages of a file.
+
+        When the maximum size is exceeded, the least recently used PDFs are removed.
+
+        :param max_size: Maximum total size of the stored PDFs, in bytes
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[TypePageKey, bytes]" = OrderedDict()
+        self._selections: "OrderedDict[TypeOptionsKey, Tuple[int, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(content_hash: str, page_numbers: Sequence[int]) -> TypePageKey:
+        """
+        Compute the key of a page subset.
+
+        :param content_hash: Hash of the original file contents
+        :param page_numbers: Indexes of the pages kept, in the original file
+        """
+        return content_hash, tuple(sorted(set(page_numbers)))
+
+    @staticmethod
+    def make_options_key(
+        content_hash: str,
+        behavior: str,
+        on_min_pages: int,
+        page_indexes: Sequence[int],
+    ) -> TypeOptionsKey:
+        """
+        Compute the key of a set of page options applied to a file.
+
+        The order of the page indexes does not change the pages selected,
+        and they are not used when removing blank pages.
+
+        :param content_hash: Hash of the original file contents
+        :param behavior: The page operation
+        :param on_min_pages: Minimum number of pages for the operation to apply
+        :param page_indexes: Indexes of the pages given in the options
+        """
+        if behavior == REMOVE_BLANK:
+            page_indexes = ()
+        return content_hash, behavior, on_min_pages, tuple(sorted(set(page_indexes)))
+
+    def get_pages(self, key: TypeOptionsKey) -> Optional[Tuple[int, ...]]:
+        """
+        Get the pages selected by a set of page options.
+
+        :param key: Key of the page options, see ``make_options_key``
+        :return: the indexes of the pages kept, in order, an empty tuple if the file
+            is left as is, or ``None`` if not found
+        """
+        with self._lock:
+            pages = self._selections.get(key)
+            if pages is not None:
+                self._selections.move_to_end(key)
+            return pages
+
+    def set_pages(self, key: TypeOptionsKey, page_numbers: Sequence[int]) -> None:
+        """
+        Store the pages selected by a set of page options.
+
+        :param key: Key of the page options, see ``make_options_key``
+        :param page_numbers: Indexes of the pages kept, empty if the file is left as is
+        """
+        with self._lock:
+            self._selections[key] = tuple(page_numbers)
+            self._selections.move_to_end(key)
+            while len(self._selections) > MAX_SELECTIONS:
+                self._selections.popitem(last=False)
+
+    def get(self, key: TypePageKey) -> Optional[bytes]:
+        """
+        Get a stored PDF.
+
+        :param key: Key of the page subset, see ``make_key``
+        :return: the PDF contents, or ``None`` if not found
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        logger.debug("Pages found in cache: %s", key[1])
+        return value
+
+    def set(self, key: TypePageKey, pdf_bytes: bytes) -> None:
+        """
+        Store a PDF.
+
+        :param key: Key of the page subset, see ``make_key``
+        :param pdf_bytes: The PDF contents
+        """
+        if len(pdf_bytes) > self.max_size:
+            logger.debug("PDF too large for page cache: %s bytes", len(pdf_bytes))
+            return
+        with self._lock:
+            if key in self._entries:
+                self.size -= len(self._entries.pop(key))
+            self._entries[key] = pdf_bytes
+            self.size += len(pdf_bytes)
+            while self.size > self.max_size:
+                self.size -= len(self._entries.popitem(last=False)[1])
+
+    def clear(self) -> None:
+        """Remove all stored PDFs and page selections."""
+        with self._lock:
+            self._entries.clear()
+            self._selections.clear()
+            self.size = 0
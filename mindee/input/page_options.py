@@ -2,15 +2,17 @@
 
 KEEP_ONLY = "KEEP_ONLY"
 REMOVE = "REMOVE"
+REMOVE_BLANK = "REMOVE_BLANK"
 
 
 class PageOptions(NamedTuple):
-    page_indexes: Sequence[int]
+    page_indexes: Sequence[int] = ()
     """
     Zero-based list of page indexes.
     A negative index can be used, indicating an offset from the end of the document.
 
     `[0, -1]` represents the fist and last pages of the document.
+    Not used by ``REMOVE_BLANK``.
     """
     operation: str = KEEP_ONLY
     """
@@ -18,6 +20,11 @@ class PageOptions(NamedTuple):
 
     * ``KEEP_ONLY`` - keep only the specified pages, and remove all others.
     * ``REMOVE`` - remove the specified pages, and keep all others.
+    * ``REMOVE_BLANK`` - remove the pages of a PDF which have no content,
+      such as separator sheets and blank backsides.
+
+    The index of each page sent in the original document is given by the response's
+    ``input_page_map``.
     """
     on_min_pages: int = 0
     """
@@ -0,0 +1,17 @@
+from typing import NamedTuple, Optional
+
+from mindee.input.image_options import IMAGE_QUALITY_DEFAULT
+
+PDF_MAX_DPI_DEFAULT = 150
+
+
+class PdfOptions(NamedTuple):
+    max_dpi: Optional[int] = PDF_MAX_DPI_DEFAULT
+    """
+    Maximum resolution of the images embedded in the PDF, in dots per inch.
+    Images with a higher resolution are scaled down.
+
+    Default: `150`, `None` keeps the original resolution
+    """
+    quality: int = IMAGE_QUALITY_DEFAULT
+    """Quality used to encode the images which are scaled down, from 1 to 100."""
@@ -0,0 +1,159 @@
+"""Read-only binary file objects over in-memory data, which avoid copying it."""
+
+import base64
+import binascii
+import io
+import mmap
+import os
+from typing import BinaryIO, Union
+
+TypeBuffer = Union[bytes, bytearray, memoryview]
+
+
+class _SeekableReader(io.RawIOBase):
+    """Base for read-only, seekable readers of a known size."""
+
+    _size: int
+    _position: int = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self._position + offset
+        elif whence == os.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position: {position}")
+        self._position = position
+        return position
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        raise NotImplementedError()
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read bytes from the current position.
+
+        :param size: Maximum number of bytes to read, if negative read until the end
+        """
+        start = min(self._position, self._size)
+        end = self._size if size is None or size < 0 else min(start + size, self._size)
+        self._position = max(self._position, end)
+        if start >= end:
+            return b""
+        return self._read_range(start, end)
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+class BufferReader(_SeekableReader):
+    """
+    Binary file object reading from a buffer, without copying it.
+
+    Unlike ``io.BytesIO``, ``bytearray`` and ``memoryview`` objects are not copied.
+    The buffer must not be modified while it is being read.
+    """
+
+    def __init__(self, buffer: TypeBuffer):
+        """
+        Binary file object reading from a buffer, without copying it.
+
+        :param buffer: Data to read
+        """
+        super().__init__()
+        self._view = memoryview(buffer).cast("B")
+        self._size = self._view.nbytes
+
+    def getbuffer(self) -> memoryview:
+        """:return: A view of the whole buffer, read-only from Python 3.8."""
+        # ``memoryview.toreadonly`` was added in Python 3.8.
+        if hasattr(self._view, "toreadonly"):
+            return self._view.toreadonly()
+        return self._view
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        if (
+            start == 0
+            and end == self._size
+            and isinstance(self._view.obj, bytes)
+            and len(self._view.obj) == self._size
+        ):
+            # Reading all of a bytes object, no need for a copy.
+            return self._view.obj
+        return self._view[start:end].tobytes()
+
+
+class MemoryMapReader(BufferReader):
+    """
+    Binary file object reading a file mapped in memory.
+
+    The mapping is closed along with the reader.
+    """
+
+    def __init__(self, file: BinaryIO):
+        """
+        Binary file object reading a file mapped in memory.
+
+        :param file: Open file to map, it can be closed once the reader is created
+        """
+        self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        super().__init__(memoryview(self._mmap))
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+            self._mmap.close()
+        super().close()
+
+
+class Base64Reader(_SeekableReader):
+    """
+    Binary file object decoding a base64 string as it is read.
+
+    Only the blocks which are read are decoded, so the decoded data is never
+    held in memory as a whole, unless it is read all at once.
+    """
+
+    def __init__(self, base64_string: str):
+        """
+        Binary file object decoding a base64 string as it is read.
+
+        :param base64_string: Data encoded using the standard base64 alphabet.
+            Whitespace, such as line breaks, is ignored.
+        """
+        super().__init__()
+        if any(char in base64_string for char in " \t\r\n"):
+            base64_string = "".join(base64_string.split())
+        if len(base64_string) % 4:
+            raise binascii.Error("Incorrect padding")
+        self._string = base64_string
+        padding = len(base64_string) - len(base64_string.rstrip("="))
+        self._size = len(base64_string) // 4 * 3 - padding
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        # Each block of 4 characters decodes to 3 bytes.
+        first_block = start // 3
+        last_block = (end + 2) // 3
+        decoded = base64.standard_b64decode(
+            self._string[first_block * 4 : last_block * 4]
+        )
+        offset = first_block * 3
+        return decoded[start - offset : end - offset]
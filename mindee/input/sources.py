@@ -1,12 +1,29 @@
-import base64
+import hashlib
 import io
 import mimetypes
 import os
-from typing import BinaryIO, Optional, Sequence, Tuple
-
-# import pikepdf
-
-from mindee.input.page_options import KEEP_ONLY, REMOVE
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
+
+import pikepdf
+from PIL import Image
+
+from mindee.input.image_options import IMAGE_QUALITY_DEFAULT
+from mindee.input.metadata import PROBE_SIZE, InputMetadata, sniff_mimetype
+from mindee.input.page_cache import PageCache
+from mindee.input.page_options import KEEP_ONLY, REMOVE, REMOVE_BLANK
+from mindee.input.pdf_options import PDF_MAX_DPI_DEFAULT
+from mindee.input.readers import Base64Reader, BufferReader, MemoryMapReader, TypeBuffer
 from mindee.logger import logger
 
 mimetypes.add_type("image/heic", ".heic")
@@ -22,22 +39,193 @@
     "image/webp",
 ]
 
+RESIZABLE_MIME_TYPES = [
+    "image/png",
+    "image/jpg",
+    "image/jpeg",
+    "image/tiff",
+    "image/webp",
+]
+
+WRITABLE_TIFF_COMPRESSIONS = [
+    "raw",
+    "group3",
+    "group4",
+    "jpeg",
+    "packbits",
+    "tiff_adobe_deflate",
+    "tiff_deflate",
+    "tiff_lzw",
+]
+
 INPUT_TYPE_FILE = "file"
 INPUT_TYPE_BASE64 = "base64"
 INPUT_TYPE_BYTES = "bytes"
 INPUT_TYPE_PATH = "path"
 
+READ_CHUNK_SIZE = 1024 * 1024
+
 
 class MimeTypeError(AssertionError):
     pass
 
 
+class MindeeSourceError(RuntimeError):
+    """The contents of an input file could not be read."""
+
+
+def _page_has_content(page: pikepdf.Page) -> bool:
+    """
+    Check whether a PDF page has any content, without decoding its streams.
+
+    :param page: The page to check
+    """
+    resources = page.obj.get("/Resources")
+    if resources is not None and ("/Font" in resources or "/XObject" in resources):
+        return True
+    contents = page.obj.get("/Contents")
+    if contents is None:
+        return False
+    streams = contents if isinstance(contents, pikepdf.Array) else [contents]
+    total_size = sum(int(stream.get("/Length", 0)) for stream in streams)
+    return total_size > 1000
+
+
+def _extract_pdf_pages(pdf: pikepdf.Pdf, page_numbers: Iterable[int]) -> io.BytesIO:
+    """
+    Copy pages of a PDF into a new PDF file.
+
+    The file is saved with a static ID, so that it can be hashed.
+
+    :param pdf: The source PDF
+    :param page_numbers: Indexes of the pages to copy, in order
+    :return: the new PDF file
+    """
+    new_file = io.BytesIO()
+    with pikepdf.Pdf.new() as new_pdf:
+        for page_n in page_numbers:
+            new_pdf.pages.append(pdf.pages[page_n])
+        new_pdf.save(new_file, static_id=True)
+    new_file.seek(0)
+    return new_file
+
+
+def _deduplicate_xobjects(pdf: pikepdf.Pdf) -> int:
+    """
+    Make pages share identical images and forms, so that they are only saved once.
+
+    :param pdf: The PDF to modify
+    :return: the number of references replaced
+    """
+    originals: Dict[bytes, pikepdf.Object] = {}
+    replaced = 0
+    for page in pdf.pages:
+        resources = page.obj.get("/Resources")
+        if resources is None or "/XObject" not in resources:
+            continue
+        xobjects = resources.XObject
+        for name in list(xobjects.keys()):
+            xobject = xobjects[name]
+            if not isinstance(xobject, pikepdf.Stream) or not xobject.is_indirect:
+                continue
+            digest = hashlib.sha256(
+                xobject.stream_dict.unparse() + xobject.read_raw_bytes()
+            ).digest()
+            original = originals.setdefault(digest, xobject)
+            if original.objgen != xobject.objgen:
+                xobjects[name] = original
+                replaced += 1
+    return replaced
+
+
+def _find_image_dpis(pdf: pikepdf.Pdf) -> Dict[Tuple[int, int], Tuple[Any, float]]:
+    """
+    Estimate the resolution of the images drawn on each page.
+
+    The content streams are not parsed: each image is assumed to cover its page,
+    which is the case for scans. Smaller images get a lower estimate than their
+    actual resolution, so they are never scaled down too much.
+
+    :param pdf: The PDF to read
+    :return: the images and their lowest resolution found, by object ID
+    """
+    images: Dict[Tuple[int, int], Tuple[Any, float]] = {}
+    for page in pdf.pages:
+        resources = page.obj.get("/Resources")
+        if resources is None or "/XObject" not in resources:
+            continue
+        left, bottom, right, top = (float(value) for value in page.mediabox)
+        page_width = abs(right - left) / 72
+        page_height = abs(top - bottom) / 72
+        if not page_width or not page_height:
+            continue
+        for xobject in resources.XObject.values():
+            if xobject.get("/Subtype") != pikepdf.Name.Image or not xobject.is_indirect:
+                continue
+            dpi = max(
+                int(xobject.Width) / page_width, int(xobject.Height) / page_height
+            )
+            if xobject.objgen in images:
+                dpi = min(dpi, images[xobject.objgen][1])
+            images[xobject.objgen] = (xobject, dpi)
+    return images
+
+
+def _downsample_image(xobject: Any, scale: float, quality: int) -> bool:
+    """
+    Scale down an image of a PDF, and encode it as JPEG, in place.
+
+    Masked images, and images which are not plain RGB or grayscale, are skipped.
+
+    :param xobject: The image object
+    :param scale: Ratio of the new size to the current size
+    :param quality: JPEG quality, from 1 to 100
+    :return: whether the image was replaced
+    """
+    if any(key in xobject for key in ("/SMask", "/Mask", "/Decode")) or bool(
+        xobject.get("/ImageMask", False)
+    ):
+        return False
+    try:
+        image = pikepdf.PdfImage(xobject).as_pil_image()
+    except (pikepdf.PdfError, OSError, ValueError) as exc:
+        logger.debug("Could not read image in PDF: %s", exc)
+        return False
+    if image.mode not in ("RGB", "L"):
+        return False
+    new_size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+    image = image.resize(new_size, Image.Resampling.LANCZOS)
+    new_data = io.BytesIO()
+    image.save(new_data, format="JPEG", quality=quality, optimize=True)
+    if new_data.tell() >= len(xobject.read_raw_bytes()):
+        return False
+    xobject.write(new_data.getvalue(), filter=pikepdf.Name.DCTDecode)
+    if "/DecodeParms" in xobject:
+        del xobject["/DecodeParms"]
+    xobject.Width, xobject.Height = new_size
+    xobject.BitsPerComponent = 8
+    xobject.ColorSpace = (
+        pikepdf.Name.DeviceRGB if image.mode == "RGB" else pikepdf.Name.DeviceGray
+    )
+    return True
+
+
 class InputSource:
     file_object: BinaryIO
     filename: str
     file_mimetype: str
     input_type: str
     filepath: Optional[str] = None
+    bytes_saved: int = 0
+    """Number of bytes removed from the file by processing, before sending it."""
+    page_map: Optional[List[int]] = None
+    """
+    Index in the original file of each page of the file, in order.
+    Only set when pages were removed from the file.
+    """
+    _pdf_scan: Optional[Tuple[int, Tuple[int, ...]]] = None
+    _metadata: Optional[InputMetadata] = None
+    _content_hash: Optional[str] = None
 
     def __init__(
         self,
@@ -61,33 +249,111 @@ def _check_mimetype(self) -> None:
                 % ", ".join(ALLOWED_MIME_TYPES)
             )
 
+    @property
+    def metadata(self) -> InputMetadata:
+        """
+        Information on the file, read once and kept until the file is modified.
+
+        Only the start of the file is read to identify it and get the size of images.
+        The page count of PDFs is only counted when first accessed,
+        and shared with ``count_doc_pages``.
+        """
+        if self._metadata is None:
+            self._metadata = self._probe()
+        return self._metadata
+
+    def _probe(self) -> InputMetadata:
+        size = self.file_object.seek(0, os.SEEK_END)
+        self.file_object.seek(0)
+        mimetype = sniff_mimetype(self.file_object.read(PROBE_SIZE))
+        if mimetype is None:
+            logger.debug("Could not identify contents of: %s", self.filename)
+            mimetype = self.file_mimetype
+        self.file_object.seek(0)
+        if mimetype == "application/pdf":
+            return InputMetadata(
+                mimetype=mimetype, size=size, count_pages=self.count_doc_pages
+            )
+        try:
+            # Pillow only reads the image header until the pixels are needed.
+            with Image.open(self.file_object) as image:
+                width, height = image.size
+                page_count = getattr(image, "n_frames", 1)
+        except Image.DecompressionBombError as exc:
+            raise MindeeSourceError(
+                f"Image is too large to be read: {self.filename}"
+            ) from exc
+        except OSError as exc:
+            logger.debug("Could not read image %s: %s", self.filename, exc)
+            width, height = None, None
+            page_count = 1
+        finally:
+            self.file_object.seek(0)
+        return InputMetadata(
+            mimetype=mimetype,
+            size=size,
+            page_count=page_count,
+            width=width,
+            height=height,
+        )
+
     def is_pdf(self) -> bool:
-        """:return: True if the file is a PDF."""
-        return self.file_mimetype == "application/pdf"
+        """:return: True if the file is a PDF, according to its contents."""
+        return self.metadata.is_pdf()
+
+    def _get_pdf_scan(self) -> Tuple[int, Tuple[int, ...]]:
+        """
+        Count the pages of the PDF and find the blank ones, in a single pass.
+
+        Only the cross-reference table and the page tree are read: content streams
+        are not decoded, their size is taken from their dictionary.
+        The results are kept until the PDF is modified.
+
+        :return: a Tuple with the number of pages, and the indexes of blank pages
+        """
+        if self._pdf_scan is None:
+            self.file_object.seek(0)
+            try:
+                with pikepdf.open(self.file_object) as pdf:
+                    self._pdf_scan = (
+                        len(pdf.pages),
+                        tuple(
+                            page_n
+                            for page_n, page in enumerate(pdf.pages)
+                            if not _page_has_content(page)
+                        ),
+                    )
+            except pikepdf.PdfError as exc:
+                raise MindeeSourceError(
+                    f"Could not read PDF {self.filename}: {exc}"
+                ) from exc
+            finally:
+                self.file_object.seek(0)
+        return self._pdf_scan
 
     def count_doc_pages(self) -> int:
-        return 0
-#         """
-#         Count the pages in the PDF.
+        """
+        Count the pages in the PDF.
 
-#         :return: the number of pages.
-#         """
-#         self.file_object.seek(0)
-#         with pikepdf.open(self.file_object) as pdf:
-#             return len(pdf.pages)
+        :return: the number of pages.
+        """
+        return self._get_pdf_scan()[0]
 
-    def process_pdf(
+    def _select_pages(
         self,
         behavior: str,
         on_min_pages: int,
         page_indexes: Sequence,
-    ) -> None:
-        """Run any required processing on a PDF file."""
-        if self.is_pdf_empty():
-            raise AssertionError(f"PDF pages are empty in: {self.filename}")
-        pages_count = self.count_doc_pages()
+        pages_count: int,
+    ) -> Optional[Set[int]]:
+        """
+        Find which pages of the document to keep.
+
+        :return: the indexes of the pages to keep,
+            or ``None`` if the document has fewer than ``on_min_pages`` pages.
+        """
         if on_min_pages > pages_count:
-            return
+            return None
         all_pages = list(range(pages_count))
         if behavior == KEEP_ONLY:
             pages_to_keep = set()
@@ -108,55 +374,365 @@ def process_pdf(
             raise AssertionError(f"Invalid cut behavior specified: {behavior}")
 
         if len(pages_to_keep) < 1:
-            raise RuntimeError("Resulting PDF would have no pages left.")
-        self.merge_pdf_pages(pages_to_keep)
+            file_type = "PDF" if self.is_pdf() else "image"
+            raise RuntimeError(f"Resulting {file_type} would have no pages left.")
+        return pages_to_keep
+
+    def find_pages(
+        self,
+        behavior: str,
+        on_min_pages: int,
+        page_indexes: Sequence,
+    ) -> Optional[List[int]]:
+        """
+        Find which pages of a PDF or multi-page TIFF to keep, without modifying it.
+
+        ``REMOVE_BLANK`` only applies to PDFs.
+
+        :return: the indexes of the pages to keep, in order,
+            or ``None`` if the file is to be left as is.
+        """
+        if self.is_pdf():
+            pages_count = self.count_doc_pages()
+        elif self.metadata.mimetype == "image/tiff":
+            pages_count = self.metadata.page_count
+        else:
+            return None
+        if behavior == REMOVE_BLANK:
+            if not self.is_pdf():
+                logger.debug("Not removing blank pages of image: %s", self.filename)
+                return None
+            page_indexes = self.get_blank_pages()
+            if not page_indexes:
+                return None
+            behavior = REMOVE
+        pages_to_keep = self._select_pages(
+            behavior, on_min_pages, page_indexes, pages_count
+        )
+        return None if pages_to_keep is None else sorted(pages_to_keep)
+
+    def process_pdf(
+        self,
+        behavior: str,
+        on_min_pages: int,
+        page_indexes: Sequence,
+        page_cache: Optional[PageCache] = None,
+    ) -> None:
+        """
+        Run any required processing on a PDF file.
+
+        :param page_cache: If set, the pages selected and the resulting PDF are
+            looked up in this cache before the file is scanned, and stored in it
+            afterwards
+        """
+        if page_cache is None:
+            pages_to_keep = self._find_pdf_pages(behavior, on_min_pages, page_indexes)
+            if pages_to_keep is not None:
+                self.merge_pdf_pages(set(pages_to_keep))
+            return
+        content_hash = self.content_hash()
+        options_key = page_cache.make_options_key(
+            content_hash, behavior, on_min_pages, page_indexes
+        )
+        cached_pages = page_cache.get_pages(options_key)
+        if cached_pages is None:
+            pages_to_keep = self._find_pdf_pages(behavior, on_min_pages, page_indexes)
+            page_cache.set_pages(options_key, pages_to_keep or ())
+        else:
+            pages_to_keep = list(cached_pages) or None
+        if pages_to_keep is None:
+            return
+        cache_key = page_cache.make_key(content_hash, pages_to_keep)
+        pdf_bytes = page_cache.get(cache_key)
+        if pdf_bytes is None:
+            self.merge_pdf_pages(set(pages_to_keep))
+            page_cache.set(cache_key, self.file_object.read())
+            self.file_object.seek(0)
+        else:
+            self._replace_file(cast(BinaryIO, BufferReader(pdf_bytes)))
+            self._map_pages(pages_to_keep)
+
+    def _find_pdf_pages(
+        self,
+        behavior: str,
+        on_min_pages: int,
+        page_indexes: Sequence,
+    ) -> Optional[List[int]]:
+        """Scan the PDF for the pages to keep, see ``find_pages``."""
+        if self.is_pdf_empty():
+            raise AssertionError(f"PDF pages are empty in: {self.filename}")
+        pages_to_keep = self.find_pages(behavior, on_min_pages, page_indexes)
+        if pages_to_keep is not None and behavior == REMOVE_BLANK:
+            logger.debug(
+                "Removing %s blank pages from: %s",
+                self.count_doc_pages() - len(pages_to_keep),
+                self.filename,
+            )
+        return pages_to_keep
+
+    def process_tiff(
+        self,
+        behavior: str,
+        on_min_pages: int,
+        page_indexes: Sequence,
+    ) -> None:
+        """
+        Select pages of a multi-page TIFF image, as for ``process_pdf``.
+
+        The file is left untouched if all of its pages are kept.
+        Otherwise, the indexes of the frames kept are recorded in ``page_map``.
+        """
+        pages_to_keep = self.find_pages(behavior, on_min_pages, page_indexes)
+        if pages_to_keep is not None and len(pages_to_keep) < self.metadata.page_count:
+            self.merge_tiff_pages(set(pages_to_keep))
+
+    def _map_pages(self, page_numbers: Iterable[int]) -> None:
+        """Record the original index of the pages which are kept."""
+        page_numbers = sorted(page_numbers)
+        if self.page_map is not None:
+            page_numbers = [self.page_map[page_n] for page_n in page_numbers]
+        self.page_map = page_numbers
+
+    def _replace_file(self, new_file: BinaryIO) -> None:
+        """Close the file and use new contents, forgetting what was read from it."""
+        self.file_object.close()
+        new_file.seek(0)
+        self.file_object = new_file
+        self._pdf_scan = None
+        self._metadata = None
+        self._content_hash = None
 
     def merge_pdf_pages(self, page_numbers: set) -> None:
-        pass
-#         """
-#         Create a new PDF from pages and set it to ``file_object``.
-
-#         :param page_numbers: List of pages number to use for merging in the original PDF.
-#         :return: None
-#         """
-#         self.file_object.seek(0)
-#         new_pdf = pikepdf.Pdf.new()
-#         with pikepdf.open(self.file_object) as pdf:
-#             for page_n in page_numbers:
-#                 page = pdf.pages[page_n]
-#                 new_pdf.pages.append(page)
-#         self.file_object.close()
-#         self.file_object = io.BytesIO()
-#         new_pdf.save(self.file_object)
+        """
+        Create a new PDF from pages and set it to ``file_object``.
+
+        :param page_numbers: List of pages number to use for merging in the original PDF.
+        :return: None
+        """
+        self.file_object.seek(0)
+        with pikepdf.open(self.file_object) as pdf:
+            new_file = _extract_pdf_pages(pdf, sorted(page_numbers))
+        self._replace_file(new_file)
+        self._map_pages(page_numbers)
+
+    def merge_tiff_pages(self, page_numbers: Set[int]) -> None:
+        """
+        Create a new TIFF image from pages and set it to ``file_object``.
+
+        Only the frames which are kept are decoded and encoded again,
+        with the compression of the original file when possible.
+
+        :param page_numbers: Indexes of the pages to keep in the original image
+        """
+        self.file_object.seek(0)
+        new_file = io.BytesIO()
+        with Image.open(self.file_object) as image:
+            frames = []
+            for page_n in sorted(page_numbers):
+                image.seek(page_n)
+                frame = image.copy()
+                frame.info = dict(image.info)
+                frames.append(frame)
+        compression = frames[0].info.get("compression", "raw")
+        if compression not in WRITABLE_TIFF_COMPRESSIONS or (
+            compression in ("group3", "group4")
+            and any(frame.mode != "1" for frame in frames)
+        ):
+            compression = "tiff_adobe_deflate"
+        save_options: Dict[str, Any] = {"compression": compression}
+        if "dpi" in frames[0].info:
+            save_options["dpi"] = frames[0].info["dpi"]
+        frames[0].save(
+            new_file,
+            format="TIFF",
+            save_all=True,
+            append_images=frames[1:],
+            **save_options,
+        )
+        self._replace_file(new_file)
+        self._map_pages(page_numbers)
+
+    def split_pdf(self, chunk_size: int) -> List["InputSource"]:
+        """
+        Split the PDF into smaller documents, the PDF is read only once.
+
+        :param chunk_size: Maximum number of pages in each document
+        :return: the documents, in page order
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.file_object.seek(0)
+        chunks: List[InputSource] = []
+        with pikepdf.open(self.file_object) as pdf:
+            pages_count = len(pdf.pages)
+            for first_page in range(0, pages_count, chunk_size):
+                chunk = BytesInput(
+                    _extract_pdf_pages(
+                        pdf,
+                        range(first_page, min(first_page + chunk_size, pages_count)),
+                    ).getbuffer(),
+                    self.filename,
+                )
+                chunk.filepath = self.filepath
+                chunks.append(chunk)
+        self.file_object.seek(0)
+        return chunks
 
     def is_pdf_empty(self) -> bool:
-        return True
-        
-    
-#         """
-#         Check if the PDF is empty.
-
-#         :return: ``True`` if the PDF is empty
-#         """
-#         self.file_object.seek(0)
-#         with pikepdf.open(self.file_object) as pdf:
-#             for page in pdf.pages:
-#                 # mypy incorrectly identifies the "/Length" key's value as
-#                 # an object rather than an int.
-#                 try:
-#                     total_size = page["/Contents"]["/Length"]
-#                 except ValueError:
-#                     total_size = 0  # type: ignore
-#                     for content in page["/Contents"]:  # type: ignore
-#                         total_size += content["/Length"]
-#                 has_data = total_size > 1000  # type: ignore
-
-#                 has_font = "/Font" in page["/Resources"].keys()
-#                 has_xobj = "/XObject" in page["/Resources"].keys()
-
-#                 if has_font or has_xobj or has_data:
-#                     return False
-#             return True
+        """
+        Check if the PDF is empty.
+
+        :return: ``True`` if the PDF is empty
+        """
+        pages_count, blank_pages = self._get_pdf_scan()
+        return len(blank_pages) == pages_count
+
+    def get_blank_pages(self) -> List[int]:
+        """
+        Find the pages of the PDF which have no content.
+
+        Pages are checked as for ``is_pdf_empty``.
+
+        :return: the indexes of the blank pages
+        """
+        return list(self._get_pdf_scan()[1])
+
+    def process_image(
+        self, max_size: Optional[int] = None, quality: int = IMAGE_QUALITY_DEFAULT
+    ) -> int:
+        """
+        Scale down the image and encode it again, to reduce the size of the upload.
+
+        The file is only replaced if the result is smaller.
+        Multi-page TIFF images are left untouched.
+
+        :param max_size: Maximum length of the longest side of the image, in pixels
+        :param quality: Quality used to encode JPEG, WEBP and TIFF images, from 1 to 100
+        :return: the number of bytes saved
+        """
+        metadata = self.metadata
+        if metadata.mimetype not in RESIZABLE_MIME_TYPES or metadata.width is None:
+            return 0
+        if metadata.page_count > 1:
+            logger.debug("Not processing multi-page image: %s", self.filename)
+            return 0
+        original_size = metadata.size
+        self.file_object.seek(0)
+        new_file = io.BytesIO()
+        with Image.open(self.file_object) as source_image:
+            image: Image.Image = source_image
+            image_format = source_image.format
+            save_options: Dict[str, Any] = {
+                key: image.info[key]
+                for key in ("exif", "icc_profile")
+                if key in image.info
+            }
+            if max_size and max(image.size) > max_size:
+                image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+            if image_format in ("JPEG", "WEBP"):
+                if image_format == "JPEG" and image.mode not in ("RGB", "L", "CMYK"):
+                    image = image.convert("RGB")
+                save_options.update(quality=quality, optimize=True)
+            elif image_format == "PNG":
+                save_options.update(optimize=True)
+            elif image_format == "TIFF":
+                save_options.pop("exif", None)
+                if image.mode in ("RGB", "L"):
+                    save_options.update(compression="jpeg", quality=quality)
+                else:
+                    save_options.update(compression="tiff_adobe_deflate")
+            image.save(new_file, format=image_format, **save_options)
+
+        bytes_saved = original_size - new_file.tell()
+        if bytes_saved <= 0:
+            logger.debug("Processing did not reduce the size of: %s", self.filename)
+            self.file_object.seek(0)
+            return 0
+        logger.debug("Saved %s bytes on: %s", bytes_saved, self.filename)
+        self._replace_file(new_file)
+        self.bytes_saved += bytes_saved
+        return bytes_saved
+
+    def optimize_pdf(
+        self,
+        max_dpi: Optional[int] = PDF_MAX_DPI_DEFAULT,
+        quality: int = IMAGE_QUALITY_DEFAULT,
+    ) -> Tuple[int, int]:
+        """
+        Reduce the size of the PDF, to reduce the size of the upload.
+
+        * embedded images with a resolution above ``max_dpi`` are scaled down
+        * identical images and forms are only kept once
+        * all streams are compressed again, objects are packed in object streams
+
+        The file is only replaced if the result is smaller.
+
+        :param max_dpi: Maximum resolution of images, in dots per inch,
+            if ``None`` images are not scaled down
+        :param quality: Quality used to encode the images which are scaled down
+        :return: a Tuple with the size of the file before and after
+        """
+        original_size = self.metadata.size
+        self.file_object.seek(0)
+        new_file = io.BytesIO()
+        with pikepdf.open(self.file_object) as pdf:
+            duplicates = _deduplicate_xobjects(pdf)
+            downsampled = 0
+            if max_dpi:
+                for xobject, dpi in _find_image_dpis(pdf).values():
+                    if dpi > max_dpi and _downsample_image(
+                        xobject, max_dpi / dpi, quality
+                    ):
+                        downsampled += 1
+            pdf.save(
+                new_file,
+                compress_streams=True,
+                recompress_flate=True,
+                object_stream_mode=pikepdf.ObjectStreamMode.generate,
+                static_id=True,
+            )
+        new_size = new_file.tell()
+        logger.debug(
+            "Optimized %s: %s images scaled down, %s duplicates removed, "
+            "%s bytes before, %s bytes after",
+            self.filename,
+            downsampled,
+            duplicates,
+            original_size,
+            new_size,
+        )
+        if new_size >= original_size:
+            self.file_object.seek(0)
+            return original_size, original_size
+        self._replace_file(new_file)
+        self.bytes_saved += original_size - new_size
+        return original_size, new_size
+
+    def is_memory_mapped(self) -> bool:
+        """:return: True if the file is mapped in memory."""
+        return isinstance(self.file_object, MemoryMapReader)
+
+    def content_hash(self) -> str:
+        """
+        Hash the contents of the input file, reading it in chunks.
+
+        Memory mapped files and buffers are hashed directly, without copies.
+        The hash is kept until the file is modified.
+
+        :return: the SHA-256 digest, as a hexadecimal string
+        """
+        if self._content_hash is not None:
+            return self._content_hash
+        hasher = hashlib.sha256()
+        if isinstance(self.file_object, BufferReader):
+            hasher.update(self.file_object.getbuffer())
+        else:
+            self.file_object.seek(0)
+            for chunk in iter(lambda: self.file_object.read(READ_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+            self.file_object.seek(0)
+        self._content_hash = hasher.hexdigest()
+        return self._content_hash
 
     def read_contents(self, close_file: bool) -> Tuple[str, bytes]:
         """
@@ -193,27 +769,38 @@ def __init__(self, file: BinaryIO):
 
 
 class PathInput(InputSource):
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, mmap: bool = False):
         """
         Input document from a path.
 
         :param filepath: Path to open
+        :param mmap: Map the file in memory instead of reading it.
+            The operating system then loads its pages on demand, and they are
+            not copied on the Python heap.
         """
-        self.file_object = open(filepath, "rb")  # pylint: disable=consider-using-with
+        if mmap and os.path.getsize(filepath) > 0:
+            with open(filepath, "rb") as file:
+                self.file_object = cast(BinaryIO, MemoryMapReader(file))
+        else:
+            self.file_object = open(  # pylint: disable=consider-using-with
+                filepath, "rb"
+            )
         self.filename = os.path.basename(filepath)
         self.filepath = filepath
         super().__init__(input_type=INPUT_TYPE_PATH)
 
 
 class BytesInput(InputSource):
-    def __init__(self, raw_bytes: bytes, filename: str):
+    def __init__(self, raw_bytes: TypeBuffer, filename: str):
         """
-        Input document from raw bytes (no buffer).
+        Input document from raw bytes.
 
-        :param raw_bytes: Raw data as bytes
+        The data is read in place, it must not be modified until the document is sent.
+
+        :param raw_bytes: Raw data as ``bytes``, ``bytearray`` or ``memoryview``
         :param filename: File name of the input
         """
-        self.file_object = io.BytesIO(raw_bytes)
+        self.file_object = cast(BinaryIO, BufferReader(raw_bytes))
         self.filename = filename
         self.filepath = None
         super().__init__(input_type=INPUT_TYPE_BYTES)
@@ -224,10 +811,13 @@ def __init__(self, base64_string: str, filename: str):
         """
         Input document from a base64 encoded string.
 
+        The string is decoded as it is read, use ``stream_upload`` on the client
+        so that it is never decoded as a whole.
+
         :param base64_string: Raw data as a base64 encoded string
         :param filename: File name of the input
         """
-        self.file_object = io.BytesIO(base64.standard_b64decode(base64_string))
+        self.file_object = cast(BinaryIO, Base64Reader(base64_string))
         self.filename = filename
         self.filepath = None
         super().__init__(input_type=INPUT_TYPE_BASE64)
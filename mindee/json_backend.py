@@ -0,0 +1,147 @@
+"""
+Encoding and decoding of JSON.
+
+The fastest library available is used:
+`orjson <https://github.com/ijl/orjson>`_ when it is installed,
+the standard library's ``json`` module otherwise.
+"""
+
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+TypeDefault = Optional[Callable[[Any], Any]]
+
+
+class JsonBackend:
+    """Base class for JSON libraries."""
+
+    name: str
+    """Name of the backend, as given to ``set_backend``."""
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Decode a JSON document.
+
+        :param data: The JSON document, as text or UTF-8 encoded bytes
+        """
+        raise NotImplementedError()
+
+    def dumps(self, obj: Any, pretty: bool = False, default: TypeDefault = None) -> str:
+        """
+        Encode an object to JSON.
+
+        :param obj: Object to encode
+        :param pretty: Indent with 2 spaces
+        :param default: Called to encode objects which are not natively supported,
+            e.g. ``serialize_for_json``
+        """
+        raise NotImplementedError()
+
+
+class StdlibJsonBackend(JsonBackend):
+    """The standard library's ``json`` module."""
+
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, pretty: bool = False, default: TypeDefault = None) -> str:
+        return json.dumps(obj, indent=2 if pretty else None, default=default)
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    The ``orjson`` library.
+
+    Encoded documents are the same as with the standard library, except that:
+
+    * non-ASCII characters are not escaped
+    * there are no spaces after separators, unless ``pretty`` is set
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError(
+                "The orjson backend requires the 'orjson' package, "
+                "install it using: pip install mindee[orjson]"
+            )
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any, pretty: bool = False, default: TypeDefault = None) -> str:
+        # Dates are passed to ``default``, as the standard library would do.
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+
+        def encode_other(value: Any) -> Any:
+            # Named tuples, such as geometry points, are arrays for the standard library.
+            if isinstance(value, tuple):
+                return list(value)
+            if default is None:
+                raise TypeError(
+                    f"Type is not JSON serializable: {type(value).__name__}"
+                )
+            return default(value)
+
+        return orjson.dumps(obj, default=encode_other, option=option).decode()
+
+
+BACKENDS: Dict[str, Callable[[], JsonBackend]] = {
+    StdlibJsonBackend.name: StdlibJsonBackend,
+    OrjsonBackend.name: OrjsonBackend,
+}
+
+_backend: JsonBackend = OrjsonBackend() if orjson is not None else StdlibJsonBackend()
+
+
+def get_backend() -> JsonBackend:
+    """:return: the backend currently in use."""
+    return _backend
+
+
+def set_backend(backend: Union[str, JsonBackend]) -> None:
+    """
+    Change the library used to encode and decode JSON, for the whole process.
+
+    :param backend: One of the ``BACKENDS`` names, or a custom backend instance
+    """
+    # Not a constant: the backend in use, changed for the whole process.
+    global _backend  # pylint: disable=global-statement,invalid-name
+    if isinstance(backend, str):
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Invalid JSON backend '{backend}', must be one of {', '.join(BACKENDS)}"
+            )
+        backend = BACKENDS[backend]()
+    _backend = backend
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Decode a JSON document, with the current backend.
+
+    :param data: The JSON document, as text or UTF-8 encoded bytes
+    """
+    return _backend.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False, default: TypeDefault = None) -> str:
+    """
+    Encode an object to JSON, with the current backend.
+
+    :param obj: Object to encode
+    :param pretty: Indent with 2 spaces
+    :param default: Called to encode objects which are not natively supported,
+        e.g. ``serialize_for_json``
+    """
+    return _backend.dumps(obj, pretty=pretty, default=default)
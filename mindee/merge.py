@@ -0,0 +1,93 @@
+"""Merging of the API responses for parts of a document into a single response."""
+
+import copy
+from typing import Any, Dict, List, Sequence, Tuple
+
+TypeResponse = Dict[str, Any]
+
+
+def _shift_page_ids(prediction: Any, offset: int) -> None:
+    """
+    Add an offset to all page IDs found in a prediction, in place.
+
+    :param prediction: Prediction JSON
+    :param offset: Number of pages preceding the chunk in the document
+    """
+    if isinstance(prediction, dict):
+        for key, value in prediction.items():
+            if key == "page_id" and isinstance(value, int):
+                prediction[key] = value + offset
+            else:
+                _shift_page_ids(value, offset)
+    elif isinstance(prediction, list):
+        for item in prediction:
+            _shift_page_ids(item, offset)
+
+
+def _is_filled(field: Dict[str, Any]) -> bool:
+    """Whether a field prediction holds a value."""
+    return field.get("value", True) not in (None, "N/A")
+
+
+def _merge_field(fields: List[Any]) -> Any:
+    """
+    Combine the predictions of a document-level field across chunks.
+
+    * lists of values are concatenated, in page order
+    * for single values, the most confident prediction is kept
+
+    :param fields: Predictions of the field, one per chunk, in page order
+    """
+    if all(isinstance(field, list) for field in fields):
+        return [item for field in fields for item in field]
+    if all(isinstance(field, dict) for field in fields):
+        if all(isinstance(field.get("values"), list) for field in fields):
+            merged = dict(fields[0])
+            merged["values"] = [value for field in fields for value in field["values"]]
+            return merged
+        filled = [field for field in fields if _is_filled(field)]
+        if filled:
+            return max(filled, key=lambda field: float(field.get("confidence") or 0))
+    return fields[0]
+
+
+def merge_predictions(responses: Sequence[Tuple[int, TypeResponse]]) -> TypeResponse:
+    """
+    Merge the responses for consecutive chunks of a PDF into a single response.
+
+    Pages keep their IDs in the original document.
+    Document-level fields are rebuilt from the predictions for each chunk.
+
+    :param responses: Tuples of the index of the first page of each chunk,
+        and the chunk's response JSON, in page order
+    :return: the response for the whole document
+    """
+    shifted = []
+    for offset, response in responses:
+        response = copy.deepcopy(response)
+        inference = response["document"]["inference"]
+        for page in inference["pages"]:
+            page["id"] += offset
+        _shift_page_ids(inference, offset)
+        shifted.append(response)
+
+    merged = dict(shifted[0])
+    merged["document"] = dict(shifted[0]["document"])
+    inference = dict(shifted[0]["document"]["inference"])
+    merged["document"]["inference"] = inference
+    inferences = [response["document"]["inference"] for response in shifted]
+
+    inference["pages"] = [page for chunk in inferences for page in chunk["pages"]]
+    predictions = [chunk["prediction"] for chunk in inferences]
+    field_names = dict.fromkeys(name for pred in predictions for name in pred)
+    inference["prediction"] = {
+        name: _merge_field([pred[name] for pred in predictions if name in pred])
+        for name in field_names
+    }
+    if "processing_time" in inference:
+        inference["processing_time"] = max(
+            chunk.get("processing_time") or 0 for chunk in inferences
+        )
+    if "n_pages" in merged["document"]:
+        merged["document"]["n_pages"] = len(inference["pages"])
+    return merged
@@ -0,0 +1,125 @@
+"""Streaming of ``multipart/form-data`` request bodies."""
+
+import io
+import os
+import uuid
+from typing import BinaryIO, Dict, List, Optional
+
+from mindee.input.sources import READ_CHUNK_SIZE, InputSource
+
+
+def _quote(value: str) -> str:
+    """Escape a value for use in a quoted header parameter."""
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r\n", " ")
+
+
+class MultipartStream(io.RawIOBase):
+    """
+    A ``multipart/form-data`` body, read lazily from a file object.
+
+    The file is never loaded into memory as a whole: it is read as the HTTP
+    library consumes the body, one block at a time.
+    The file object is not closed when the stream is.
+    """
+
+    boundary: str
+    """Separator between the parts of the body."""
+
+    def __init__(
+        self,
+        file_object: BinaryIO,
+        filename: str,
+        fields: Optional[Dict[str, str]] = None,
+        file_field: str = "document",
+        file_mimetype: str = "application/octet-stream",
+    ):
+        """
+        A ``multipart/form-data`` body, read lazily from a file object.
+
+        :param file_object: File to send, it is read from the start
+        :param filename: Name of the file, as sent to the server
+        :param fields: Other form fields to send, before the file
+        :param file_field: Name of the form field holding the file
+        :param file_mimetype: MIME type of the file
+        """
+        super().__init__()
+        self.boundary = uuid.uuid4().hex
+        head = b""
+        for name, value in (fields or {}).items():
+            head += (
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'
+                f"{value}\r\n"
+            ).encode()
+        head += (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(file_field)}"; '
+            f'filename="{_quote(filename)}"\r\n'
+            f"Content-Type: {file_mimetype}\r\n\r\n"
+        ).encode()
+        tail = f"\r\n--{self.boundary}--\r\n".encode()
+
+        file_object.seek(0, os.SEEK_END)
+        file_size = file_object.tell()
+        file_object.seek(0)
+        self._parts: List[BinaryIO] = [io.BytesIO(head), file_object, io.BytesIO(tail)]
+        self._part_index = 0
+        self._size = len(head) + file_size + len(tail)
+        self._position = 0
+
+    @classmethod
+    def from_input_source(
+        cls, input_source: InputSource, fields: Optional[Dict[str, str]] = None
+    ) -> "MultipartStream":
+        """
+        Build the body to send an input document in the ``document`` field.
+
+        :param input_source: Input object
+        :param fields: Other form fields to send
+        """
+        return cls(
+            input_source.file_object,
+            input_source.filename,
+            fields=fields,
+            file_mimetype=input_source.file_mimetype,
+        )
+
+    @property
+    def content_type(self) -> str:
+        """Value of the ``Content-Type`` header to send with the body."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """
+        Read the next part of the body.
+
+        :param size: Maximum number of bytes to read, if negative read until the end
+        """
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(READ_CHUNK_SIZE), b""))
+        chunks = []
+        remaining = size
+        while remaining > 0 and self._part_index < len(self._parts):
+            chunk = self._parts[self._part_index].read(remaining)
+            if not chunk:
+                self._part_index += 1
+                continue
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        data = b"".join(chunks)
+        self._position += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
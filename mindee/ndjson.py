@@ -0,0 +1,206 @@
+"""Streaming of responses to newline-delimited JSON files."""
+
+import gzip
+import os
+import threading
+from typing import IO, Iterable, List, Optional, Union
+
+from mindee import json_backend
+from mindee.batch import BatchParseError
+from mindee.documents.base import serialize_for_json
+from mindee.logger import logger
+from mindee.response import PredictResponse
+
+OUTPUT_RAW = "raw"
+OUTPUT_PARSED = "parsed"
+
+OUTPUT_TYPES = [OUTPUT_RAW, OUTPUT_PARSED]
+
+NDJSON_BUFFER_SIZE_DEFAULT = 64 * 1024
+
+
+def part_path(path: str, part_n: int) -> str:
+    """
+    Path of a part of a rotated file, numbered before the extensions.
+
+    e.g. ``results.ndjson.gz`` -> ``results-00002.ndjson.gz``
+
+    :param path: Path given to the writer
+    :param part_n: Index of the part, from 0
+    """
+    base, extension = os.path.splitext(path)
+    if extension == ".gz":
+        base, inner_extension = os.path.splitext(base)
+        extension = inner_extension + extension
+    return f"{base}-{part_n:05d}{extension}"
+
+
+class NdjsonWriter:
+    """
+    Write responses to a file as they come, one JSON document per line.
+
+    Lines are buffered in memory, and written when the buffer is full,
+    on ``flush`` and on ``close``: only the buffered lines are lost if the
+    process stops. Use as a context manager to always close the file.
+    Safe to share between threads.
+    """
+
+    path: str
+    """Path given to the writer, see ``paths`` for the files actually written."""
+    output_type: str
+    compress: bool
+    max_bytes: Optional[int]
+    paths: List[str]
+    """Paths of the files written so far, in order."""
+    lines_written: int = 0
+    """Number of responses written."""
+
+    def __init__(
+        self,
+        path: str,
+        output_type: str = OUTPUT_RAW,
+        compress: bool = False,
+        max_bytes: Optional[int] = None,
+        buffer_size: int = NDJSON_BUFFER_SIZE_DEFAULT,
+    ):
+        """
+        Write responses to a newline-delimited JSON file.
+
+        :param path: Path of the file, it is overwritten
+        :param output_type: Content of each line, one of:
+
+            * ``raw``: the HTTP response, as returned by the API
+            * ``parsed``: the document, as serialized by ``serialize_for_json``
+
+            Failed responses are always written raw.
+
+        :param compress: Compress the file with gzip,
+            ``path`` should end with ``.gz``
+        :param max_bytes: Start a new file when the current one would exceed
+            this size, before compression.
+            Files are then numbered, e.g. ``results-00000.ndjson``.
+        :param buffer_size: Size of the lines kept in memory before they are
+            written, in bytes. ``0`` writes each line immediately.
+        """
+        if output_type not in OUTPUT_TYPES:
+            raise ValueError(
+                f"Invalid output type '{output_type}', "
+                f"must be one of {', '.join(OUTPUT_TYPES)}"
+            )
+        self.path = path
+        self.output_type = output_type
+        self.compress = compress
+        self.max_bytes = max_bytes
+        self.buffer_size = buffer_size
+        self.paths = []
+        self._buffer: List[bytes] = []
+        self._buffered_size = 0
+        self._file_size = 0
+        self._raw_file: Optional[IO[bytes]] = None
+        self._file: Optional[Union[IO[bytes], gzip.GzipFile]] = None
+        self._lock = threading.Lock()
+        self._open_next()
+
+    def __enter__(self) -> "NdjsonWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _open_next(self) -> None:
+        """Open the next file, closing the current one."""
+        self._close_file()
+        if self.max_bytes is None:
+            path = self.path
+        else:
+            path = part_path(self.path, len(self.paths))
+        logger.debug("Writing responses to %s", path)
+        # Lines are buffered by the writer itself.
+        self._raw_file = open(  # pylint: disable=consider-using-with
+            path, "wb", buffering=0
+        )
+        if self.compress:
+            self._file = gzip.GzipFile(fileobj=self._raw_file, mode="wb")
+        else:
+            self._file = self._raw_file
+        self._file_size = 0
+        self.paths.append(path)
+
+    def _close_file(self) -> None:
+        if self._file is None:
+            return
+        self._write_buffer()
+        self._file.close()
+        if self._raw_file is not self._file and self._raw_file is not None:
+            self._raw_file.close()
+        self._file = None
+        self._raw_file = None
+
+    def _write_buffer(self) -> None:
+        if self._buffer and self._file is not None:
+            self._file.write(b"".join(self._buffer))
+            self._buffer = []
+            self._buffered_size = 0
+
+    def _encode(self, response: PredictResponse) -> bytes:
+        if self.output_type == OUTPUT_PARSED and response.document is not None:
+            line = json_backend.dumps(response.document, default=serialize_for_json)
+        else:
+            line = json_backend.dumps(response.http_response)
+        return (line + "\n").encode("utf-8")
+
+    def write(self, response: PredictResponse) -> None:
+        """
+        Add a response to the file.
+
+        :param response: The response, typically as soon as it is received
+        """
+        line = self._encode(response)
+        with self._lock:
+            if self._file is None:
+                raise ValueError("Writing to a closed NdjsonWriter")
+            if (
+                self.max_bytes is not None
+                and self._file_size > 0
+                and self._file_size + len(line) > self.max_bytes
+            ):
+                self._open_next()
+            self._buffer.append(line)
+            self._buffered_size += len(line)
+            self._file_size += len(line)
+            self.lines_written += 1
+            if self._buffered_size >= self.buffer_size:
+                self._write_buffer()
+
+    def write_all(
+        self, responses: Iterable[Union[PredictResponse, BatchParseError]]
+    ) -> int:
+        """
+        Add responses to the file, as they are yielded.
+
+        Batch errors are logged and skipped, so that the results of
+        ``Client.parse_many`` can be passed directly.
+
+        :param responses: The responses, e.g. from a generator
+        :return: the number of responses written
+        """
+        count = 0
+        for response in responses:
+            if isinstance(response, BatchParseError):
+                logger.warning("Not written, parsing failed: %s", response)
+                continue
+            self.write(response)
+            count += 1
+        return count
+
+    def flush(self) -> None:
+        """Write the buffered lines, so that they are readable from the file."""
+        with self._lock:
+            self._write_buffer()
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Write the buffered lines and close the file."""
+        with self._lock:
+            self._close_file()
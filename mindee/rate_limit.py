@@ -0,0 +1,106 @@
+"""Client-side limiting of the request rate."""
+
+import asyncio
+import math
+import threading
+import time
+from typing import Dict, Optional
+
+from mindee.logger import logger
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter.
+
+    Can be shared between threads and used from ``asyncio`` coroutines.
+    """
+
+    rate: float
+    """Number of requests allowed per second, on average."""
+    burst: int
+    """Maximum number of requests which can be made at once."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Token bucket rate limiter.
+
+        :param rate: Number of requests allowed per second, on average
+        :param burst: Maximum number of requests which can be made at once,
+            defaults to the rate, rounded up
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, math.ceil(rate))
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Take a token from the bucket.
+
+        The bucket may go into debt, so that callers are served in order.
+
+        :return: how long to wait before using the token, in seconds
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.burst), self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request can be made."""
+        delay = self._reserve()
+        if delay > 0:
+            logger.debug("Rate limited, waiting %.2f seconds", delay)
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait until a request can be made, without blocking the event loop."""
+        delay = self._reserve()
+        if delay > 0:
+            logger.debug("Rate limited, waiting %.2f seconds", delay)
+            await asyncio.sleep(delay)
+
+
+_RATE_LIMITERS: Dict[str, RateLimiter] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(
+    api_key: str, rate: float, burst: Optional[int] = None
+) -> RateLimiter:
+    """
+    Get the rate limiter for an API key, creating it if needed.
+
+    All clients using the same API key in the process share the same limiter,
+    the settings given when it is first created are kept.
+
+    :param api_key: The API key
+    :param rate: Number of requests allowed per second, on average
+    :param burst: Maximum number of requests which can be made at once
+    """
+    with _RATE_LIMITERS_LOCK:
+        try:
+            limiter = _RATE_LIMITERS[api_key]
+        except KeyError:
+            limiter = RateLimiter(rate, burst)
+            _RATE_LIMITERS[api_key] = limiter
+    if limiter.rate != rate or (burst is not None and limiter.burst != burst):
+        logger.warning(
+            "A rate limiter already exists for this API key, keeping its settings: "
+            "rate=%s burst=%s",
+            limiter.rate,
+            limiter.burst,
+        )
+    return limiter
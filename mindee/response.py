@@ -1,11 +1,75 @@
-from typing import Any, Dict, Generic, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
 
-from mindee.documents.base import TypeDocument
+from mindee.documents.base import TypeApiPrediction, TypeDocument
 from mindee.documents.config import DocumentConfig
+from mindee.input.metadata import InputFileInfo
 from mindee.input.sources import InputSource
 from mindee.logger import logger
 
 
+class LazyPages(Sequence[TypeDocument]):
+    """
+    Pages of a response, each page object is only built when it is first accessed.
+
+    Behaves as a read-only list, but is not a ``list``: use ``list(pages)`` to get one.
+    """
+
+    def __init__(
+        self,
+        api_pages: List[TypeApiPrediction],
+        build_page: Callable[[TypeApiPrediction], TypeDocument],
+    ):
+        """
+        Pages of a response, built on first access.
+
+        :param api_pages: Raw predictions for each page
+        :param build_page: Function building a page object from its prediction
+        """
+        self._api_pages = api_pages
+        self._build_page = build_page
+        self._pages: List[Optional[TypeDocument]] = [None] * len(api_pages)
+
+    def __len__(self) -> int:
+        return len(self._api_pages)
+
+    @overload
+    def __getitem__(self, index: int) -> TypeDocument:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[TypeDocument]:
+        ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[TypeDocument, List[TypeDocument]]:
+        if isinstance(index, slice):
+            return [self[page_n] for page_n in range(*index.indices(len(self)))]
+        page = self._pages[index]
+        if page is None:
+            page = self._build_page(self._api_pages[index])
+            self._pages[index] = page
+        return page
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, LazyPages)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class PredictResponse(Generic[TypeDocument]):
     """
     Response of a prediction request.
@@ -15,6 +79,8 @@ class PredictResponse(Generic[TypeDocument]):
 
     http_response: Dict[str, Any]
     """Raw HTTP response JSON"""
+    response_ok: bool
+    """Whether the request succeeded"""
     document_type: str
     """Document type"""
     input_path: Optional[str] = None
@@ -23,10 +89,21 @@ class PredictResponse(Generic[TypeDocument]):
     """Name of the input file"""
     input_mimetype: Optional[str] = None
     """MIME type of the input file"""
-    document: Optional[TypeDocument]
-    """An instance of the ``Document`` class, according to the type given."""
-    pages: List[TypeDocument]
-    """A list of instances of the ``Document`` class, according to the type given."""
+    input_bytes_saved: int = 0
+    """Number of bytes removed from the input file by processing, before sending it"""
+    input_page_map: Optional[List[int]] = None
+    """
+    Index in the input file of each page sent, set if pages were removed before
+    sending it
+    """
+    pages: Sequence[TypeDocument]
+    """
+    A sequence of instances of the ``Document`` class, according to the type given.
+
+    Each page is only built when it is first accessed.
+    """
+    _doc_config: Optional[DocumentConfig] = None
+    _document: Optional[TypeDocument] = None
 
     def __init__(
         self,
@@ -41,10 +118,12 @@ def __init__(
         :param doc_config: DocumentConfig
         :param input_source: Input object
         :param http_response: json response from HTTP call
+        :param response_ok: Whether the request succeeded
         """
         logger.debug("Handling API response")
 
         self.http_response = http_response
+        self.response_ok = response_ok
         self.document_type = doc_config.document_type
         self.pages = []
 
@@ -52,31 +131,59 @@ def __init__(
             self.input_path = input_source.filepath
             self.input_filename = input_source.filename
             self.input_mimetype = input_source.file_mimetype
+            self.input_bytes_saved = input_source.bytes_saved
+            self.input_page_map = input_source.page_map
+
+        if response_ok:
+            self._doc_config = doc_config
+            self.pages = LazyPages(
+                self.http_response["document"]["inference"]["pages"],
+                lambda api_page: self._build_document(
+                    doc_config, api_page, api_page["id"]
+                ),
+            )
+
+    @property
+    def document(self) -> Optional[TypeDocument]:
+        """
+        An instance of the ``Document`` class, according to the type given.
+
+        It is only built when it is first accessed, ``None`` if the request failed.
+        """
+        if self._document is None and self._doc_config is not None:
+            self._document = self._build_document(
+                self._doc_config, self.http_response["document"]["inference"], None
+            )
+        return self._document
 
-        if not response_ok:
-            self.document = None
-        else:
-            self._load_response(doc_config, input_source)
+    def get_input_page_n(self, page_n: int) -> int:
+        """
+        Find the index of a page in the input file, before pages were removed.
+
+        :param page_n: Index of the page in the response,
+            e.g. ``pages[i].orientation.page_n``
+        """
+        if self.input_page_map is None:
+            return page_n
+        return self.input_page_map[page_n]
 
-    def _load_response(
+    def _build_document(
         self,
         doc_config: DocumentConfig,
-        input_source: InputSource,
-    ) -> None:
-        for api_page in self.http_response["document"]["inference"]["pages"]:
-            self.pages.append(
-                # https://github.com/python/mypy/issues/13596
-                doc_config.document_class(  # type: ignore
-                    api_prediction=api_page,
-                    input_source=input_source,
-                    document_type=doc_config.document_type,
-                    page_n=api_page["id"],
-                )
-            )
+        api_prediction: TypeApiPrediction,
+        page_n: Optional[int],
+    ) -> TypeDocument:
+        # The input is not kept, so that its contents can be freed.
+        input_info = InputFileInfo(
+            filepath=self.input_path,
+            filename=self.input_filename,
+            file_mimetype=self.input_mimetype,
+        )
         # https://github.com/python/mypy/issues/13596
-        self.document = doc_config.document_class(  # type: ignore
-            api_prediction=self.http_response["document"]["inference"],
-            input_source=input_source,
+        document: TypeDocument = doc_config.document_class(  # type: ignore
+            api_prediction=api_prediction,
+            input_source=input_info,
             document_type=doc_config.document_type,
-            page_n=None,
+            page_n=page_n,
         )
+        return document
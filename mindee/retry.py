@@ -0,0 +1,137 @@
+"""Retrying of failed HTTP requests."""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Collection, Optional
+
+RETRY_STATUS_CODES_DEFAULT = (429, 502, 503, 504)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse the value of a ``Retry-After`` header.
+
+    :param value: Header value, either a number of seconds or an HTTP date
+    :return: the number of seconds to wait, or ``None`` if it could not be parsed
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=timezone.utc)
+    return max((retry_date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request.
+
+    Delays grow exponentially: ``backoff_base * 2 ** (attempt - 1)``,
+    capped at ``backoff_cap``.
+    """
+
+    max_attempts: int
+    """Maximum number of attempts, including the first one."""
+    backoff_base: float
+    """Delay before the first retry, in seconds."""
+    backoff_cap: float
+    """Maximum delay between two attempts, in seconds."""
+    jitter: bool
+    """Whether to wait a random duration between 0 and the computed delay."""
+    status_codes: Collection[int]
+    """HTTP status codes for which a request is retried."""
+    respect_retry_after: bool
+    """
+    Whether to wait for the duration given by the server's ``Retry-After`` header.
+    It is not capped at ``backoff_cap``.
+    """
+    max_retry_after: Optional[float]
+    """
+    Longest ``Retry-After`` delay waited for, in seconds.
+    The request is not retried when the server asks to wait longer.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        jitter: bool = True,
+        status_codes: Collection[int] = RETRY_STATUS_CODES_DEFAULT,
+        respect_retry_after: bool = True,
+        max_retry_after: Optional[float] = None,
+    ):
+        """
+        When and how long to wait before retrying a failed request.
+
+        Connection errors are always retried, including timeouts while connecting,
+        as nothing was sent. Timeouts while waiting for the response never are.
+
+        :param max_attempts: Maximum number of attempts, including the first one
+        :param backoff_base: Delay before the first retry, in seconds
+        :param backoff_cap: Maximum delay between two attempts, in seconds
+        :param jitter: Whether to wait a random duration between 0 and the computed delay
+        :param status_codes: HTTP status codes for which a request is retried
+        :param respect_retry_after: Whether to wait for the duration given by the server's
+            ``Retry-After`` header as given, rather than the computed delay
+        :param max_retry_after: Longest ``Retry-After`` delay waited for, in seconds.
+            The request is not retried when the server asks to wait longer.
+            ``None``: no limit.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.status_codes = status_codes
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def should_retry(
+        self,
+        attempt: int,
+        status_code: Optional[int] = None,
+        retry_after: Optional[str] = None,
+    ) -> bool:
+        """
+        Whether a request should be attempted again.
+
+        :param attempt: Number of the attempt which failed, starting at 1
+        :param status_code: HTTP status code received, ``None`` on connection errors
+        :param retry_after: Value of the ``Retry-After`` header, if any
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if status_code is not None and status_code not in self.status_codes:
+            return False
+        if self.respect_retry_after and self.max_retry_after is not None:
+            server_delay = parse_retry_after(retry_after)
+            if server_delay is not None and server_delay > self.max_retry_after:
+                return False
+        return True
+
+    def get_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        How long to wait before the next attempt.
+
+        :param attempt: Number of the attempt which failed, starting at 1
+        :param retry_after: Value of the ``Retry-After`` header, if any
+        :return: the delay, in seconds
+        """
+        if self.respect_retry_after:
+            server_delay = parse_retry_after(retry_after)
+            if server_delay is not None:
+                return server_delay
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
@@ -3,6 +3,7 @@
 import pytest
 
 from mindee.documents.financial.financial_v1 import FinancialV1
+from mindee.input.sources import BytesInput
 from tests.documents.test_invoice_v3 import (
     FILE_PATH_INVOICE_V3_COMPLETE,
     FILE_PATH_INVOICE_V3_EMPTY,
@@ -11,6 +12,7 @@
     FILE_PATH_RECEIPT_V3_COMPLETE,
     FILE_PATH_RECEIPT_V3_EMPTY,
 )
+from tests.utils import make_pdf
 
 
 @pytest.fixture
@@ -283,3 +285,11 @@ def test_invoice_or_receipt_get_same_field_types(receipt_pred, invoice_pred):
         assert isinstance(
             receipt_attr, type(invoice_attr)
         ), f"Types do not match for: {key}"
+
+
+def test_get_endpoint_from_contents():
+    endpoints = ["invoice", "receipt"]
+    pdf_input = BytesInput(make_pdf(1), "scan.jpg")
+    assert FinancialV1.get_endpoint(endpoints, pdf_input) == "invoice"
+    image_input = BytesInput(b"\xff\xd8\xff\xe0 not a pdf", "scan.pdf")
+    assert FinancialV1.get_endpoint(endpoints, image_input) == "receipt"
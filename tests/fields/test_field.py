@@ -1,5 +1,9 @@
+import json
+
 import pytest
 
+from mindee.documents.base import serialize_for_json
+from mindee.documents.invoice.line_item import InvoiceLineItem
 from mindee.fields.base import (
     BaseField,
     field_array_confidence,
@@ -7,8 +11,14 @@
     float_to_string,
 )
 from mindee.fields.company_registration import CompanyRegistrationField
+from mindee.fields.date import DateField
+from mindee.fields.position import PositionField
+from mindee.fields.tax import TaxField
 from mindee.fields.text import TextField
 
+POLYGON = [[0.1, 0.1], [0.3, 0.1], [0.3, 0.12], [0.1, 0.12]]
+POLYGON_JSON = "[[0.1, 0.1], [0.3, 0.1], [0.3, 0.12], [0.1, 0.12]]"
+
 
 def test_constructor():
     field_dict = {
@@ -99,3 +109,83 @@ def test_float_to_string():
     # should not work on integer values
     with pytest.raises(IndexError):
         float_to_string(1)
+
+
+def test_slots():
+    field_dict = {
+        "value": "test",
+        "type": "IBAN",
+        "confidence": 0.1,
+        "polygon": [[0.016, 0.707], [0.414, 0.707], [0.414, 0.831], [0.016, 0.831]],
+    }
+    field = CompanyRegistrationField(field_dict)
+    assert not hasattr(field, "__dict__")
+    with pytest.raises(AttributeError):
+        field.unknown = "value"
+    # Rectangles share their corners with their bounding box
+    assert all(
+        corner is point for corner, point in zip(field.bounding_box, field.polygon)
+    )
+
+
+# Output of the fields before they had slots, when ``vars`` was serialized.
+@pytest.mark.parametrize(
+    "field_class,prediction,expected",
+    [
+        (
+            TaxField,
+            {
+                "value": 2.0,
+                "rate": 20.0,
+                "code": "VAT",
+                "confidence": 0.9,
+                "polygon": POLYGON,
+                "page_id": 0,
+            },
+            '{"page_n": 0, "reconstructed": false, "value": 2.0, "confidence": 0.9, "bounding_box": {P}, "polygon": {P}, "rate": 20.0, "code": "VAT", "basis": null}',
+        ),
+        (
+            TaxField,
+            {"value": "N/A", "rate": 20.0, "confidence": 0.9, "polygon": []},
+            '{"reconstructed": false, "bounding_box": null, "polygon": [], "rate": 20.0, "code": null, "basis": null, "value": null, "confidence": 0.0}',
+        ),
+        (
+            DateField,
+            {"value": "2023-01-06", "confidence": 0.9, "polygon": POLYGON},
+            '{"reconstructed": false, "value": "2023-01-06", "confidence": 0.9, "bounding_box": {P}, "polygon": {P}, "date_object": "2023-01-06"}',
+        ),
+        (
+            DateField,
+            {"value": "06/01/2023", "page_id": 1},
+            '{"page_n": 1, "reconstructed": false, "value": "06/01/2023", "bounding_box": null, "polygon": [], "date_object": null, "confidence": 0.0}',
+        ),
+        (
+            PositionField,
+            {"polygon": POLYGON, "confidence": 0.9},
+            '{"reconstructed": false, "value": {P}, "confidence": 0.9, "bounding_box": null, "quadrangle": null, "rectangle": null, "polygon": {P}}',
+        ),
+        (
+            PositionField,
+            {"bounding_box": POLYGON},
+            '{"reconstructed": false, "bounding_box": {P}, "quadrangle": null, "rectangle": null, "polygon": null, "value": null}',
+        ),
+        (
+            InvoiceLineItem,
+            {
+                "description": "Item",
+                "page_id": 1,
+                "product_code": None,
+                "quantity": 1,
+                "tax_amount": None,
+                "tax_rate": None,
+                "total_amount": 10,
+                "unit_price": 10,
+            },
+            '{"bounding_box": null, "polygon": [], "page_n": 1, "product_code": null, "description": "Item", "quantity": 1.0, "unit_price": 10.0, "total_amount": 10.0, "tax_rate": null, "tax_amount": null}',
+        ),
+    ],
+)
+def test_serialize_for_json(field_class, prediction, expected):
+    field = field_class(prediction)
+    encoded = json.dumps(field, default=serialize_for_json)
+    assert encoded == expected.replace("{P}", POLYGON_JSON)
@@ -0,0 +1,226 @@
+import asyncio
+import threading
+
+import pytest
+
+from mindee import documents
+from mindee.cache import MemoryCache
+from mindee.endpoints import BASE_URL_ENV_NAME, HTTPException
+from mindee.retry import RetryPolicy
+from tests.utils import clear_envvars, dummy_custom_response
+
+web = pytest.importorskip("aiohttp.web")
+async_client = pytest.importorskip("mindee.async_client")
+
+
+async def _start_server(status: int = 201, failures: int = 0):
+    requests_seen = []
+
+    async def predict(request):
+        form = await request.post()
+        requests_seen.append(form["document"].filename)
+        if len(requests_seen) <= failures:
+            return web.json_response({}, status=503, headers={"Retry-After": "0"})
+        await asyncio.sleep(0.05)
+        return web.json_response(dummy_custom_response(2), status=status)
+
+    app = web.Application()
+    app.router.add_post("/products/dummy/dummy/v1/predict", predict)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}", requests_seen
+
+
+@pytest.fixture
+def receipt_path(tmp_path):
+    path = tmp_path / "receipt.jpg"
+    path.write_bytes(b"\xff\xd8\xff\xe0 not really a jpeg")
+    return str(path)
+
+
+def test_async_parse_concurrent(monkeypatch, receipt_path):
+    clear_envvars(monkeypatch)
+
+    async def run():
+        runner, base_url, requests_seen = await _start_server()
+        monkeypatch.setenv(BASE_URL_ENV_NAME, base_url)
+        async with async_client.AsyncClient("dummy") as client:
+            client.add_endpoint(endpoint_name="dummy", account_name="dummy")
+            results = await asyncio.gather(
+                *[
+                    client.doc_from_path(receipt_path).parse(
+                        documents.TypeCustomV1, endpoint_name="dummy"
+                    )
+                    for _ in range(10)
+                ]
+            )
+        await runner.cleanup()
+        return results, requests_seen
+
+    results, requests_seen = asyncio.run(run())
+    assert len(requests_seen) == 10
+    assert requests_seen[0] == "receipt.jpg"
+    for result in results:
+        assert len(result.pages) == 2
+        assert result.document.fields["plate"].contents_string() == "page0"
+
+
+def test_async_parse_error(monkeypatch, receipt_path):
+    clear_envvars(monkeypatch)
+
+    async def run(raise_on_error: bool):
+        runner, base_url, _ = await _start_server(status=401)
+        monkeypatch.setenv(BASE_URL_ENV_NAME, base_url)
+        client = async_client.AsyncClient("dummy", raise_on_error=raise_on_error)
+        client.add_endpoint(endpoint_name="dummy", account_name="dummy")
+        try:
+            return await client.doc_from_path(receipt_path).parse(
+                documents.TypeCustomV1, endpoint_name="dummy"
+            )
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    with pytest.raises(HTTPException):
+        asyncio.run(run(raise_on_error=True))
+    result = asyncio.run(run(raise_on_error=False))
+    assert result.document is None
+
+
+def test_async_parse_retry(monkeypatch, receipt_path):
+    clear_envvars(monkeypatch)
+
+    async def run():
+        runner, base_url, requests_seen = await _start_server(failures=2)
+        monkeypatch.setenv(BASE_URL_ENV_NAME, base_url)
+        async with async_client.AsyncClient(
+            "dummy", retry_policy=RetryPolicy(max_attempts=3)
+        ) as client:
+            client.add_endpoint(endpoint_name="dummy", account_name="dummy")
+            input_doc = client.doc_from_path(receipt_path)
+            result = await input_doc.parse(
+                documents.TypeCustomV1, endpoint_name="dummy"
+            )
+        await runner.cleanup()
+        return result, input_doc, requests_seen
+
+    result, input_doc, requests_seen = asyncio.run(run())
+    assert len(requests_seen) == 3
+    assert result.document is not None
+    assert input_doc.input_doc.file_object.closed
+
+
+def test_async_stream_upload(monkeypatch, receipt_path):
+    clear_envvars(monkeypatch)
+
+    async def run():
+        runner, base_url, requests_seen = await _start_server(failures=1)
+        monkeypatch.setenv(BASE_URL_ENV_NAME, base_url)
+        async with async_client.AsyncClient(
+            "dummy",
+            stream_upload=True,
+            retry_policy=RetryPolicy(max_attempts=2, backoff_base=0),
+        ) as client:
+            client.add_endpoint(endpoint_name="dummy", account_name="dummy")
+            result = await client.doc_from_path(receipt_path).parse(
+                documents.TypeCustomV1, endpoint_name="dummy"
+            )
+        await runner.cleanup()
+        return result, requests_seen
+
+    result, requests_seen = asyncio.run(run())
+    assert requests_seen == ["receipt.jpg", "receipt.jpg"]
+    assert len(result.pages) == 2
+
+
+def test_async_parse_cache(monkeypatch, receipt_path):
+    clear_envvars(monkeypatch)
+    cache_threads = []
+
+    class ThreadCache(MemoryCache):
+        def get(self, key):
+            cache_threads.append(threading.current_thread())
+            return super().get(key)
+
+        def set(self, key, response):
+            cache_threads.append(threading.current_thread())
+            super().set(key, response)
+
+    async def run():
+        runner, base_url, requests_seen = await _start_server()
+        monkeypatch.setenv(BASE_URL_ENV_NAME, base_url)
+        async with async_client.AsyncClient(
+            "dummy", cache=ThreadCache(max_size=1_000_000)
+        ) as client:
+            client.add_endpoint(endpoint_name="dummy", account_name="dummy")
+            results = [
+                await client.doc_from_path(receipt_path).parse(
+                    documents.TypeCustomV1, endpoint_name="dummy"
+                )
+                for _ in range(2)
+            ]
+        await runner.cleanup()
+        return results, requests_seen
+
+    results, requests_seen = asyncio.run(run())
+    assert len(requests_seen) == 1
+    assert results[0].http_response == results[1].http_response
+    # The cache is only used outside of the event loop thread.
+    assert len(cache_threads) == 3
+    assert threading.main_thread() not in cache_threads
+
+
+def test_async_retry_connect_timeout(monkeypatch, receipt_path):
+    clear_envvars(monkeypatch)
+    timeouts = [
+        async_client.aiohttp.ServerTimeoutError("Connection timeout to host"),
+        async_client.aiohttp.ServerTimeoutError("Timeout on reading data from socket"),
+    ]
+
+    async def run():
+        runner, base_url, requests_seen = await _start_server()
+        monkeypatch.setenv(BASE_URL_ENV_NAME, base_url)
+        post = async_client.aiohttp.ClientSession.post
+
+        def failing_post(self, *args, **kwargs):
+            if timeouts:
+                raise timeouts.pop(0)
+            return post(self, *args, **kwargs)
+
+        monkeypatch.setattr(async_client.aiohttp.ClientSession, "post", failing_post)
+        monkeypatch.setattr(
+            async_client,
+            "_is_connect_timeout",
+            lambda error: "Connection" in str(error),
+        )
+        async with async_client.AsyncClient(
+            "dummy", retry_policy=RetryPolicy(max_attempts=3, backoff_base=0)
+        ) as client:
+            client.add_endpoint(endpoint_name="dummy", account_name="dummy")
+            try:
+                # Connect timeouts are retried, read timeouts are not.
+                with pytest.raises(async_client.aiohttp.ServerTimeoutError):
+                    await client.doc_from_path(receipt_path).parse(
+                        documents.TypeCustomV1, endpoint_name="dummy"
+                    )
+                await client.doc_from_path(receipt_path).parse(
+                    documents.TypeCustomV1, endpoint_name="dummy"
+                )
+            finally:
+                await runner.cleanup()
+        return requests_seen
+
+    assert len(asyncio.run(run())) == 1
+
+
+def test_is_connect_timeout():
+    aiohttp = async_client.aiohttp
+    if hasattr(aiohttp, "ConnectionTimeoutError"):
+        assert async_client._is_connect_timeout(aiohttp.ConnectionTimeoutError())
+        assert not async_client._is_connect_timeout(aiohttp.SocketTimeoutError())
+    assert not async_client._is_connect_timeout(
+        aiohttp.ServerTimeoutError("Timeout on reading data from socket")
+    )
@@ -0,0 +1,235 @@
+import threading
+import time
+
+import pytest
+
+from mindee import Client, documents
+from mindee.batch import BatchParseError, InFlightRequests
+from mindee.cache import DiskCache
+from mindee.input.directory import DirectoryInput
+from mindee.input.sources import BytesInput, MimeTypeError
+from mindee.response import PredictResponse
+from tests.utils import clear_envvars, dummy_custom_response, fake_response
+
+
+@pytest.fixture
+def custom_client(monkeypatch):
+    clear_envvars(monkeypatch)
+    client = Client("dummy").add_endpoint(
+        endpoint_name="dummy",
+        account_name="dummy",
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def image_paths(tmp_path):
+    paths = []
+    for idx in range(6):
+        path = tmp_path / f"receipt_{idx}.jpg"
+        path.write_bytes(b"\xff\xd8\xff\xe0" + bytes([idx]) * 64)
+        paths.append(str(path))
+    return paths
+
+
+def test_parse_many(monkeypatch, custom_client, image_paths, tmp_path):
+    invalid_path = tmp_path / "invalid.txt"
+    invalid_path.write_text("not a document")
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = []
+
+    def request(method, url, **kwargs):
+        with lock:
+            in_flight.append(url)
+            max_in_flight.append(len(in_flight))
+        time.sleep(0.02)
+        with lock:
+            in_flight.pop()
+        return fake_response(201, dummy_custom_response())
+
+    monkeypatch.setattr(custom_client.session, "request", request)
+    inputs = image_paths + [("receipt.jpg", b"\xff\xd8\xff"), str(invalid_path)]
+    results = list(
+        custom_client.parse_many(
+            inputs, documents.TypeCustomV1, max_workers=3, endpoint_name="dummy"
+        )
+    )
+    assert len(results) == len(inputs)
+    assert max(max_in_flight) <= 3
+
+    errors = [result for result in results if isinstance(result, BatchParseError)]
+    assert len(errors) == 1
+    assert errors[0].input_item == str(invalid_path)
+    assert isinstance(errors[0].exception, MimeTypeError)
+
+    responses = [result for result in results if isinstance(result, PredictResponse)]
+    assert len(responses) == len(inputs) - 1
+    assert {response.input_filename for response in responses} == {"receipt.jpg"} | {
+        path.rsplit("/", 1)[-1] for path in image_paths
+    }
+
+
+def test_parse_many_http_errors_are_isolated(monkeypatch, custom_client, image_paths):
+    def request(method, url, files, **kwargs):
+        if files["document"][0] == "receipt_2.jpg":
+            return fake_response(429, {"api_request": {"error": {}}})
+        return fake_response(201, dummy_custom_response())
+
+    monkeypatch.setattr(custom_client.session, "request", request)
+    inputs = [
+        BytesInput(b"\xff\xd8\xff", path.rsplit("/", 1)[-1]) for path in image_paths
+    ]
+    results = list(
+        custom_client.parse_many(inputs, documents.TypeCustomV1, endpoint_name="dummy")
+    )
+    errors = [result for result in results if isinstance(result, BatchParseError)]
+    assert len(errors) == 1
+    assert errors[0].filename == "receipt_2.jpg"
+    for input_doc in inputs:
+        assert input_doc.file_object.closed
+
+
+def test_parse_many_keeps_file_objects_open(monkeypatch, custom_client, image_paths):
+    monkeypatch.setattr(
+        custom_client.session,
+        "request",
+        lambda *args, **kwargs: fake_response(201, dummy_custom_response()),
+    )
+    file_handles = [open(path, "rb") for path in image_paths]
+    results = list(
+        custom_client.parse_many(
+            file_handles, documents.TypeCustomV1, endpoint_name="dummy"
+        )
+    )
+    assert all(isinstance(result, PredictResponse) for result in results)
+    for file_handle in file_handles:
+        assert not file_handle.closed
+        file_handle.close()
+
+
+def test_parse_many_directory(monkeypatch, custom_client, image_paths, tmp_path):
+    (tmp_path / "notes.txt").write_text("not a document")
+    sent = []
+
+    def request(method, url, files, **kwargs):
+        sent.append(files["document"][0])
+        return fake_response(201, dummy_custom_response())
+
+    monkeypatch.setattr(custom_client.session, "request", request)
+    results = list(
+        custom_client.parse_many(
+            DirectoryInput(str(tmp_path), sort_by="size"),
+            documents.TypeCustomV1,
+            endpoint_name="dummy",
+        )
+    )
+    assert all(isinstance(result, PredictResponse) for result in results)
+    assert sorted(sent) == [path.rsplit("/", 1)[-1] for path in image_paths]
+
+
+def _slow_api(monkeypatch, client, status_code=201):
+    sent = []
+    lock = threading.Lock()
+
+    def request(method, url, files, **kwargs):
+        with lock:
+            sent.append(files["document"][0])
+        time.sleep(0.05)
+        return fake_response(status_code, dummy_custom_response())
+
+    monkeypatch.setattr(client.session, "request", request)
+    return sent
+
+
+def test_parse_many_deduplicate(monkeypatch):
+    clear_envvars(monkeypatch)
+    client = Client("dummy", deduplicate=True).add_endpoint(
+        endpoint_name="dummy", account_name="dummy"
+    )
+    sent = _slow_api(monkeypatch, client)
+    inputs = [
+        (f"receipt_{idx}.jpg", b"\xff\xd8\xff" + bytes([idx % 2])) for idx in range(6)
+    ]
+    results = list(
+        client.parse_many(
+            inputs, documents.TypeCustomV1, max_workers=6, endpoint_name="dummy"
+        )
+    )
+    assert len(sent) == 2
+    assert client.in_flight.duplicates == 4
+    assert sorted(result.input_filename for result in results) == [
+        name for name, _ in inputs
+    ]
+    assert all(len(result.pages) == 1 for result in results)
+    assert len({id(result.http_response) for result in results}) == 6
+
+
+def test_parse_many_deduplicate_lazy_document(monkeypatch):
+    clear_envvars(monkeypatch)
+    client = Client("dummy", deduplicate=True).add_endpoint(
+        endpoint_name="dummy", account_name="dummy"
+    )
+    sent = _slow_api(monkeypatch, client)
+
+    def failing_build(self, api_prediction, page_n=None):
+        raise ValueError("Invalid prediction")
+
+    monkeypatch.setattr(documents.CustomV1, "_build_from_api_prediction", failing_build)
+    inputs = [(f"receipt_{idx}.jpg", b"\xff\xd8\xff") for idx in range(3)]
+    results = list(
+        client.parse_many(
+            inputs, documents.TypeCustomV1, max_workers=3, endpoint_name="dummy"
+        )
+    )
+    # Sharing the response does not build the document
+    assert len(sent) == 1
+    assert all(result.response_ok for result in results)
+    with pytest.raises(ValueError):
+        results[0].document
+
+
+def test_parse_many_deduplicate_errors(monkeypatch):
+    clear_envvars(monkeypatch)
+    client = Client("dummy", deduplicate=True).add_endpoint(
+        endpoint_name="dummy", account_name="dummy"
+    )
+    sent = _slow_api(monkeypatch, client, status_code=500)
+    inputs = [(f"receipt_{idx}.jpg", b"\xff\xd8\xff") for idx in range(3)]
+    results = list(
+        client.parse_many(
+            inputs, documents.TypeCustomV1, max_workers=3, endpoint_name="dummy"
+        )
+    )
+    assert len(sent) == 1
+    assert all(isinstance(result, BatchParseError) for result in results)
+
+
+def test_parse_many_deduplicate_across_runs(monkeypatch, tmp_path):
+    clear_envvars(monkeypatch)
+    inputs = [(f"receipt_{idx}.jpg", b"\xff\xd8\xff") for idx in range(3)]
+    sent_per_run = []
+    for _ in range(2):
+        client = Client(
+            "dummy", deduplicate=True, cache=DiskCache(str(tmp_path / "index.db"))
+        ).add_endpoint(endpoint_name="dummy", account_name="dummy")
+        sent_per_run.append(_slow_api(monkeypatch, client))
+        results = list(
+            client.parse_many(
+                inputs, documents.TypeCustomV1, max_workers=3, endpoint_name="dummy"
+            )
+        )
+        assert all(isinstance(result, PredictResponse) for result in results)
+    assert [len(sent) for sent in sent_per_run] == [1, 0]
+
+
+def test_in_flight_requests():
+    in_flight = InFlightRequests()
+    is_first, future = in_flight.claim("key")
+    assert is_first
+    assert in_flight.claim("key") == (False, future)
+    assert in_flight.claim("other")[0]
+    in_flight.release("key")
+    assert in_flight.claim("key")[0]
+    assert in_flight.duplicates == 1
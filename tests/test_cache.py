@@ -0,0 +1,202 @@
+import multiprocessing
+
+import pytest
+
+from mindee import Client, PageOptions, PdfOptions, documents
+from mindee.cache import DiskCache, MemoryCache, make_cache_key
+from tests.utils import clear_envvars, dummy_custom_response, fake_response
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    return DiskCache(str(tmp_path / "cache.sqlite"))
+
+
+def test_cache_key():
+    key = make_cache_key("abc", "https://example.com/v1")
+    assert key == make_cache_key("abc", "https://example.com/v1")
+    assert key != make_cache_key("abd", "https://example.com/v1")
+    assert key != make_cache_key("abc", "https://example.com/v2")
+    assert key != make_cache_key("abc", "https://example.com/v1", include_words=True)
+    assert key != make_cache_key("abc", "https://example.com/v1", cropper=True)
+    assert key != make_cache_key(
+        "abc", "https://example.com/v1", page_options=PageOptions([0])
+    )
+    assert key != make_cache_key(
+        "abc", "https://example.com/v1", pdf_options=PdfOptions(max_dpi=150)
+    )
+
+
+def test_disk_cache_get_set(disk_cache):
+    assert disk_cache.get("key") is None
+    disk_cache.set("key", {"document": [1, 2]})
+    assert disk_cache.get("key") == {"document": [1, 2]}
+    disk_cache.clear()
+    assert disk_cache.get("key") is None
+
+
+def test_disk_cache_ttl(monkeypatch, tmp_path):
+    now = [1000.0]
+    monkeypatch.setattr("mindee.cache.disk.time.time", lambda: now[0])
+    disk_cache = DiskCache(str(tmp_path / "cache.sqlite"), ttl=10)
+    disk_cache.set("key", {"a": 1})
+    now[0] += 5
+    assert disk_cache.get("key") == {"a": 1}
+    now[0] += 10
+    assert disk_cache.get("key") is None
+
+
+def test_disk_cache_eviction(monkeypatch, tmp_path):
+    now = [1000.0]
+    monkeypatch.setattr("mindee.cache.disk.time.time", lambda: now[0])
+    disk_cache = DiskCache(str(tmp_path / "cache.sqlite"), max_size=70)
+    for key in ("a", "b", "c"):
+        now[0] += 1
+        disk_cache.set(key, {"data": "x" * 10})
+    now[0] += 1
+    # 'a' is now the most recently used
+    assert disk_cache.get("a") is not None
+    now[0] += 1
+    disk_cache.set("d", {"data": "x" * 10})
+    assert disk_cache.get("b") is None
+    assert disk_cache.get("a") is not None
+    assert disk_cache.get("c") is not None
+    assert disk_cache.get("d") is not None
+
+
+def _write_entries(path: str, prefix: str) -> None:
+    disk_cache = DiskCache(path)
+    for idx in range(20):
+        disk_cache.set(f"{prefix}{idx}", {"idx": idx})
+
+
+def test_disk_cache_multiprocess(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    DiskCache(path)
+    processes = [
+        multiprocessing.Process(target=_write_entries, args=(path, prefix))
+        for prefix in ("a", "b", "c")
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+    disk_cache = DiskCache(path)
+    for prefix in ("a", "b", "c"):
+        assert disk_cache.get(f"{prefix}19") == {"idx": 19}
+
+
+def test_client_uses_cache(monkeypatch, disk_cache, tmp_path):
+    clear_envvars(monkeypatch)
+    client = Client("dummy", cache=disk_cache).add_endpoint(
+        endpoint_name="dummy", account_name="dummy"
+    )
+    calls = []
+
+    def request(*args, **kwargs):
+        calls.append(kwargs)
+        return fake_response(201, dummy_custom_response(2))
+
+    monkeypatch.setattr(client.session, "request", request)
+    path = tmp_path / "receipt.jpg"
+    path.write_bytes(b"\xff\xd8\xff\xe0 some image data")
+
+    first = client.doc_from_path(str(path)).parse(
+        documents.TypeCustomV1, endpoint_name="dummy"
+    )
+    input_doc = client.doc_from_path(str(path))
+    second = input_doc.parse(documents.TypeCustomV1, endpoint_name="dummy")
+    assert len(calls) == 1
+    assert second.http_response == first.http_response
+    assert len(second.pages) == 2
+    assert input_doc.input_doc.file_object.closed
+
+    client.doc_from_path(str(path)).parse(
+        documents.TypeCustomV1, endpoint_name="dummy", include_words=True
+    )
+    assert len(calls) == 2
+
+
+def test_client_does_not_cache_errors(monkeypatch, disk_cache, tmp_path):
+    clear_envvars(monkeypatch)
+    client = Client("dummy", raise_on_error=False, cache=disk_cache).add_endpoint(
+        endpoint_name="dummy", account_name="dummy"
+    )
+    calls = []
+
+    def request(*args, **kwargs):
+        calls.append(kwargs)
+        return fake_response(429, {})
+
+    monkeypatch.setattr(client.session, "request", request)
+    path = tmp_path / "receipt.jpg"
+    path.write_bytes(b"\xff\xd8\xff\xe0 some image data")
+    for _ in range(2):
+        client.doc_from_path(str(path)).parse(
+            documents.TypeCustomV1, endpoint_name="dummy"
+        )
+    assert len(calls) == 2
+
+
+def test_memory_cache_lru():
+    memory_cache = MemoryCache(max_size=70)
+    for key in ("a", "b", "c"):
+        memory_cache.set(key, {"data": "x" * 10})
+    assert len(memory_cache) == 3
+    assert memory_cache.size == 66
+    assert memory_cache.get("a") == {"data": "x" * 10}
+    memory_cache.set("d", {"data": "x" * 10})
+    assert memory_cache.get("b") is None
+    assert memory_cache.get("a") is not None
+    assert memory_cache.hits == 2
+    assert memory_cache.misses == 1
+    assert memory_cache.size == 66
+
+    memory_cache.set("huge", {"data": "x" * 100})
+    assert memory_cache.get("huge") is None
+    memory_cache.clear()
+    assert len(memory_cache) == 0
+    assert memory_cache.size == 0
+
+
+def test_memory_cache_returns_copies():
+    memory_cache = MemoryCache(max_size=1000)
+    memory_cache.set("key", {"data": [1]})
+    memory_cache.get("key")["data"].append(2)
+    assert memory_cache.get("key") == {"data": [1]}
+
+
+def test_memory_cache_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("mindee.cache.memory.time.monotonic", lambda: now[0])
+    memory_cache = MemoryCache(max_size=1000, ttl=10)
+    memory_cache.set("key", {"a": 1})
+    now[0] += 5
+    assert memory_cache.get("key") == {"a": 1}
+    now[0] += 10
+    assert memory_cache.get("key") is None
+    assert memory_cache.size == 0
+    assert memory_cache.misses == 1
+
+
+def test_client_uses_memory_cache(monkeypatch, tmp_path):
+    clear_envvars(monkeypatch)
+    memory_cache = MemoryCache(max_size=1024 * 1024)
+    client = Client("dummy", cache=memory_cache).add_endpoint(
+        endpoint_name="dummy", account_name="dummy"
+    )
+    calls = []
+
+    def request(*args, **kwargs):
+        calls.append(kwargs)
+        return fake_response(201, dummy_custom_response())
+
+    monkeypatch.setattr(client.session, "request", request)
+    for _ in range(3):
+        client.doc_from_bytes(b"\xff\xd8\xff\xe0 image", "receipt.jpg").parse(
+            documents.TypeCustomV1, endpoint_name="dummy"
+        )
+    assert len(calls) == 1
+    assert memory_cache.hits == 2
+    assert memory_cache.misses == 1
@@ -1,10 +1,13 @@
+import gzip
+import json
 from argparse import Namespace
 
 import pytest
+import requests
 
 from mindee.cli import call_endpoint
 from mindee.endpoints import HTTPException
-from tests.utils import clear_envvars
+from tests.utils import clear_envvars, dummy_custom_response, fake_response, make_pdf
 
 
 @pytest.fixture
@@ -22,7 +25,9 @@ def custom_doc(monkeypatch):
         input_type="path",
         output_type="summary",
         include_words=False,
-        path="./tests/data/pdf/blank.pdf",
+        output_file=None,
+        rotate_size=None,
+        path=["./tests/data/pdf/blank.pdf"],
     )
 
 
@@ -37,7 +42,9 @@ def ots_doc(monkeypatch):
         input_type="path",
         output_type="summary",
         include_words=False,
-        path="./tests/data/invoice/invoice.pdf",
+        output_file=None,
+        rotate_size=None,
+        path=["./tests/data/invoice/invoice.pdf"],
     )
 
 
@@ -94,3 +101,51 @@ def test_cli_us_bank_check(ots_doc):
     ots_doc.api_key = "dummy"
     with pytest.raises(HTTPException):
         call_endpoint(ots_doc)
+
+
+@pytest.fixture
+def pdf_paths(tmp_path):
+    paths = []
+    for file_n in range(3):
+        path = tmp_path / f"plate{file_n}.pdf"
+        path.write_bytes(make_pdf(1 + file_n))
+        paths.append(str(path))
+    return paths
+
+
+def test_cli_output_file(custom_doc, pdf_paths, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        requests.Session,
+        "request",
+        lambda *args, **kwargs: fake_response(201, dummy_custom_response()),
+    )
+    custom_doc.path = pdf_paths
+    custom_doc.output_file = str(tmp_path / "results.ndjson.gz")
+    call_endpoint(custom_doc)
+    with gzip.open(custom_doc.output_file, "rt") as output:
+        lines = [json.loads(line) for line in output]
+    assert len(lines) == 3
+    assert lines[0]["fields"]["plate"]["values"][0]["content"] == "page0"
+
+    custom_doc.output_type = "raw"
+    custom_doc.output_file = str(tmp_path / "results.ndjson")
+    call_endpoint(custom_doc)
+    with open(custom_doc.output_file, encoding="utf-8") as output:
+        assert [json.loads(line) for line in output] == [dummy_custom_response()] * 3
+
+
+def test_cli_output_file_errors(custom_doc, pdf_paths, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(
+        requests.Session,
+        "request",
+        lambda *args, **kwargs: fake_response(400, {"api_request": {"error": {}}}),
+    )
+    custom_doc.path = pdf_paths[:1]
+    custom_doc.output_file = str(tmp_path / "results.ndjson")
+    with pytest.raises(HTTPException):
+        call_endpoint(custom_doc)
+    custom_doc.raise_on_error = False
+    call_endpoint(custom_doc)
+    # Failed responses are written raw
+    with open(custom_doc.output_file, encoding="utf-8") as output:
+        assert json.loads(output.read()) == {"api_request": {"error": {}}}
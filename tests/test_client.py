@@ -1,9 +1,25 @@
+import io
+import threading
+
 import pytest
+from PIL import Image
 
-from mindee import Client, PageOptions, documents
+from mindee import Client, ImageOptions, PageOptions, PdfOptions, documents
+from mindee.cache import MemoryCache
 from mindee.endpoints import HTTPException
+from mindee.input.page_cache import PageCache
+from mindee.input.page_options import REMOVE_BLANK
 from tests import INVOICE_DATA_DIR, PASSPORT_DATA_DIR, RECEIPT_DATA_DIR
-from tests.utils import clear_envvars, dummy_envvars
+from tests.utils import (
+    clear_envvars,
+    dummy_custom_response,
+    dummy_envvars,
+    fake_response,
+    make_pdf,
+    make_scan_pdf,
+    pdf_images,
+    pdf_page_texts,
+)
 
 
 @pytest.fixture
@@ -205,3 +221,290 @@ def test_cut_options(dummy_client):
         pass
     assert doc.input_doc.count_doc_pages() == 5
     doc.close()
+
+
+def test_endpoints_share_session():
+    client = Client("dummy").add_endpoint(
+        endpoint_name="dummy",
+        account_name="dummy",
+    )
+    for doc_config in client._doc_configs.values():
+        for endpoint in doc_config.endpoints:
+            assert endpoint.session is client.session
+    client.close()
+
+
+def test_session_pool_options():
+    client = Client("dummy", pool_maxsize=32, keep_alive=False)
+    adapter = client.session.get_adapter("https://api.mindee.net")
+    assert adapter._pool_maxsize == 32
+    assert client.session.headers["Connection"] == "close"
+    client.close()
+
+
+def test_client_context_manager(monkeypatch):
+    closed = []
+    with Client("dummy") as client:
+        monkeypatch.setattr(client.session, "close", lambda: closed.append(True))
+    assert closed == [True]
+
+
+def _fake_split_api(monkeypatch, client, fail_page=None):
+    """Answer each request with one page per PDF page, named after its contents."""
+    requests_pages = []
+    lock = threading.Lock()
+
+    def request(*args, **kwargs):
+        texts = pdf_page_texts(kwargs["files"]["document"][1])
+        names = [text.split("(")[1].split(")")[0] for text in texts]
+        with lock:
+            requests_pages.append(names)
+        if fail_page in names:
+            return fake_response(500, {"api_request": {"error": "failed"}})
+        pages = [
+            {
+                "id": page_n,
+                "orientation": {"value": 0},
+                "extras": {},
+                "prediction": {
+                    "plate": {
+                        "confidence": 0.9,
+                        "values": [{"content": name, "confidence": 0.9}],
+                    }
+                },
+            }
+            for page_n, name in enumerate(names)
+        ]
+        prediction = {
+            "plate": {
+                "confidence": 0.9,
+                "page_id": 0,
+                "values": [
+                    {"content": name, "confidence": 0.9, "page_id": page_n}
+                    for page_n, name in enumerate(names)
+                ],
+            }
+        }
+        return fake_response(
+            201,
+            {
+                "document": {
+                    "n_pages": len(names),
+                    "inference": {"pages": pages, "prediction": prediction},
+                }
+            },
+        )
+
+    monkeypatch.setattr(client.session, "request", request)
+    return requests_pages
+
+
+def test_parse_split_pages(monkeypatch):
+    clear_envvars(monkeypatch)
+    cache = MemoryCache(max_size=1024 * 1024)
+    client = Client("dummy", cache=cache).add_endpoint(
+        endpoint_name="dummy", account_name="dummy"
+    )
+    requests_pages = _fake_split_api(monkeypatch, client)
+    pdf_bytes = make_pdf(7)
+
+    response = client.doc_from_bytes(pdf_bytes, "bundle.pdf").parse(
+        documents.TypeCustomV1, endpoint_name="dummy", split_pages=3, max_workers=3
+    )
+    assert sorted(requests_pages) == [
+        ["page 0", "page 1", "page 2"],
+        ["page 3", "page 4", "page 5"],
+        ["page 6"],
+    ]
+    assert [page.orientation.page_n for page in response.pages] == list(range(7))
+    assert [page.fields["plate"].contents_string() for page in response.pages] == [
+        f"page {page_n}" for page_n in range(7)
+    ]
+    assert response.http_response["document"]["n_pages"] == 7
+    assert response.document.fields["plate"].contents_list == [
+        f"page {page_n}" for page_n in range(7)
+    ]
+
+    # The merged response is cached for the whole document.
+    repeat_response = client.doc_from_bytes(pdf_bytes, "bundle.pdf").parse(
+        documents.TypeCustomV1, endpoint_name="dummy", split_pages=3
+    )
+    assert len(requests_pages) == 3
+    assert cache.hits == 1
+    assert repeat_response.document.fields["plate"].contents_list == [
+        f"page {page_n}" for page_n in range(7)
+    ]
+
+    # Each part is also cached on its own, when the options differ.
+    client.doc_from_bytes(pdf_bytes, "bundle.pdf").parse(
+        documents.TypeCustomV1,
+        endpoint_name="dummy",
+        split_pages=3,
+        page_options=PageOptions([0], on_min_pages=10),
+    )
+    assert len(requests_pages) == 3
+    assert cache.hits == 4
+
+
+def test_parse_split_pages_small_pdf(monkeypatch):
+    clear_envvars(monkeypatch)
+    client = Client("dummy").add_endpoint(endpoint_name="dummy", account_name="dummy")
+    requests_pages = _fake_split_api(monkeypatch, client)
+    response = client.doc_from_bytes(make_pdf(3), "bundle.pdf").parse(
+        documents.TypeCustomV1, endpoint_name="dummy", split_pages=3
+    )
+    assert requests_pages == [["page 0", "page 1", "page 2"]]
+    assert len(response.pages) == 3
+
+
+def test_parse_split_pages_error(monkeypatch):
+    clear_envvars(monkeypatch)
+    client = Client("dummy").add_endpoint(endpoint_name="dummy", account_name="dummy")
+    _fake_split_api(monkeypatch, client, fail_page="page 4")
+    with pytest.raises(HTTPException):
+        client.doc_from_bytes(make_pdf(6), "bundle.pdf").parse(
+            documents.TypeCustomV1, endpoint_name="dummy", split_pages=2
+        )
+
+    client.raise_on_error = False
+    response = client.doc_from_bytes(make_pdf(6), "bundle.pdf").parse(
+        documents.TypeCustomV1, endpoint_name="dummy", split_pages=2
+    )
+    assert response.document is None
+    assert response.http_response == {"api_request": {"error": "failed"}}
+
+
+def test_parse_image_options(monkeypatch):
+    clear_envvars(monkeypatch)
+    client = Client("dummy").add_endpoint(endpoint_name="dummy", account_name="dummy")
+    sent = []
+
+    def request(*args, **kwargs):
+        sent.append(kwargs["files"]["document"][1])
+        return fake_response(201, dummy_custom_response())
+
+    monkeypatch.setattr(client.session, "request", request)
+    image = Image.linear_gradient("L").resize((2048, 2048)).convert("RGB")
+    image_bytes = io.BytesIO()
+    image.save(image_bytes, format="JPEG", quality=100)
+
+    response = client.doc_from_bytes(image_bytes.getvalue(), "receipt.jpg").parse(
+        documents.TypeCustomV1,
+        endpoint_name="dummy",
+        image_options=ImageOptions(max_size=512, quality=60),
+    )
+    assert response.input_bytes_saved > 0
+    assert len(sent[0]) == len(image_bytes.getvalue()) - response.input_bytes_saved
+    with Image.open(io.BytesIO(sent[0])) as sent_image:
+        assert sent_image.size == (512, 512)
+
+
+def test_parse_tiff_page_options(monkeypatch):
+    clear_envvars(monkeypatch)
+    client = Client("dummy").add_endpoint(endpoint_name="dummy", account_name="dummy")
+    sent = []
+
+    def request(*args, **kwargs):
+        sent.append(kwargs["files"]["document"][1])
+        return fake_response(201, dummy_custom_response())
+
+    monkeypatch.setattr(client.session, "request", request)
+    frames = [Image.new("1", (100, 50 + idx)) for idx in range(4)]
+    tiff_bytes = io.BytesIO()
+    frames[0].save(
+        tiff_bytes,
+        format="TIFF",
+        save_all=True,
+        append_images=frames[1:],
+        compression="group4",
+    )
+
+    client.doc_from_bytes(tiff_bytes.getvalue(), "fax.tif").parse(
+        documents.TypeCustomV1,
+        endpoint_name="dummy",
+        page_options=PageOptions(page_indexes=[0], on_min_pages=2),
+    )
+    with Image.open(io.BytesIO(sent[0])) as sent_image:
+        assert (sent_image.n_frames, sent_image.size) == (1, (100, 50))
+
+    response = client.doc_from_bytes(tiff_bytes.getvalue(), "fax.tif").parse(
+        documents.TypeCustomV1,
+        endpoint_name="dummy",
+        page_options=PageOptions(page_indexes=[1, -1]),
+    )
+    with Image.open(io.BytesIO(sent[1])) as sent_image:
+        assert sent_image.n_frames == 2
+    assert response.input_page_map == [1, 3]
+    assert response.get_input_page_n(1) == 3
+
+
+def test_parse_remove_blank_pages(monkeypatch):
+    clear_envvars(monkeypatch)
+    client = Client("dummy", cache=MemoryCache(max_size=10_000_000)).add_endpoint(
+        endpoint_name="dummy", account_name="dummy"
+    )
+    sent = []
+
+    def request(*args, **kwargs):
+        sent.append(kwargs["files"]["document"][1])
+        return fake_response(201, dummy_custom_response())
+
+    monkeypatch.setattr(client.session, "request", request)
+    pdf_bytes = make_pdf(5, blank_pages=[0, 3])
+    for _ in range(2):
+        response = client.doc_from_bytes(pdf_bytes, "scans.pdf").parse(
+            documents.TypeCustomV1,
+            endpoint_name="dummy",
+            page_options=PageOptions(operation=REMOVE_BLANK),
+        )
+        assert response.input_page_map == [1, 2, 4]
+        assert response.get_input_page_n(2) == 4
+    assert len(sent) == 1
+    assert len(pdf_page_texts(sent[0])) == 3
+
+
+def test_parse_pdf_options(monkeypatch):
+    clear_envvars(monkeypatch)
+    client = Client("dummy").add_endpoint(endpoint_name="dummy", account_name="dummy")
+    sent = []
+
+    def request(*args, **kwargs):
+        sent.append(kwargs["files"]["document"][1])
+        return fake_response(201, dummy_custom_response())
+
+    monkeypatch.setattr(client.session, "request", request)
+    pdf_bytes = make_scan_pdf(2, dpi=300)
+    response = client.doc_from_bytes(pdf_bytes, "scans.pdf").parse(
+        documents.TypeCustomV1,
+        endpoint_name="dummy",
+        pdf_options=PdfOptions(max_dpi=100),
+    )
+    assert response.input_bytes_saved == len(pdf_bytes) - len(sent[0])
+    assert [size for _, *size in pdf_images(sent[0])] == [[850, 1100]] * 2
+
+
+def test_parse_page_cache(monkeypatch):
+    clear_envvars(monkeypatch)
+    page_cache = PageCache(max_size=1_000_000)
+    client = (
+        Client("dummy", page_cache=page_cache)
+        .add_endpoint(endpoint_name="first", account_name="dummy")
+        .add_endpoint(endpoint_name="second", account_name="dummy")
+    )
+    sent = []
+
+    def request(*args, **kwargs):
+        sent.append(kwargs["files"]["document"][1])
+        return fake_response(201, dummy_custom_response())
+
+    monkeypatch.setattr(client.session, "request", request)
+    pdf_bytes = make_pdf(5)
+    for endpoint_name in ("first", "second"):
+        client.doc_from_bytes(pdf_bytes, "invoice.pdf").parse(
+            documents.TypeCustomV1,
+            endpoint_name=endpoint_name,
+            page_options=PageOptions([0, 1]),
+        )
+    assert (page_cache.hits, page_cache.misses) == (1, 1)
+    assert sent[0] == sent[1]
+    assert len(pdf_page_texts(sent[1])) == 2
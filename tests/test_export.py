@@ -0,0 +1,223 @@
+import datetime
+import math
+import sys
+
+import pytest
+
+from mindee.documents import InvoiceV4, ReceiptV4
+from mindee.export import Column, export_columns
+from mindee.response import PredictResponse
+
+POLYGON = [[0.1, 0.1], [0.3, 0.1], [0.3, 0.12], [0.1, 0.12]]
+
+
+def make_field(value, confidence=0.9):
+    return {"value": value, "confidence": confidence, "polygon": POLYGON, "page_id": 0}
+
+
+def make_tax(value, rate):
+    return dict(make_field(value), rate=rate, code="VAT", basis=None)
+
+
+def invoice_prediction(line_item_count, total_amount=120.0):
+    return {
+        "prediction": {
+            "customer_address": make_field("1 Main Street"),
+            "customer_company_registrations": [],
+            "customer_name": make_field("ACME Inc."),
+            "date": make_field("2023-01-06"),
+            "due_date": make_field("N/A", confidence=0.0),
+            "invoice_number": make_field("INV-42"),
+            "line_items": [
+                {
+                    "confidence": 0.8,
+                    "description": f"Item {item_n}",
+                    "page_id": 0,
+                    "polygon": POLYGON,
+                    "product_code": None,
+                    "quantity": 1.0,
+                    "tax_amount": None,
+                    "tax_rate": 20.0,
+                    "total_amount": 10.0 * (item_n + 1),
+                    "unit_price": 10.0 * (item_n + 1),
+                }
+                for item_n in range(line_item_count)
+            ],
+            "locale": {"confidence": 0.9, "currency": "EUR", "language": "fr"},
+            "reference_numbers": [],
+            "supplier_address": make_field("2 Side Street"),
+            "supplier_company_registrations": [],
+            "supplier_name": make_field("Supplier"),
+            "supplier_payment_details": [
+                {
+                    "account_number": "N/A",
+                    "iban": "FR7630006000011234567890189",
+                    "routing_number": "N/A",
+                    "swift": "AGRIFRPP",
+                    "confidence": 0.7,
+                    "polygon": POLYGON,
+                    "page_id": 0,
+                }
+            ],
+            "taxes": [make_tax(20.0, 20.0)],
+            "total_amount": make_field(total_amount),
+            "total_net": make_field(100.0),
+        }
+    }
+
+
+def receipt_prediction():
+    return {
+        "prediction": {
+            "category": make_field("food"),
+            "date": make_field("2023-02-01"),
+            "document_type": make_field("EXPENSE RECEIPT"),
+            "locale": {"confidence": 0.9, "currency": "USD", "language": "en"},
+            "subcategory": make_field("restaurant"),
+            "supplier": make_field("Diner"),
+            "taxes": [make_tax(1.0, 10.0), make_tax(0.5, 5.0)],
+            "time": make_field("12:30"),
+            "tip": make_field(None, confidence=0.0),
+            "total_amount": make_field(11.5),
+            "total_net": make_field(10.0),
+            "total_tax": make_field(1.5),
+        }
+    }
+
+
+@pytest.fixture
+def documents():
+    return [
+        InvoiceV4(invoice_prediction(3)),
+        ReceiptV4(receipt_prediction()),
+        InvoiceV4(invoice_prediction(0, total_amount="N/A")),
+    ]
+
+
+def test_column():
+    column = Column("amount", "float64", 3)
+    column.set(0, 12.5)
+    column.set(1, "N/A")
+    column.set(2, None)
+    assert column.to_pylist() == [12.5, None, None]
+    assert len(column) == 3
+    assert column.valid == bytearray([1, 0, 0])
+
+    column = Column("reconstructed", "bool", 2)
+    column.set(1, False)
+    assert column.to_pylist() == [None, False]
+
+    column = Column("date", "date", 2)
+    column.set(0, "2023-01-06")
+    column.set(1, datetime.date(2023, 1, 6))
+    assert column.to_pylist() == [None, datetime.date(2023, 1, 6)]
+
+
+def test_export_documents(documents):
+    export = export_columns(documents)
+    table = export.documents
+    assert table.num_rows == 3
+    assert table["type"].to_pylist() == ["invoice", "receipt", "invoice"]
+    # Reconstructed from the net amount and taxes
+    assert table["total_amount"].to_pylist() == [120.0, 11.5, 120.0]
+    assert table["total_amount_reconstructed"].to_pylist() == [False, False, True]
+    assert table["total_amount_page_n"].to_pylist() == [0, 0, None]
+    assert table["total_amount"].dtype == "float64"
+    assert table["invoice_date_date_object"].to_pylist() == [
+        datetime.date(2023, 1, 6),
+        None,
+        datetime.date(2023, 1, 6),
+    ]
+    assert table["due_date"].to_pylist() == [None, None, None]
+    assert table["locale_currency"].to_pylist() == ["EUR", "USD", "EUR"]
+    # Receipt fields are merged in the same table
+    assert table["supplier"].to_pylist() == [None, "Diner", None]
+    assert table["tip_confidence"].to_pylist() == [None, 0.0, None]
+    # Other lists are skipped
+    assert "reference_numbers" not in table.columns
+    assert all(len(column) == 3 for column in table.columns.values())
+
+
+def test_export_child_tables(documents):
+    export = export_columns(documents)
+    assert list(export.tables) == [
+        "documents",
+        "line_items",
+        "taxes",
+        "supplier_payment_details",
+    ]
+    line_items = export.children["line_items"]
+    assert line_items.num_rows == 3
+    assert line_items["document_index"].to_pylist() == [0, 0, 0]
+    assert line_items["total_amount"].to_pylist() == [10.0, 20.0, 30.0]
+    assert line_items["product_code"].to_pylist() == [None, None, None]
+
+    taxes = export.children["taxes"]
+    assert taxes["document_index"].to_pylist() == [0, 1, 1, 2]
+    assert taxes["rate"].to_pylist() == [20.0, 10.0, 5.0, 20.0]
+    assert taxes["basis"].to_pylist() == [None] * 4
+
+    payment_details = export.children["supplier_payment_details"]
+    assert payment_details["document_index"].to_pylist() == [0, 2]
+    assert payment_details["swift"].to_pylist() == ["AGRIFRPP", "AGRIFRPP"]
+    assert payment_details["account_number"].to_pylist() == [None, None]
+
+    export = export_columns(documents, child_tables=["reference_numbers"])
+    assert list(export.children) == ["reference_numbers"]
+    assert export.children["reference_numbers"].num_rows == 0
+
+
+def test_export_responses(documents):
+    class DummyResponse(PredictResponse):
+        def __init__(self, document):
+            self._document = document
+
+        @property
+        def document(self):
+            return self._document
+
+    export = export_columns(
+        [DummyResponse(documents[0]), DummyResponse(None), documents[1]]
+    )
+    assert export.documents.num_rows == 2
+    assert export.documents["type"].to_pylist() == ["invoice", "receipt"]
+
+
+def test_export_numpy(documents):
+    numpy = pytest.importorskip("numpy")
+    arrays = export_columns(documents).to_numpy()
+    total_amount = arrays["documents"]["total_amount"]
+    assert not isinstance(total_amount, numpy.ma.MaskedArray)
+    assert total_amount.dtype == numpy.float64
+    assert math.isclose(total_amount.sum(), 251.5)
+    supplier = arrays["documents"]["supplier"]
+    assert isinstance(supplier, numpy.ma.MaskedArray)
+    assert supplier.mask.tolist() == [True, False, True]
+    assert supplier[1] == "Diner"
+    document_index = arrays["line_items"]["document_index"]
+    assert document_index.dtype == numpy.int64
+    assert document_index.tolist() == [0, 0, 0]
+
+
+def test_export_arrow(documents, tmp_path):
+    pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    export = export_columns(documents)
+    tables = export.to_arrow()
+    assert tables["documents"].num_rows == 3
+    assert tables["documents"].column("total_amount").to_pylist() == [
+        120.0,
+        11.5,
+        120.0,
+    ]
+    paths = export.write_parquet(str(tmp_path / "export"))
+    assert len(paths) == 4
+    taxes = parquet.read_table(paths[2])
+    assert taxes.column("rate").to_pylist() == [20.0, 10.0, 5.0, 20.0]
+
+
+def test_export_missing_dependency(documents, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    export = export_columns(documents)
+    with pytest.raises(ImportError, match="mindee\\[export\\]"):
+        export.to_arrow()
@@ -93,3 +93,13 @@ def test_bounding_box_several_polygons(rectangle_b, quadrangle_a):
         (0.381, 0.546),
         (0.124, 0.546),
     )
+
+
+def test_bounding_box_shares_points(rectangle_a, quadrangle_a):
+    polygon = geometry.Polygon(geometry.Point(*point) for point in rectangle_a)
+    bounding_box = geometry.get_bounding_box(polygon)
+    assert all(corner is point for corner, point in zip(bounding_box, polygon))
+    polygon = geometry.Polygon(geometry.Point(*point) for point in quadrangle_a)
+    bounding_box = geometry.get_bounding_box(polygon)
+    assert bounding_box[0] is polygon[0]
+    assert bounding_box[1] == (0.381, 0.407)
@@ -1,17 +1,28 @@
+import base64
+import binascii
 import io
+import os
+import sys
 
 import pikepdf
 import pytest
+from PIL import Image
 
-from mindee.input.page_options import KEEP_ONLY, REMOVE
+from mindee.input.directory import DirectoryInput
+from mindee.input.metadata import sniff_mimetype
+from mindee.input.page_cache import PageCache
+from mindee.input.page_options import KEEP_ONLY, REMOVE, REMOVE_BLANK
+from mindee.input.readers import Base64Reader, BufferReader
 from mindee.input.sources import (
     Base64Input,
     BytesInput,
     FileInput,
     MimeTypeError,
+    MindeeSourceError,
     PathInput,
 )
 from tests import INVOICE_DATA_DIR, PDF_DATA_DIR, RECEIPT_DATA_DIR
+from tests.utils import make_pdf, make_scan_pdf, pdf_images, pdf_page_texts
 
 #
 # PDF
@@ -179,3 +190,571 @@ def test_heic_input_from_path():
 def test_txt_input_from_path():
     with pytest.raises(MimeTypeError):
         PathInput(f"{RECEIPT_DATA_DIR}/receipt.txt")
+
+
+@pytest.mark.parametrize(
+    "header,mimetype",
+    [
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF", "image/jpeg"),
+        (b"\x89PNG\r\n\x1a\n\x00", "image/png"),
+        (b"II*\x00\x08\x00", "image/tiff"),
+        (b"MM\x00*\x00\x08", "image/tiff"),
+        (b"RIFF\x24\x00\x00\x00WEBPVP8 ", "image/webp"),
+        (b"RIFF\x24\x00\x00\x00WAVEfmt ", None),
+        (b"\x00\x00\x00\x18ftypheic\x00", "image/heic"),
+        (b"\x00\x00\x00\x18ftypmp42\x00", None),
+        (b"%PDF-1.7\n", "application/pdf"),
+        (b" " * 1000 + b"%PDF-1.7\n", "application/pdf"),
+        (b" " * 1024 + b"%PDF-1.7\n", None),
+        (b"Hello", None),
+        (b"", None),
+    ],
+)
+def test_sniff_mimetype(header, mimetype):
+    assert sniff_mimetype(header) == mimetype
+
+
+def test_path_input_mmap(tmp_path):
+    path = tmp_path / "receipt.jpg"
+    path.write_bytes(b"\xff\xd8\xff\xe0" + bytes(range(256)) * 1000)
+    mapped_input = PathInput(str(path), mmap=True)
+    regular_input = PathInput(str(path))
+    assert mapped_input.is_memory_mapped()
+    assert not regular_input.is_memory_mapped()
+    assert mapped_input.content_hash() == regular_input.content_hash()
+    assert mapped_input.read_contents(close_file=False) == regular_input.read_contents(
+        close_file=True
+    )
+    mapped_input.read_contents(close_file=True)
+    assert mapped_input.file_object.closed
+
+
+def test_path_input_mmap_empty_file(tmp_path):
+    path = tmp_path / "receipt.jpg"
+    path.write_bytes(b"")
+    input_obj = PathInput(str(path), mmap=True)
+    assert not input_obj.is_memory_mapped()
+    assert input_obj.read_contents(close_file=True) == ("receipt.jpg", b"")
+
+
+#
+# Readers
+#
+
+READER_DATA = bytes(range(256)) * 40 + b"tail"
+
+
+@pytest.mark.parametrize(
+    "reader",
+    [
+        lambda: BufferReader(READER_DATA),
+        lambda: BufferReader(bytearray(READER_DATA)),
+        lambda: BufferReader(memoryview(b"head" + READER_DATA)[4:]),
+        lambda: Base64Reader(base64.standard_b64encode(READER_DATA).decode()),
+        lambda: Base64Reader(base64.encodebytes(READER_DATA).decode()),
+    ],
+)
+def test_reader_random_access(reader):
+    reader = reader()
+    assert reader.read() == READER_DATA
+    assert reader.read(10) == b""
+    for start in (0, 1, 2, 3, 1000, len(READER_DATA) - 5):
+        for size in (1, 2, 3, 4, 5, 7, 4096):
+            reader.seek(start)
+            assert reader.read(size) == READER_DATA[start : start + size]
+    reader.seek(-4, io.SEEK_END)
+    assert reader.read() == b"tail"
+    reader.seek(0)
+    assert b"".join(iter(lambda: reader.read(1000), b"")) == READER_DATA
+
+
+def test_buffer_reader_no_copy():
+    raw_bytes = b"x" * 1000
+    assert BufferReader(raw_bytes).read() is raw_bytes
+
+    raw_bytearray = bytearray(b"abcdef")
+    reader = BufferReader(raw_bytearray)
+    assert reader.getbuffer().obj is raw_bytearray
+    # Views can only be made read-only from Python 3.8.
+    assert reader.getbuffer().readonly or sys.version_info < (3, 8)
+
+
+def test_base64_reader_invalid():
+    with pytest.raises(binascii.Error):
+        Base64Reader("abcde")
+
+
+def test_bytes_input_buffers():
+    data = b"\xff\xd8\xff\xe0" + READER_DATA
+    expected_hash = BytesInput(data, "receipt.jpg").content_hash()
+    for raw in (bytearray(data), memoryview(data)):
+        input_obj = BytesInput(raw, "receipt.jpg")
+        assert input_obj.content_hash() == expected_hash
+        assert input_obj.read_contents(close_file=True) == ("receipt.jpg", data)
+        assert input_obj.file_object.closed
+
+
+def test_base64_input_lazy():
+    data = b"%PDF-1.4" + READER_DATA
+    input_obj = Base64Input(base64.standard_b64encode(data).decode(), "invoice.pdf")
+    assert input_obj.content_hash() == BytesInput(data, "invoice.pdf").content_hash()
+    assert input_obj.read_contents(close_file=False) == ("invoice.pdf", data)
+
+
+#
+# PDF scanning
+#
+
+
+def test_pdf_scan_cached(monkeypatch):
+    opened = []
+    pikepdf_open = pikepdf.open
+
+    def counting_open(*args, **kwargs):
+        opened.append(args)
+        return pikepdf_open(*args, **kwargs)
+
+    monkeypatch.setattr(pikepdf, "open", counting_open)
+    input_obj = BytesInput(make_pdf(12), "multipage.pdf")
+    assert input_obj.count_doc_pages() == 12
+    assert not input_obj.is_pdf_empty()
+    assert input_obj.count_doc_pages() == 12
+    assert len(opened) == 1
+
+    input_obj.process_pdf(behavior=KEEP_ONLY, on_min_pages=2, page_indexes=[0, -1])
+    assert len(opened) == 2
+    assert input_obj.count_doc_pages() == 2
+    assert len(opened) == 3
+    assert pdf_page_texts(input_obj.file_object.getvalue()) == [
+        "BT /F1 24 Tf 72 72 Td (page 0) Tj ET",
+        "BT /F1 24 Tf 72 72 Td (page 11) Tj ET",
+    ]
+
+
+def test_pdf_scan_blank():
+    assert BytesInput(make_pdf(3, blank=True), "blank.pdf").is_pdf_empty()
+    with pytest.raises(AssertionError):
+        BytesInput(make_pdf(3, blank=True), "blank.pdf").process_pdf(
+            behavior=KEEP_ONLY, on_min_pages=2, page_indexes=[0]
+        )
+
+
+def test_pdf_scan_mmap(tmp_path):
+    path = tmp_path / "multipage.pdf"
+    path.write_bytes(make_pdf(5))
+    input_obj = PathInput(str(path), mmap=True)
+    assert input_obj.count_doc_pages() == 5
+    input_obj.process_pdf(behavior=REMOVE, on_min_pages=2, page_indexes=[0])
+    assert input_obj.count_doc_pages() == 4
+    assert not input_obj.is_memory_mapped()
+
+
+def test_pdf_page_cache(monkeypatch):
+    page_cache = PageCache(max_size=1_000_000)
+    pdf_bytes = make_pdf(6)
+    first_input = BytesInput(pdf_bytes, "multipage.pdf")
+    first_input.process_pdf(KEEP_ONLY, 0, [0, -1], page_cache=page_cache)
+    assert (page_cache.hits, page_cache.misses, len(page_cache)) == (0, 1, 1)
+
+    monkeypatch.setattr(
+        pikepdf.Pdf, "new", lambda: pytest.fail("The PDF should not be cut again")
+    )
+    # The same pages, given differently.
+    second_input = BytesInput(pdf_bytes, "multipage.pdf")
+    second_input.process_pdf(REMOVE, 0, [1, 2, 3, 4], page_cache=page_cache)
+    assert (page_cache.hits, page_cache.misses) == (1, 1)
+    assert second_input.page_map == [0, 5]
+    assert second_input.count_doc_pages() == 2
+    assert (
+        second_input.read_contents(close_file=True)[1]
+        == first_input.read_contents(close_file=True)[1]
+    )
+
+
+def test_pdf_page_cache_no_scan(monkeypatch):
+    page_cache = PageCache(max_size=1_000_000)
+    pdf_bytes = make_pdf(6, blank_pages=[2])
+    first_input = BytesInput(pdf_bytes, "multipage.pdf")
+    first_input.process_pdf(REMOVE_BLANK, 0, [], page_cache=page_cache)
+    unchanged_input = BytesInput(pdf_bytes, "multipage.pdf")
+    unchanged_input.process_pdf(KEEP_ONLY, 10, [0], page_cache=page_cache)
+
+    monkeypatch.setattr(
+        pikepdf, "open", lambda *args: pytest.fail("The PDF should not be scanned")
+    )
+    second_input = BytesInput(pdf_bytes, "multipage.pdf")
+    second_input.process_pdf(REMOVE_BLANK, 0, [1], page_cache=page_cache)
+    assert second_input.page_map == [0, 1, 3, 4, 5]
+    assert (page_cache.hits, page_cache.misses) == (1, 1)
+    # Options which leave the file as is are also remembered.
+    unchanged_input = BytesInput(pdf_bytes, "multipage.pdf")
+    unchanged_input.process_pdf(KEEP_ONLY, 10, [0], page_cache=page_cache)
+    assert unchanged_input.page_map is None
+    assert unchanged_input.read_contents(close_file=True)[1] == pdf_bytes
+
+
+def test_page_cache_options_key():
+    assert PageCache.make_options_key("a", KEEP_ONLY, 0, [-1, 0, 0]) == (
+        "a",
+        KEEP_ONLY,
+        0,
+        (-1, 0),
+    )
+    assert PageCache.make_options_key("a", REMOVE_BLANK, 2, [3]) == (
+        "a",
+        REMOVE_BLANK,
+        2,
+        (),
+    )
+
+
+def test_page_cache_eviction():
+    page_cache = PageCache(max_size=10)
+    page_cache.set(PageCache.make_key("a", [1, 0]), b"12345")
+    page_cache.set(PageCache.make_key("b", [0]), b"12345")
+    assert page_cache.get(("a", (0, 1))) == b"12345"
+    page_cache.set(PageCache.make_key("c", [0]), b"123")
+    assert page_cache.get(("b", (0,))) is None
+    assert page_cache.size == 8
+    page_cache.set(PageCache.make_key("d", [0]), b"x" * 11)
+    assert len(page_cache) == 2
+    page_cache.set_pages(PageCache.make_options_key("a", KEEP_ONLY, 0, [0]), [0])
+    page_cache.clear()
+    assert (len(page_cache), page_cache.size) == (0, 0)
+    assert page_cache.get_pages(("a", KEEP_ONLY, 0, (0,))) is None
+
+
+def test_pdf_remove_blank_pages():
+    input_obj = BytesInput(make_pdf(6, blank_pages=[1, 2, 5]), "scans.pdf")
+    assert input_obj.get_blank_pages() == [1, 2, 5]
+    assert input_obj.find_pages(REMOVE_BLANK, 0, []) == [0, 3, 4]
+    assert input_obj.page_map is None
+    input_obj.process_pdf(behavior=REMOVE_BLANK, on_min_pages=0, page_indexes=[])
+    assert input_obj.page_map == [0, 3, 4]
+    assert input_obj.get_blank_pages() == []
+    assert pdf_page_texts(input_obj.file_object.getvalue()) == [
+        "BT /F1 24 Tf 72 72 Td (page 0) Tj ET",
+        "BT /F1 24 Tf 72 72 Td (page 3) Tj ET",
+        "BT /F1 24 Tf 72 72 Td (page 4) Tj ET",
+    ]
+    # Page maps are combined when pages are removed again.
+    input_obj.process_pdf(behavior=REMOVE, on_min_pages=0, page_indexes=[0])
+    assert input_obj.page_map == [3, 4]
+
+
+def test_pdf_remove_blank_pages_untouched():
+    pdf_bytes = make_pdf(3)
+    input_obj = BytesInput(pdf_bytes, "scans.pdf")
+    input_obj.process_pdf(behavior=REMOVE_BLANK, on_min_pages=0, page_indexes=[])
+    assert input_obj.page_map is None
+    assert input_obj.read_contents(close_file=True)[1] == pdf_bytes
+
+    input_obj = BytesInput(make_pdf(3, blank_pages=[0]), "scans.pdf")
+    input_obj.process_pdf(behavior=REMOVE_BLANK, on_min_pages=4, page_indexes=[])
+    assert input_obj.count_doc_pages() == 3
+
+
+def test_optimize_pdf():
+    pdf_bytes = make_scan_pdf(3, dpi=200)
+    input_obj = BytesInput(pdf_bytes, "scans.pdf")
+    size_before, size_after = input_obj.optimize_pdf(max_dpi=100, quality=50)
+    assert size_before == len(pdf_bytes)
+    assert size_after < size_before // 4
+    assert input_obj.bytes_saved == size_before - size_after
+    new_bytes = input_obj.read_contents(close_file=False)[1]
+    assert len(new_bytes) == size_after
+    images = pdf_images(new_bytes)
+    # Identical images are only kept once.
+    assert len({objgen for objgen, _, _ in images}) == 1
+    assert [size for _, *size in images] == [[850, 1100]] * 3
+    assert input_obj.count_doc_pages() == 3
+
+
+def test_optimize_pdf_unreadable_image(monkeypatch):
+    def as_pil_image(self):
+        raise pikepdf.PdfError("unsupported filter")
+
+    monkeypatch.setattr(pikepdf.PdfImage, "as_pil_image", as_pil_image)
+    pdf_bytes = make_scan_pdf(2, dpi=200)
+    input_obj = BytesInput(pdf_bytes, "scans.pdf")
+    input_obj.optimize_pdf(max_dpi=100)
+    # The images are left as they are.
+    assert [size for _, *size in pdf_images(input_obj.file_object.read())] == [
+        [1700, 2200]
+    ] * 2
+
+
+def test_optimize_pdf_keep_resolution():
+    pdf_bytes = make_scan_pdf(2, dpi=100, shared_image=True)
+    input_obj = BytesInput(pdf_bytes, "scans.pdf")
+    size_before, size_after = input_obj.optimize_pdf(max_dpi=150)
+    assert size_after <= size_before
+    assert [size for _, *size in pdf_images(input_obj.file_object.read())] == [
+        [850, 1100]
+    ] * 2
+
+    # Already optimized, the file is left as is.
+    pdf_bytes = input_obj.read_contents(close_file=True)[1]
+    input_obj = BytesInput(pdf_bytes, "scans.pdf")
+    assert input_obj.optimize_pdf(max_dpi=None) == (len(pdf_bytes), len(pdf_bytes))
+    assert input_obj.read_contents(close_file=True)[1] == pdf_bytes
+
+
+#
+# Image processing
+#
+
+
+def _make_image(image_format: str, size=(1500, 1000), **kwargs) -> bytes:
+    image = Image.effect_mandelbrot(size, (-2, -1.25, 1, 1.25), 100).convert("RGB")
+    image_bytes = io.BytesIO()
+    image.save(image_bytes, format=image_format, **kwargs)
+    return image_bytes.getvalue()
+
+
+@pytest.mark.parametrize(
+    "image_format,filename",
+    [("JPEG", "receipt.jpg"), ("PNG", "receipt.png"), ("WEBP", "receipt.webp")],
+)
+def test_process_image(image_format, filename):
+    image_bytes = _make_image(image_format, quality=100)
+    input_obj = BytesInput(image_bytes, filename)
+    bytes_saved = input_obj.process_image(max_size=1000, quality=70)
+    assert bytes_saved > 0
+    assert input_obj.bytes_saved == bytes_saved
+    _, new_bytes = input_obj.read_contents(close_file=True)
+    assert len(new_bytes) == len(image_bytes) - bytes_saved
+    with Image.open(io.BytesIO(new_bytes)) as image:
+        assert image.format == image_format
+        assert image.size == (1000, 667)
+
+
+def test_process_image_keeps_smaller_original():
+    image_bytes = _make_image("JPEG", size=(200, 100), quality=10)
+    input_obj = BytesInput(image_bytes, "receipt.jpg")
+    assert input_obj.process_image(max_size=1000, quality=95) == 0
+    assert input_obj.read_contents(close_file=True)[1] == image_bytes
+
+
+def test_process_image_skipped():
+    pdf_input = BytesInput(make_pdf(1), "invoice.pdf")
+    assert pdf_input.process_image(max_size=10) == 0
+
+    frames = [Image.new("RGB", (2000, 2000), color) for color in ("red", "blue")]
+    tiff_bytes = io.BytesIO()
+    frames[0].save(tiff_bytes, format="TIFF", save_all=True, append_images=frames[1:])
+    tiff_input = BytesInput(tiff_bytes.getvalue(), "receipt.tiff")
+    assert tiff_input.process_image(max_size=10) == 0
+    assert tiff_input.read_contents(close_file=True)[1] == tiff_bytes.getvalue()
+
+
+#
+# Metadata
+#
+
+
+def test_metadata_image():
+    input_obj = BytesInput(_make_image("PNG", size=(300, 200)), "receipt.png")
+    metadata = input_obj.metadata
+    assert metadata.mimetype == "image/png"
+    assert metadata.size == len(input_obj.read_contents(close_file=False)[1])
+    assert (metadata.width, metadata.height, metadata.page_count) == (300, 200, 1)
+    assert not input_obj.is_pdf()
+    assert input_obj.metadata is metadata
+
+
+def test_metadata_pdf(monkeypatch):
+    opened = []
+    pikepdf_open = pikepdf.open
+    monkeypatch.setattr(
+        pikepdf, "open", lambda *args: opened.append(args) or pikepdf_open(*args)
+    )
+    # The contents take precedence over the file name.
+    input_obj = BytesInput(make_pdf(4), "invoice.jpg")
+    assert input_obj.metadata.mimetype == "application/pdf"
+    assert input_obj.is_pdf()
+    # Only the header is read until the pages are counted.
+    assert not opened
+    assert input_obj.metadata.page_count == 4
+    assert input_obj.metadata.width is None
+    assert input_obj.is_pdf()
+    assert input_obj.count_doc_pages() == 4
+    assert len(opened) == 1
+
+    input_obj.process_pdf(behavior=KEEP_ONLY, on_min_pages=2, page_indexes=[0])
+    assert input_obj.metadata.page_count == 1
+
+
+def test_metadata_unknown_contents():
+    input_obj = BytesInput(b"not really a tiff", "receipt.tiff")
+    metadata = input_obj.metadata
+    assert metadata.mimetype == "image/tiff"
+    assert metadata.width is None
+    assert metadata.page_count == 1
+
+
+def test_metadata_unreadable_pdf():
+    input_obj = BytesInput(b"%PDF-1.7\n1 0 obj", "invoice.pdf")
+    assert input_obj.is_pdf()
+    with pytest.raises(MindeeSourceError):
+        input_obj.metadata.page_count
+    with pytest.raises(MindeeSourceError):
+        input_obj.is_pdf_empty()
+
+
+def test_metadata_decompression_bomb(monkeypatch):
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 100)
+    input_obj = BytesInput(_make_image("PNG", size=(300, 200)), "receipt.png")
+    with pytest.raises(MindeeSourceError):
+        input_obj.metadata
+
+
+def test_metadata_multi_page_tiff():
+    frames = [Image.new("L", (20, 10)) for _ in range(3)]
+    tiff_bytes = io.BytesIO()
+    frames[0].save(tiff_bytes, format="TIFF", save_all=True, append_images=frames[1:])
+    metadata = BytesInput(tiff_bytes.getvalue(), "receipt.tif").metadata
+    assert metadata.mimetype == "image/tiff"
+    assert (metadata.width, metadata.height, metadata.page_count) == (20, 10, 3)
+
+
+#
+# Multi-page TIFF
+#
+
+
+def _make_fax(page_count: int, compression: str = "group4") -> bytes:
+    """Make a black & white TIFF, each page having a width of 100 + its index."""
+    frames = [Image.new("1", (100 + idx, 50), 1) for idx in range(page_count)]
+    tiff_bytes = io.BytesIO()
+    frames[0].save(
+        tiff_bytes,
+        format="TIFF",
+        save_all=True,
+        append_images=frames[1:],
+        compression=compression,
+        dpi=(200, 200),
+    )
+    return tiff_bytes.getvalue()
+
+
+def _tiff_page_widths(input_obj) -> list:
+    with Image.open(io.BytesIO(input_obj.read_contents(close_file=False)[1])) as image:
+        widths = []
+        for idx in range(image.n_frames):
+            image.seek(idx)
+            widths.append(image.size[0])
+            assert image.info["compression"] == "group4"
+            assert image.info["dpi"] == (200, 200)
+        return widths
+
+
+def test_tiff_keep_pages():
+    input_obj = BytesInput(_make_fax(5), "fax.tiff")
+    input_obj.process_tiff(behavior=KEEP_ONLY, on_min_pages=2, page_indexes=[0, -1])
+    assert _tiff_page_widths(input_obj) == [100, 104]
+    assert input_obj.metadata.page_count == 2
+    assert input_obj.page_map == [0, 4]
+    # Indexes are mapped to the original image when selecting again.
+    input_obj.process_tiff(behavior=REMOVE, on_min_pages=0, page_indexes=[0])
+    assert input_obj.page_map == [4]
+
+
+def test_tiff_remove_pages():
+    input_obj = BytesInput(_make_fax(5), "fax.tiff")
+    input_obj.process_tiff(behavior=REMOVE, on_min_pages=2, page_indexes=[1, 2, 10])
+    assert _tiff_page_widths(input_obj) == [100, 103, 104]
+    assert input_obj.page_map == [0, 3, 4]
+
+
+def test_tiff_pages_untouched():
+    tiff_bytes = _make_fax(3)
+    input_obj = BytesInput(tiff_bytes, "fax.tiff")
+    input_obj.process_tiff(behavior=KEEP_ONLY, on_min_pages=4, page_indexes=[0])
+    input_obj.process_tiff(behavior=REMOVE, on_min_pages=0, page_indexes=[5])
+    assert input_obj.read_contents(close_file=False)[1] == tiff_bytes
+    assert input_obj.page_map is None
+    with pytest.raises(RuntimeError):
+        input_obj.process_tiff(behavior=REMOVE, on_min_pages=0, page_indexes=[0, 1, 2])
+
+
+def test_tiff_keep_pages_color():
+    frames = [Image.new("RGB", (10 + idx, 10), "red") for idx in range(3)]
+    tiff_bytes = io.BytesIO()
+    frames[0].save(tiff_bytes, format="TIFF", save_all=True, append_images=frames[1:])
+    input_obj = BytesInput(tiff_bytes.getvalue(), "receipt.tif")
+    input_obj.process_tiff(behavior=KEEP_ONLY, on_min_pages=0, page_indexes=[1])
+    with Image.open(io.BytesIO(input_obj.read_contents(close_file=True)[1])) as image:
+        assert (image.n_frames, image.size, image.mode) == (1, (11, 10), "RGB")
+
+
+@pytest.fixture
+def scan_dir(tmp_path):
+    (tmp_path / "nested" / "deeper").mkdir(parents=True)
+    files = {
+        "b.pdf": 30,
+        "a.jpg": 10,
+        "notes.txt": 5,
+        "nested/c.png": 20,
+        "nested/deeper/d.tiff": 40,
+    }
+    for mtime, (name, size) in enumerate(files.items()):
+        path = tmp_path / name
+        path.write_bytes(b"\x00" * size)
+        os.utime(path, (1_000_000 + mtime, 1_000_000 + mtime))
+    return tmp_path
+
+
+def test_directory_input(scan_dir):
+    def names(paths):
+        return [os.path.relpath(path, scan_dir) for path in paths]
+
+    assert sorted(names(DirectoryInput(str(scan_dir)))) == ["a.jpg", "b.pdf"]
+    assert names(DirectoryInput(str(scan_dir), recursive=True, sort_by="name")) == [
+        "a.jpg",
+        "b.pdf",
+        "nested/c.png",
+        "nested/deeper/d.tiff",
+    ]
+    # Names are compared for each level, "-" sorts before the path separator.
+    (scan_dir / "nested-2").mkdir()
+    (scan_dir / "nested-2" / "a.pdf").write_bytes(b"%PDF-1.7")
+    assert names(DirectoryInput(str(scan_dir), recursive=True, sort_by="name")) == [
+        "a.jpg",
+        "b.pdf",
+        "nested/c.png",
+        "nested/deeper/d.tiff",
+        "nested-2/a.pdf",
+    ]
+    (scan_dir / "nested-2" / "a.pdf").unlink()
+    assert names(
+        DirectoryInput(str(scan_dir), recursive=True, sort_by="size", reverse=True)
+    ) == ["nested/deeper/d.tiff", "b.pdf", "nested/c.png", "a.jpg"]
+    assert names(DirectoryInput(str(scan_dir), recursive=True, sort_by="mtime")) == [
+        "b.pdf",
+        "a.jpg",
+        "nested/c.png",
+        "nested/deeper/d.tiff",
+    ]
+    assert names(DirectoryInput(str(scan_dir), pattern="*.pdf", recursive=True)) == [
+        "b.pdf"
+    ]
+
+
+def test_directory_input_is_lazy(scan_dir):
+    paths = iter(DirectoryInput(str(scan_dir), recursive=True))
+    first_path = next(paths)
+    (scan_dir / "nested" / "e.jpg").write_bytes(b"\xff\xd8\xff")
+    assert first_path not in list(paths)
+    inputs = DirectoryInput(str(scan_dir), sort_by="name").inputs()
+    input_doc = next(inputs)
+    assert isinstance(input_doc, PathInput)
+    assert input_doc.filename == "a.jpg"
+    input_doc.file_object.close()
+
+
+def test_directory_input_invalid(scan_dir):
+    with pytest.raises(NotADirectoryError):
+        DirectoryInput(str(scan_dir / "a.jpg"))
+    with pytest.raises(ValueError):
+        DirectoryInput(str(scan_dir), sort_by="color")
@@ -0,0 +1,78 @@
+import datetime
+import json
+
+import pytest
+
+from mindee import Client, documents, json_backend
+from mindee.documents.base import serialize_for_json
+from mindee.endpoints import HTTPException
+from mindee.fields.text import TextField
+from mindee.geometry import Point
+from tests.utils import fake_response
+
+PREDICTION = {
+    "value": "ACME",
+    "confidence": 0.99,
+    "polygon": [[0.1, 0.1], [0.3, 0.1], [0.3, 0.12], [0.1, 0.12]],
+}
+
+
+AVAILABLE_BACKENDS = ["json"] if json_backend.orjson is None else ["json", "orjson"]
+
+
+@pytest.fixture(params=AVAILABLE_BACKENDS)
+def backend(request):
+    previous = json_backend.get_backend()
+    json_backend.set_backend(request.param)
+    yield json_backend.get_backend()
+    json_backend.set_backend(previous)
+
+
+def test_default_backend():
+    assert json_backend.get_backend().name == AVAILABLE_BACKENDS[-1]
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError):
+        json_backend.set_backend("simplejson")
+
+
+def test_loads(backend):
+    data = {"document": {"value": "Société", "amount": 12.5, "items": [1, None]}}
+    encoded = json.dumps(data)
+    assert json_backend.loads(encoded) == data
+    assert json_backend.loads(encoded.encode()) == data
+
+
+def test_dumps(backend):
+    data = {"a": [Point(0.1, 0.2)], "b": datetime.date(2023, 1, 6), 1: True}
+    encoded = json_backend.dumps(data, pretty=True, default=serialize_for_json)
+    assert encoded.startswith('{\n  "a": [\n')
+    assert json.loads(encoded) == {"a": [[0.1, 0.2]], "b": "2023-01-06", "1": True}
+    with pytest.raises(TypeError):
+        json_backend.dumps({"b": datetime.date(2023, 1, 6)})
+
+
+def test_dumps_fields(backend):
+    field = TextField(PREDICTION)
+    encoded = json_backend.dumps(field, default=serialize_for_json)
+    assert json.loads(encoded) == json.loads(
+        json.dumps(field, default=serialize_for_json)
+    )
+
+
+def test_response_decoding(backend, monkeypatch):
+    client = Client(api_key="dummy", raise_on_error=True)
+    monkeypatch.setattr(
+        client.session,
+        "request",
+        lambda *args, **kwargs: fake_response(400, {"api_request": {"error": "é"}}),
+    )
+    input_doc = client.doc_from_bytes(b"%PDF-1.4", "invoice.pdf")
+    with pytest.raises(HTTPException) as exc_info:
+        input_doc.parse(documents.TypeReceiptV4)
+    message = str(exc_info.value)
+    assert message.startswith("API 400 HTTP error: ")
+    assert json.loads(message[len("API 400 HTTP error: ") :]) == {
+        "api_request": {"error": "é"}
+    }
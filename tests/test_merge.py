@@ -0,0 +1,66 @@
+from mindee.merge import merge_predictions
+
+
+def _chunk_response(page_count: int, prediction: dict) -> dict:
+    return {
+        "api_request": {"status": "success"},
+        "document": {
+            "n_pages": page_count,
+            "inference": {
+                "processing_time": page_count,
+                "pages": [
+                    {
+                        "id": page_n,
+                        "prediction": {"total": {"value": 1, "page_id": page_n}},
+                    }
+                    for page_n in range(page_count)
+                ],
+                "prediction": prediction,
+            },
+        },
+    }
+
+
+def test_merge_predictions():
+    first = _chunk_response(
+        2,
+        {
+            "total": {"value": 10, "confidence": 0.5, "page_id": 1},
+            "due_date": {"value": "2022-01-01", "confidence": 0.9, "page_id": 0},
+            "taxes": [{"value": 1, "page_id": 0}],
+            "plate": {"values": [{"content": "a", "page_id": 0}]},
+        },
+    )
+    second = _chunk_response(
+        1,
+        {
+            "total": {"value": 12, "confidence": 0.99, "page_id": 0},
+            "due_date": {"value": None, "confidence": 1.0, "page_id": 0},
+            "taxes": [{"value": 2, "page_id": 0}],
+            "plate": {"values": [{"content": "b", "page_id": 0}]},
+            "extra": {"value": "x", "page_id": 0},
+        },
+    )
+    merged = merge_predictions([(0, first), (2, second)])
+    document = merged["document"]
+    assert document["n_pages"] == 3
+    assert document["inference"]["processing_time"] == 2
+    assert [page["id"] for page in document["inference"]["pages"]] == [0, 1, 2]
+    assert [
+        page["prediction"]["total"]["page_id"]
+        for page in document["inference"]["pages"]
+    ] == [0, 1, 2]
+    prediction = document["inference"]["prediction"]
+    assert prediction["total"] == {"value": 12, "confidence": 0.99, "page_id": 2}
+    assert prediction["due_date"]["value"] == "2022-01-01"
+    assert prediction["taxes"] == [
+        {"value": 1, "page_id": 0},
+        {"value": 2, "page_id": 2},
+    ]
+    assert prediction["plate"]["values"] == [
+        {"content": "a", "page_id": 0},
+        {"content": "b", "page_id": 2},
+    ]
+    assert prediction["extra"]["page_id"] == 2
+    # The responses given are left untouched.
+    assert second["document"]["inference"]["pages"][0]["id"] == 0
@@ -0,0 +1,117 @@
+import io
+import json
+import threading
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from mindee import Client, documents
+from mindee.endpoints import BASE_URL_ENV_NAME
+from mindee.input.sources import BytesInput
+from mindee.multipart import MultipartStream
+from tests.utils import clear_envvars, dummy_custom_response
+
+
+def _parse_form(content_type: str, body: bytes) -> dict:
+    message = BytesParser().parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): (
+            part.get_filename(),
+            part.get_payload(decode=True),
+        )
+        for part in message.get_payload()
+    }
+
+
+def test_multipart_stream_body():
+    contents = b"%PDF-1.4 " + bytes(range(256)) * 100
+    body = MultipartStream(
+        io.BytesIO(contents),
+        'my "invoice".pdf',
+        fields={"include_mvision": "true"},
+        file_mimetype="application/pdf",
+    )
+    data = body.read()
+    assert len(data) == len(body)
+    assert body.tell() == len(body)
+    assert body.read(10) == b""
+    form = _parse_form(body.content_type, data)
+    assert form["include_mvision"] == (None, b"true")
+    assert form["document"] == ("my %22invoice%22.pdf", contents)
+
+
+def test_multipart_stream_small_reads():
+    file_object = io.BytesIO(b"x" * 10000)
+    file_object.seek(5000)
+    body = MultipartStream(file_object, "receipt.jpg")
+    chunks = list(iter(lambda: body.read(7), b""))
+    assert max(len(chunk) for chunk in chunks) == 7
+    assert sum(len(chunk) for chunk in chunks) == len(body)
+    form = _parse_form(body.content_type, b"".join(chunks))
+    assert form["document"] == ("receipt.jpg", b"x" * 10000)
+    assert not file_object.closed
+
+
+@pytest.fixture
+def server():
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            requests_seen.append(_parse_form(self.headers["Content-Type"], body))
+            data = json.dumps(dummy_custom_response()).encode()
+            self.send_response(201)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", requests_seen
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_client_stream_upload(monkeypatch, server):
+    base_url, requests_seen = server
+    clear_envvars(monkeypatch)
+    monkeypatch.setenv(BASE_URL_ENV_NAME, base_url)
+    contents = b"\xff\xd8\xff\xe0" + b"\x00" * 100000
+    with Client("dummy", stream_upload=True) as client:
+        client.add_endpoint(endpoint_name="dummy", account_name="dummy")
+        input_doc = BytesInput(contents, "receipt.jpg")
+        response = client._get_document_client(input_doc).parse(
+            documents.TypeCustomV1, endpoint_name="dummy", include_words=True
+        )
+    assert response.document.fields["plate"].contents_string() == "page0"
+    assert requests_seen == [
+        {
+            "include_mvision": (None, b"true"),
+            "document": ("receipt.jpg", contents),
+        }
+    ]
+    assert input_doc.file_object.closed
+
+
+def test_client_mmap_upload(monkeypatch, server, tmp_path):
+    base_url, requests_seen = server
+    clear_envvars(monkeypatch)
+    monkeypatch.setenv(BASE_URL_ENV_NAME, base_url)
+    contents = b"\xff\xd8\xff\xe0" + b"\x00" * 100000
+    path = tmp_path / "receipt.jpg"
+    path.write_bytes(contents)
+    with Client("dummy") as client:
+        client.add_endpoint(endpoint_name="dummy", account_name="dummy")
+        doc_client = client.doc_from_path(str(path), mmap=True)
+        doc_client.parse(documents.TypeCustomV1, endpoint_name="dummy")
+    assert requests_seen == [{"document": ("receipt.jpg", contents)}]
+    assert doc_client.input_doc.file_object.closed
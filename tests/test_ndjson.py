@@ -0,0 +1,139 @@
+import gzip
+import json
+import os
+
+import pytest
+
+from mindee import Client, json_backend
+from mindee.batch import BatchParseError
+from mindee.documents.custom.custom_v1 import CustomV1
+from mindee.input.sources import BytesInput
+from mindee.ndjson import NdjsonWriter, part_path
+from mindee.response import PredictResponse
+from tests.utils import dummy_custom_response
+
+
+@pytest.fixture
+def dummy_config():
+    client = Client(api_key="dummy").add_endpoint(
+        endpoint_name="dummy",
+        account_name="dummy",
+    )
+    return client._doc_configs[("dummy", "dummy")]
+
+
+def make_response(doc_config, response_ok=True):
+    if response_ok:
+        http_response = dummy_custom_response()
+    else:
+        http_response = {"api_request": {"error": {"code": "BadRequest"}}}
+    return PredictResponse[CustomV1](
+        doc_config=doc_config,
+        http_response=http_response,
+        input_source=BytesInput(b"%PDF-1.7", "plate.pdf"),
+        response_ok=response_ok,
+    )
+
+
+def read_lines(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as ndjson_file:
+        return [json.loads(line) for line in ndjson_file]
+
+
+def test_part_path():
+    assert part_path("results.ndjson", 0) == "results-00000.ndjson"
+    assert part_path("out/results.ndjson.gz", 12) == "out/results-00012.ndjson.gz"
+    assert part_path("results", 1) == "results-00001"
+
+
+def test_write_raw(dummy_config, tmp_path):
+    path = str(tmp_path / "results.ndjson")
+    with NdjsonWriter(path) as writer:
+        writer.write(make_response(dummy_config))
+        writer.write(make_response(dummy_config, response_ok=False))
+    assert writer.paths == [path]
+    assert writer.lines_written == 2
+    assert read_lines(path) == [
+        dummy_custom_response(),
+        {"api_request": {"error": {"code": "BadRequest"}}},
+    ]
+    with pytest.raises(ValueError):
+        writer.write(make_response(dummy_config))
+
+
+def test_write_parsed(dummy_config, tmp_path):
+    path = str(tmp_path / "results.ndjson")
+    with NdjsonWriter(path, output_type="parsed") as writer:
+        writer.write(make_response(dummy_config))
+        writer.write(make_response(dummy_config, response_ok=False))
+    parsed, failed = read_lines(path)
+    assert parsed["filename"] == "plate.pdf"
+    assert parsed["fields"]["plate"]["values"][0]["content"] == "page0"
+    assert failed == {"api_request": {"error": {"code": "BadRequest"}}}
+
+    with pytest.raises(ValueError):
+        NdjsonWriter(path, output_type="summary")
+
+
+def test_write_buffered(dummy_config, tmp_path):
+    path = str(tmp_path / "results.ndjson")
+    writer = NdjsonWriter(path, buffer_size=1024 * 1024)
+    writer.write(make_response(dummy_config))
+    assert os.path.getsize(path) == 0
+    writer.flush()
+    assert len(read_lines(path)) == 1
+
+    writer = NdjsonWriter(path, buffer_size=0)
+    writer.write(make_response(dummy_config))
+    assert len(read_lines(path)) == 1
+    writer.close()
+
+
+def test_write_gzip(dummy_config, tmp_path):
+    path = str(tmp_path / "results.ndjson.gz")
+    with NdjsonWriter(path, compress=True) as writer:
+        writer.write(make_response(dummy_config))
+        writer.flush()
+        # Flushed lines are readable while the file is still open
+        with open(path, "rb") as partial_file:
+            partial = gzip.GzipFile(fileobj=partial_file)
+            assert json.loads(partial.readline()) == dummy_custom_response()
+        writer.write(make_response(dummy_config))
+    assert read_lines(path) == [dummy_custom_response()] * 2
+
+
+def test_write_rotation(dummy_config, tmp_path):
+    line_size = len(json_backend.dumps(dummy_custom_response())) + 1
+    path = str(tmp_path / "results.ndjson.gz")
+    with NdjsonWriter(
+        path, compress=True, max_bytes=int(line_size * 2.5), buffer_size=0
+    ) as writer:
+        for _ in range(5):
+            writer.write(make_response(dummy_config))
+    assert writer.paths == [
+        str(tmp_path / "results-00000.ndjson.gz"),
+        str(tmp_path / "results-00001.ndjson.gz"),
+        str(tmp_path / "results-00002.ndjson.gz"),
+    ]
+    assert [len(read_lines(part)) for part in writer.paths] == [2, 2, 1]
+    assert not os.path.exists(path)
+
+    # A line bigger than the limit is written alone
+    path = str(tmp_path / "small.ndjson")
+    with NdjsonWriter(path, max_bytes=10) as writer:
+        writer.write(make_response(dummy_config))
+        writer.write(make_response(dummy_config))
+    assert [len(read_lines(part)) for part in writer.paths] == [1, 1]
+
+
+def test_write_all(dummy_config, tmp_path):
+    results = [
+        make_response(dummy_config),
+        BatchParseError("missing.pdf", FileNotFoundError("missing.pdf")),
+        make_response(dummy_config),
+    ]
+    path = str(tmp_path / "results.ndjson")
+    with NdjsonWriter(path) as writer:
+        assert writer.write_all(iter(results)) == 2
+    assert len(read_lines(path)) == 2
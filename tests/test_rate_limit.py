@@ -0,0 +1,69 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mindee import Client
+from mindee.rate_limit import RateLimiter, get_rate_limiter
+
+
+def test_limiter_burst_then_rate():
+    limiter = RateLimiter(rate=50, burst=2)
+    start = time.monotonic()
+    for _ in range(2):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.02
+    for _ in range(4):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.075
+
+
+def test_limiter_threads():
+    limiter = RateLimiter(rate=100, burst=1)
+    start = time.monotonic()
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start >= 0.085
+
+
+def test_limiter_async():
+    limiter = RateLimiter(rate=100, burst=1)
+
+    async def run():
+        await asyncio.gather(*[limiter.acquire_async() for _ in range(10)])
+
+    start = time.monotonic()
+    asyncio.run(run())
+    assert time.monotonic() - start >= 0.085
+
+
+def test_limiter_invalid():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, burst=0)
+    assert RateLimiter(rate=2.5).burst == 3
+
+
+def test_limiter_shared_per_api_key():
+    limiter = get_rate_limiter("key-shared", 5)
+    assert get_rate_limiter("key-shared", 10) is limiter
+    assert limiter.rate == 5
+    assert get_rate_limiter("key-other", 5) is not limiter
+
+    client_1 = Client("key-client", rate_limit=3)
+    client_2 = Client("key-client", rate_limit=3).add_endpoint(
+        endpoint_name="dummy", account_name="dummy"
+    )
+    endpoints = [
+        endpoint
+        for client in (client_1, client_2)
+        for doc_config in client._doc_configs.values()
+        for endpoint in doc_config.endpoints
+    ]
+    assert all(endpoint.rate_limiter is client_1.rate_limiter for endpoint in endpoints)
+    assert Client("key-client").rate_limiter is None
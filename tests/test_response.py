@@ -4,18 +4,20 @@
 
 from mindee import Client
 from mindee.documents.base import Document
+from mindee.documents.custom.custom_v1 import CustomV1
 from mindee.documents.financial.financial_v1 import FinancialV1
 from mindee.documents.invoice.invoice_v3 import InvoiceV3
 from mindee.documents.passport.passport_v1 import PassportV1
 from mindee.documents.receipt.receipt_v3 import ReceiptV3
 from mindee.documents.receipt.receipt_v4 import ReceiptV4
 from mindee.endpoints import OTS_OWNER
-from mindee.input.sources import PathInput
+from mindee.input.sources import BytesInput, PathInput
 from mindee.response import PredictResponse
 from tests.documents.test_invoice_v3 import FILE_PATH_INVOICE_V3_COMPLETE
 from tests.documents.test_passport_v1 import FILE_PATH_PASSPORT_V1_COMPLETE
 from tests.documents.test_receipt_v3 import FILE_PATH_RECEIPT_V3_COMPLETE
 from tests.documents.test_receipt_v4 import FILE_PATH_RECEIPT_V4_COMPLETE
+from tests.utils import dummy_custom_response
 
 
 @pytest.fixture
@@ -101,3 +103,84 @@ def test_response_passport_v1(dummy_file_input, dummy_config):
     assert isinstance(parsed_response.document, PassportV1)
     for page in parsed_response.pages:
         assert isinstance(page, PassportV1)
+
+
+def test_response_lazy_pages(monkeypatch, dummy_config):
+    built = []
+    build_from_api_prediction = CustomV1._build_from_api_prediction
+
+    def counting_build(self, api_prediction, page_n=None):
+        built.append(page_n)
+        build_from_api_prediction(self, api_prediction, page_n=page_n)
+
+    monkeypatch.setattr(CustomV1, "_build_from_api_prediction", counting_build)
+    parsed_response = PredictResponse[CustomV1](
+        doc_config=dummy_config[("dummy", "dummy")],
+        http_response=dummy_custom_response(page_count=5),
+        input_source=BytesInput(b"%PDF-1.7", "invoice.pdf"),
+        response_ok=True,
+    )
+    assert built == []
+    assert parsed_response.document.fields["plate"].contents_string() == "page0"
+    assert parsed_response.document is parsed_response.document
+    assert parsed_response.document.filename == "invoice.pdf"
+    assert built == [None]
+
+    assert len(parsed_response.pages) == 5
+    assert parsed_response.pages[-1].orientation.page_n == 4
+    assert parsed_response.pages[3].fields["plate"].contents_string() == "page3"
+    assert parsed_response.pages[4] is parsed_response.pages[-1]
+    assert built == [None, 4, 3]
+    assert [page.orientation.page_n for page in parsed_response.pages[1:3]] == [1, 2]
+    assert sorted(built[1:]) == [1, 2, 3, 4]
+    assert parsed_response.pages == list(parsed_response.pages)
+
+
+def test_response_not_ok(dummy_config):
+    parsed_response = PredictResponse[CustomV1](
+        doc_config=dummy_config[("dummy", "dummy")],
+        http_response={"api_request": {"error": {}}},
+        input_source=BytesInput(b"%PDF-1.7", "invoice.pdf"),
+        response_ok=False,
+    )
+    assert parsed_response.document is None
+    assert len(parsed_response.pages) == 0
+
+
+def test_response_nested_document_metadata(monkeypatch, dummy_config):
+    built = []
+
+    class RecordingReceipt(ReceiptV3):
+        def __init__(self, api_prediction=None, input_source=None, page_n=None):
+            built.append(input_source)
+            super().__init__(api_prediction, input_source, page_n)
+
+    monkeypatch.setattr(
+        "mindee.documents.financial.financial_v1.ReceiptV3", RecordingReceipt
+    )
+    receipt = {
+        "category": {"value": "food", "confidence": 0.9},
+        "date": {"value": "2023-01-06", "confidence": 0.9},
+        "locale": {"value": "fr", "confidence": 0.9},
+        "supplier": {"value": "ACME", "confidence": 0.9},
+        "taxes": [],
+        "time": {"value": "12:30", "confidence": 0.9},
+        "total_incl": {"value": 12.5, "confidence": 0.9},
+    }
+    http_response = {
+        "document": {
+            "inference": {
+                "pages": [{"id": 0, "prediction": receipt}],
+                "prediction": receipt,
+            }
+        }
+    }
+    parsed_response = PredictResponse[FinancialV1](
+        doc_config=dummy_config[(OTS_OWNER, FinancialV1.__name__)],
+        http_response=http_response,
+        input_source=BytesInput(b"%PDF-1.7", "receipt.pdf"),
+        response_ok=True,
+    )
+    assert parsed_response.document.total_incl.value == 12.5
+    assert built[0].filename == "receipt.pdf"
+    assert built[0].file_mimetype == "application/pdf"
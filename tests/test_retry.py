@@ -0,0 +1,181 @@
+from email.utils import formatdate
+
+import pytest
+import requests
+
+from mindee import Client, documents
+from mindee.endpoints import HTTPException
+from mindee.input.sources import PathInput
+from mindee.retry import RetryPolicy, parse_retry_after
+from tests.utils import clear_envvars, dummy_custom_response, fake_response
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    path = tmp_path / "receipt.jpg"
+    path.write_bytes(b"\xff\xd8\xff\xe0 some image data")
+    return str(path)
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    delays = []
+    monkeypatch.setattr("mindee.endpoints.time.sleep", delays.append)
+    return delays
+
+
+def _retry_client(monkeypatch, responses, **policy_kwargs):
+    clear_envvars(monkeypatch)
+    client = Client(
+        "dummy", retry_policy=RetryPolicy(jitter=False, **policy_kwargs)
+    ).add_endpoint(endpoint_name="dummy", account_name="dummy")
+    sent_files = []
+
+    def request(method, url, files, **kwargs):
+        sent_files.append(files["document"])
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(client.session, "request", request)
+    return client, sent_files
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("garbage") is None
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-3") == 0.0
+    assert parse_retry_after(formatdate(0, usegmt=True)) == 0.0
+
+
+def test_policy_delays():
+    policy = RetryPolicy(max_attempts=10, backoff_base=1, backoff_cap=5, jitter=False)
+    assert [policy.get_delay(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+    # The server's delay is not capped.
+    assert policy.get_delay(1, retry_after="7") == 7
+    jittery = RetryPolicy(backoff_base=1, jitter=True)
+    assert 0 <= jittery.get_delay(2) <= 2
+    ignore_header = RetryPolicy(backoff_base=1, jitter=False, respect_retry_after=False)
+    assert ignore_header.get_delay(1, retry_after="7") == 1
+
+
+def test_policy_should_retry():
+    policy = RetryPolicy(max_attempts=2)
+    assert policy.should_retry(1, 429)
+    assert policy.should_retry(1, None)
+    assert not policy.should_retry(1, 401)
+    assert not policy.should_retry(2, 429)
+    assert policy.should_retry(1, 429, retry_after="600")
+    limited = RetryPolicy(max_attempts=2, max_retry_after=60)
+    assert limited.should_retry(1, 429, retry_after="60")
+    assert not limited.should_retry(1, 429, retry_after="600")
+    assert limited.should_retry(1, 429, retry_after="garbage")
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_retry_resends_closed_file(monkeypatch, no_sleep, image_path):
+    error_response = fake_response(429, {})
+    error_response.headers["Retry-After"] = "2"
+    client, sent_files = _retry_client(
+        monkeypatch,
+        [
+            error_response,
+            fake_response(503, {}),
+            fake_response(201, dummy_custom_response()),
+        ],
+        backoff_base=0.5,
+    )
+    input_doc = client.doc_from_path(image_path)
+    result = input_doc.parse(documents.TypeCustomV1, endpoint_name="dummy")
+    assert result.document is not None
+    assert no_sleep == [2.0, 1.0]
+    assert len(sent_files) == 3
+    assert all(sent == sent_files[0] for sent in sent_files)
+    assert sent_files[0][1].startswith(b"\xff\xd8")
+    assert input_doc.input_doc.file_object.closed
+
+
+def test_retry_connection_error(monkeypatch, no_sleep, image_path):
+    client, sent_files = _retry_client(
+        monkeypatch,
+        [
+            requests.ConnectionError("reset"),
+            fake_response(201, dummy_custom_response()),
+        ],
+    )
+    client.doc_from_path(image_path).parse(
+        documents.TypeCustomV1, endpoint_name="dummy"
+    )
+    assert len(sent_files) == 2
+
+
+def test_retry_connect_timeout(monkeypatch, no_sleep, image_path):
+    client, sent_files = _retry_client(
+        monkeypatch,
+        [
+            requests.ConnectTimeout("timed out"),
+            fake_response(201, dummy_custom_response()),
+        ],
+    )
+    client.doc_from_path(image_path).parse(
+        documents.TypeCustomV1, endpoint_name="dummy"
+    )
+    assert len(sent_files) == 2
+
+
+def test_no_retry_on_read_timeout(monkeypatch, no_sleep, image_path):
+    client, sent_files = _retry_client(
+        monkeypatch,
+        [
+            requests.ReadTimeout("timed out"),
+            fake_response(201, dummy_custom_response()),
+        ],
+    )
+    with pytest.raises(requests.ReadTimeout):
+        client.doc_from_path(image_path).parse(
+            documents.TypeCustomV1, endpoint_name="dummy"
+        )
+    assert len(sent_files) == 1
+    assert not no_sleep
+
+
+def test_no_retry_on_long_retry_after(monkeypatch, no_sleep, image_path):
+    error_response = fake_response(429, {})
+    error_response.headers["Retry-After"] = "3600"
+    client, sent_files = _retry_client(
+        monkeypatch,
+        [error_response, fake_response(201, dummy_custom_response())],
+        max_retry_after=60,
+    )
+    with pytest.raises(HTTPException):
+        client.doc_from_path(image_path).parse(
+            documents.TypeCustomV1, endpoint_name="dummy"
+        )
+    assert len(sent_files) == 1
+    assert not no_sleep
+
+
+def test_retry_gives_up(monkeypatch, no_sleep, image_path):
+    client, sent_files = _retry_client(
+        monkeypatch,
+        [fake_response(502, {}), fake_response(502, {}), fake_response(502, {})],
+    )
+    input_doc = client.doc_from_path(image_path)
+    with pytest.raises(HTTPException):
+        input_doc.parse(documents.TypeCustomV1, endpoint_name="dummy")
+    assert len(sent_files) == 3
+    assert input_doc.input_doc.file_object.closed
+
+
+def test_no_retry_on_client_error(monkeypatch, no_sleep, image_path):
+    client, sent_files = _retry_client(monkeypatch, [fake_response(401, {})])
+    with pytest.raises(HTTPException):
+        client.doc_from_path(image_path).parse(
+            documents.TypeCustomV1, endpoint_name="dummy"
+        )
+    assert len(sent_files) == 1
+    assert not no_sleep
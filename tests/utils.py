@@ -1,3 +1,11 @@
+import io
+import json
+import zlib
+
+import pikepdf
+import requests
+from PIL import Image
+
 from mindee.endpoints import (
     API_KEY_ENV_NAME,
     BASE_URL_ENV_NAME,
@@ -20,3 +28,119 @@ def dummy_envvars(monkeypatch):
     Set all API keys to 'dummy'.
     """
     monkeypatch.setenv(API_KEY_ENV_NAME, "dummy")
+
+
+def dummy_custom_response(page_count: int = 1) -> dict:
+    """
+    Build a minimal, valid API response for a custom document.
+    """
+    pages = [
+        {
+            "id": page_n,
+            "orientation": {"value": 0},
+            "extras": {},
+            "prediction": {
+                "plate": {
+                    "confidence": 0.9,
+                    "values": [{"content": f"page{page_n}", "confidence": 0.9}],
+                }
+            },
+        }
+        for page_n in range(page_count)
+    ]
+    return {
+        "document": {
+            "inference": {
+                "pages": pages,
+                "prediction": {
+                    "plate": {
+                        "confidence": 0.9,
+                        "page_id": 0,
+                        "values": [{"content": "page0", "confidence": 0.9}],
+                    }
+                },
+            }
+        }
+    }
+
+
+def fake_response(status_code: int, json_data: dict) -> requests.Response:
+    """
+    Build an HTTP response, as returned by the requests library.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(json_data).encode()
+    return response
+
+
+def make_pdf(page_count: int, blank: bool = False, blank_pages=()) -> bytes:
+    """
+    Generate a PDF, each page shows its index unless ``blank`` is set,
+    or it is in ``blank_pages``.
+    """
+    pdf = pikepdf.Pdf.new()
+    font = pikepdf.Dictionary(
+        Type=pikepdf.Name.Font,
+        Subtype=pikepdf.Name.Type1,
+        BaseFont=pikepdf.Name.Helvetica,
+    )
+    for page_n in range(page_count):
+        pdf.add_blank_page()
+        if blank or page_n in blank_pages:
+            continue
+        page = pdf.pages[-1]
+        page.obj.Resources = pikepdf.Dictionary(Font=pikepdf.Dictionary(F1=font))
+        page.obj.Contents = pdf.make_stream(
+            f"BT /F1 24 Tf 72 72 Td (page {page_n}) Tj ET".encode()
+        )
+    pdf_bytes = io.BytesIO()
+    pdf.save(pdf_bytes)
+    return pdf_bytes.getvalue()
+
+
+def make_scan_pdf(page_count: int, dpi: int, shared_image: bool = False) -> bytes:
+    """
+    Generate a PDF of letter-sized pages, each covered by a grayscale image.
+
+    :param dpi: Resolution of the images
+    :param shared_image: Use the same image object on all pages,
+        instead of identical copies
+    """
+    image = Image.linear_gradient("L").resize((int(8.5 * dpi), 11 * dpi))
+    pdf = pikepdf.Pdf.new()
+    stream = None
+    for _ in range(page_count):
+        pdf.add_blank_page(page_size=(612, 792))
+        if stream is None or not shared_image:
+            stream = pdf.make_stream(
+                zlib.compress(image.tobytes(), 1),
+                Type=pikepdf.Name.XObject,
+                Subtype=pikepdf.Name.Image,
+                Width=image.width,
+                Height=image.height,
+                ColorSpace=pikepdf.Name.DeviceGray,
+                BitsPerComponent=8,
+                Filter=pikepdf.Name.FlateDecode,
+            )
+        page = pdf.pages[-1]
+        page.obj.Resources = pikepdf.Dictionary(XObject=pikepdf.Dictionary(Im0=stream))
+        page.obj.Contents = pdf.make_stream(b"q 612 0 0 792 0 0 cm /Im0 Do Q")
+    pdf_bytes = io.BytesIO()
+    pdf.save(pdf_bytes)
+    return pdf_bytes.getvalue()
+
+
+def pdf_images(pdf_bytes: bytes) -> list:
+    """Get the object ID, width and height of the image on each page."""
+    with pikepdf.open(io.BytesIO(pdf_bytes)) as pdf:
+        return [
+            (image.objgen, int(image.Width), int(image.Height))
+            for image in (page.obj.Resources.XObject.Im0 for page in pdf.pages)
+        ]
+
+
+def pdf_page_texts(pdf_bytes: bytes) -> list:
+    """Get the contents of each page of a PDF made by ``make_pdf``."""
+    with pikepdf.open(io.BytesIO(pdf_bytes)) as pdf:
+        return [page.obj.Contents.read_bytes().decode() for page in pdf.pages]